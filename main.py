@@ -1,18 +1,40 @@
 """Terminal Pokedex - A TUI for browsing Pokemon data."""
+import argparse
 import asyncio
+import json
+import sys
+import tarfile
 from pathlib import Path
 
+import httpx
+
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal
 from textual.widgets import Header, Footer
 from textual.binding import Binding
 
+from src.api.cassette import CassetteTransport, RECORD, REPLAY
+from src.api.client import PokeAPIClient
 from src.widgets.pokemon_list import PokemonListPanel
 from src.screens.detail_panel import DetailPanel
+from src.screens.metrics_screen import MetricsScreen
+from src.cache.database import CacheDatabase
+from src.cache.importer import DatasetImporter, ImportProgress
 from src.cache.manager import CacheManager
+from src.cache.metrics import CacheMetrics
+from src.cache.metadata import FilterMetadataLoader
+from src.cache.prefetch import Prefetcher, PrefetchProgress, PREFETCHED_SPRITES_KEY
+from src.cache.snapshot import export_snapshot, import_snapshot
+from src.cache.warmup import MetadataWarmup
 from src.sprites.downloader import SpriteDownloader
 from src.sprites.renderer import SpriteRenderer
-from src.constants import APP_NAME, APP_VERSION, DATA_DIR, SPRITES_DIR
+from src.utils.timing import PhaseTimer
+from src.constants import (
+    APP_NAME, APP_VERSION, DATA_DIR, SPRITES_DIR, CACHE_DB, IMPORT_WORKERS,
+    SPRITE_CACHE_SIZE, PREFETCH_CONCURRENCY, PREFETCH_SPRITE_CACHE_SIZE,
+    CACHE_EVICTION_INTERVAL, METRICS_FILE, DEGRADED_CHECK_INTERVAL,
+    CASSETTE_LATENCY, CASSETTE_BANDWIDTH,
+)
 
 
 class PokedexApp(App):
@@ -25,13 +47,33 @@ class PokedexApp(App):
         Binding("q", "quit", "Quit", priority=True),
         Binding("ctrl+c", "quit", "Quit", show=False),
         ("?", "help", "Help"),
+        ("d", "metrics", "Debug"),
     ]
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        data_dir: Path = DATA_DIR,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
-        self._cache = CacheManager()
-        self._sprite_downloader = SpriteDownloader()
+        self._data_dir = Path(data_dir)
+        self._sprites_dir = self._data_dir / SPRITES_DIR.name
+        self._metrics_file = self._data_dir / METRICS_FILE.name
+        # One client, so API and sprite downloads share warm connections
+        self._api = PokeAPIClient(transport=transport)
+        self._cache = CacheManager(
+            api_client=self._api, db=CacheDatabase(str(self._data_dir / CACHE_DB.name))
+        )
+        self._sprite_downloader: SpriteDownloader | None = None
         self._sprite_renderer = SpriteRenderer()
+        self._metadata_task: asyncio.Task | None = None
+        self._storage_task: asyncio.Task | None = None
+        self._degraded = False
+        # Per-phase selection latency, kind "selection" with one tier per phase
+        self.selection_metrics = CacheMetrics()
+        self.last_selection: dict[str, float] = {}
+        self.selections_completed = 0
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -42,59 +84,125 @@ class PokedexApp(App):
 
     async def on_mount(self) -> None:
         """Initialize the app and load Pokemon list."""
-        DATA_DIR.mkdir(exist_ok=True)
-        SPRITES_DIR.mkdir(exist_ok=True)
+        self._data_dir.mkdir(parents=True, exist_ok=True)
+        self._sprites_dir.mkdir(exist_ok=True)
 
         await self._cache.initialize()
+        # Keep every sprite a prefetch baked in, or the LRU would trim them at startup
+        prefetched = int(await self._cache.get_meta(PREFETCHED_SPRITES_KEY) or 0)
+        self._sprite_downloader = SpriteDownloader(
+            self._api,
+            max_cache_size=max(SPRITE_CACHE_SIZE, prefetched),
+            sprites_dir=self._sprites_dir,
+        )
         pokemon_list = await self._cache.get_pokemon_list()
 
+        # Precomputed index makes the filters usable before the first render
+        index = await self._cache.get_pokemon_index()
+        types = {e.id: e.types for e in index if e.types}
+        gens = {e.id: e.generation for e in index if e.generation}
+
         list_panel = self.query_one(PokemonListPanel)
+        list_panel.set_metadata_batch(types, gens)
         list_panel.load_pokemon(pokemon_list)
 
-        self._load_metadata_in_background(pokemon_list)
+        missing = [p for p in pokemon_list if p.id not in types or p.id not in gens]
+        if missing:
+            self._load_metadata_in_background(pokemon_list, missing)
+
+        self._storage_task = asyncio.create_task(self._optimize_storage())
+        self.set_interval(DEGRADED_CHECK_INTERVAL, self._update_degraded)
+
+    def _update_degraded(self) -> None:
+        """Flag degraded mode in the header while PokeAPI requests fail fast."""
+        degraded = self._cache.degraded
+        if degraded == self._degraded:
+            return
+        self._degraded = degraded
+        if degraded:
+            self.sub_title = "Degraded: PokeAPI unreachable, showing cached data"
+            self.notify("PokeAPI is unreachable; showing cached data", severity="warning", timeout=5)
+        else:
+            self.sub_title = ""
+            self.notify("PokeAPI is reachable again", timeout=3)
+
+    async def _optimize_storage(self) -> None:
+        """Re-encode rows cached by older versions, then keep the cache within budget."""
+        try:
+            report = await self._cache.optimize_storage()
+        except Exception as e:
+            self.log.error(f"Cache storage migration failed: {e}")
+            return
+        self.log.info(
+            f"Cache storage: {report['codec']}, {report['file_bytes'] / 1024:.0f} KB, "
+            f"{report['migrated']} rows migrated, {report['evicted']['rows']} evicted"
+        )
+        while True:
+            await asyncio.sleep(CACHE_EVICTION_INTERVAL)
+            try:
+                evicted = await self._cache.enforce_budget()
+            except Exception as e:
+                self.log.error(f"Cache eviction failed: {e}")
+                continue
+            if evicted["rows"]:
+                self.log.info(
+                    f"Cache eviction: {evicted['rows']} rows, {evicted['bytes'] / 1024:.0f} KB"
+                )
+
+    def _load_metadata_in_background(self, pokemon_list, missing) -> None:
+        """Load type and generation data for Pokemon missing from the index."""
+        list_panel = self.query_one(PokemonListPanel)
+        total = len(pokemon_list)
+        warmup = MetadataWarmup(
+            self._cache,
+            on_batch=list_panel.set_metadata_batch,
+            on_progress=lambda p: list_panel.update_status(
+                f"Loading metadata... {p.completed}/{p.total}"
+            ),
+        )
 
-    def _load_metadata_in_background(self, pokemon_list) -> None:
-        """Load type and generation data for all Pokemon in the background."""
         async def load_metadata():
-            list_panel = self.query_one(PokemonListPanel)
-            failed_count = 0
-            total = len(pokemon_list)
-
-            for idx, pokemon in enumerate(pokemon_list, 1):
-                try:
-                    detail = await self._cache.get_pokemon_detail(pokemon.id)
-                    species = await self._cache.get_species(pokemon.id)
-                    type_names = [t.name for t in detail.types]
-                    list_panel.set_type_data(pokemon.id, type_names)
-                    list_panel.set_gen_data(pokemon.id, species.generation)
-
-                    # Update status every 50 Pokemon
-                    if idx % 50 == 0:
-                        list_panel.update_status(f"Loading metadata... {idx}/{total}")
-                except Exception as e:
-                    failed_count += 1
-                    self.log.warning(f"Failed to load metadata for {pokemon.name} (#{pokemon.id}): {e}")
-                    # Continue loading others instead of stopping
-
-            if failed_count > 0:
-                self.log.error(f"Failed to load metadata for {failed_count}/{total} Pokemon")
+            # Bulk type/generation resources cover most Pokemon in a few requests
+            metadata = await FilterMetadataLoader(self._cache).load()
+            list_panel.set_metadata_batch(metadata.types, metadata.generations)
+            await self._cache.save_index_metadata(metadata.types, metadata.generations)
+            if metadata.failed:
+                self.log.warning(f"Bulk metadata incomplete: {', '.join(metadata.failed)}")
+
+            # Fall back to per-Pokemon lookups for anything still missing (mostly forms)
+            remaining = [
+                p for p in missing
+                if p.id not in metadata.types or p.id not in metadata.generations
+            ]
+            result = await warmup.run(remaining)
+
+            if result.failed > 0:
+                self.log.error(f"Failed to load metadata for {result.failed}/{len(remaining)} Pokemon")
+            self.log.info(
+                f"Metadata warm-up: {result.completed} Pokemon in {result.elapsed:.1f}s "
+                f"({result.items_per_second:.1f} items/s)"
+            )
 
             list_panel.update_status(f"{total} Pokemon")
 
-        asyncio.create_task(load_metadata())
+        self._metadata_task = asyncio.create_task(load_metadata())
 
     async def on_pokemon_list_panel_pokemon_selected(
         self, event: PokemonListPanel.PokemonSelected
     ) -> None:
         """Handle Pokemon selection from the list."""
         detail_panel = self.query_one(DetailPanel)
+        timer = PhaseTimer()
+        outcome = "ok"
 
         try:
             # Phase 1: Fetch core Pokemon data
-            detail = await self._cache.get_pokemon_detail(event.pokemon_id)
+            with timer.phase("detail"):
+                detail = await self._cache.get_pokemon_detail(event.pokemon_id)
 
             # Fetch species using the species_id (handles form variants correctly)
-            species = await self._cache.get_species(detail.species_id)
+            with timer.phase("species"):
+                species = await self._cache.get_species(detail.species_id)
 
             # Download and render all sprite variants in parallel
             sprite_variants = {}
@@ -106,28 +214,31 @@ class PokedexApp(App):
                     "back_shiny": detail.sprites.back_shiny,
                 }
 
-                # Download all sprites in parallel
+                # Download all sprites in parallel (cached ones return at once,
+                # revalidating in the background once they are old)
                 download_tasks = []
                 for variant_name, url in sprite_mapping.items():
                     if url:
-                        sprite_path = SPRITES_DIR / f"{event.pokemon_id}_{variant_name}.png"
-                        if not sprite_path.exists():
-                            download_tasks.append(
-                                self._sprite_downloader.download_sprite(url, sprite_path)
-                            )
+                        sprite_path = self._sprites_dir / f"{event.pokemon_id}_{variant_name}.png"
+                        download_tasks.append(
+                            self._sprite_downloader.download_sprite(url, sprite_path)
+                        )
 
                 if download_tasks:
-                    await asyncio.gather(*download_tasks, return_exceptions=True)
+                    with timer.phase("sprite_download"):
+                        await asyncio.gather(*download_tasks, return_exceptions=True)
 
                 # Render all sprites (rendering is fast, can be sequential)
-                for variant_name, url in sprite_mapping.items():
-                    if url:
-                        sprite_path = SPRITES_DIR / f"{event.pokemon_id}_{variant_name}.png"
-                        if sprite_path.exists():
-                            pixels = self._sprite_renderer.render(sprite_path)
-                            sprite_variants[variant_name] = pixels
+                with timer.phase("sprite_render"):
+                    for variant_name, url in sprite_mapping.items():
+                        if url:
+                            sprite_path = self._sprites_dir / f"{event.pokemon_id}_{variant_name}.png"
+                            if sprite_path.exists():
+                                pixels = self._sprite_renderer.render(sprite_path)
+                                sprite_variants[variant_name] = pixels
 
-            detail_panel.load_pokemon(detail, species, sprite_variants)
+            with timer.phase("load_pokemon"):
+                detail_panel.load_pokemon(detail, species, sprite_variants)
 
             # Phase 2: Fetch all supplementary data in parallel
             # Build task list for evolution, abilities, moves, and types
@@ -158,7 +269,8 @@ class PokedexApp(App):
                 task_labels.append(("type", poke_type.name))
 
             # Execute all tasks in parallel
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            with timer.phase("supplementary"):
+                results = await asyncio.gather(*tasks, return_exceptions=True)
 
             # Process results
             evolution_chain = None
@@ -204,23 +316,66 @@ class PokedexApp(App):
 
             # Load data into detail panel
             if evolution_chain:
-                detail_panel.load_evolution(evolution_chain, event.pokemon_name)
+                with timer.phase("load_evolution"):
+                    detail_panel.load_evolution(evolution_chain, event.pokemon_name)
 
             if ability_details:
-                detail_panel.load_abilities(detail, ability_details)
+                with timer.phase("load_abilities"):
+                    detail_panel.load_abilities(detail, ability_details)
 
             if move_details:
-                detail_panel.load_move_details(detail, move_details)
+                with timer.phase("load_move_details"):
+                    detail_panel.load_move_details(detail, move_details)
 
             if type_data:
-                detail_panel.load_type_matchups(detail, type_data)
+                with timer.phase("load_type_matchups"):
+                    detail_panel.load_type_matchups(detail, type_data)
 
         except Exception as e:
+            outcome = "error"
             self.notify(f"Error loading Pokemon: {e}", severity="error", timeout=5)
+        finally:
+            self._record_selection(timer, outcome)
+
+    def _record_selection(self, timer: PhaseTimer, outcome: str) -> None:
+        """Keep one selection's phase timings for the debug screen and benchmarks."""
+        for name, seconds in timer.phases.items():
+            self.selection_metrics.observe("selection", name, outcome, seconds)
+        self.selection_metrics.observe("selection", "total", outcome, timer.total)
+        self.last_selection = {**timer.phases, "total": timer.total}
+        self.selections_completed += 1
+
+    def collect_metrics(self) -> dict:
+        """Cache and sprite counters and latencies, as shown on the debug screen."""
+        return {
+            "cache": self._cache.get_metrics(),
+            "sprites": self._sprite_downloader.get_stats() if self._sprite_downloader else {},
+            "selection": self.selection_metrics.snapshot(),
+        }
+
+    def _dump_metrics(self) -> None:
+        """Write the session's metrics to the data dir for sizing caches and TTLs."""
+        try:
+            self._metrics_file.parent.mkdir(parents=True, exist_ok=True)
+            self._metrics_file.write_text(json.dumps(self.collect_metrics(), indent=2))
+        except OSError as e:
+            self.log.error(f"Could not write metrics to {self._metrics_file}: {e}")
 
     async def on_unmount(self) -> None:
         """Clean up resources."""
+        for task in (self._metadata_task, self._storage_task):
+            if task and not task.done():
+                task.cancel()
+        self._dump_metrics()
+        if self._sprite_downloader:
+            await self._sprite_downloader.close()
         await self._cache.close()
+        await self._api.close()
+
+    def action_metrics(self) -> None:
+        """Show live cache metrics."""
+        if not isinstance(self.screen, MetricsScreen):
+            self.push_screen(MetricsScreen(self.collect_metrics))
 
     def action_help(self) -> None:
         """Show help information."""
@@ -231,11 +386,165 @@ class PokedexApp(App):
         )
 
 
-def main():
-    """Run the Pokedex app."""
-    app = PokedexApp()
+async def import_dump(path: Path, workers: int) -> int:
+    """Load a local PokeAPI data dump into the cache; return an exit code."""
+    DATA_DIR.mkdir(exist_ok=True)
+
+    def report(progress: ImportProgress) -> None:
+        print(
+            f"\r{progress.resource}: {progress.imported}/{progress.total} "
+            f"({progress.failed} failed, {progress.rows_per_second:.0f} rows/s)",
+            end="", flush=True,
+        )
+
+    db = CacheDatabase()
+    await db.initialize()
+    try:
+        results = await DatasetImporter(db, on_progress=report, workers=workers).run(path)
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        await db.close()
+    print()
+    for result in results:
+        print(
+            f"{result.resource:>16}: {result.imported} rows in {result.elapsed:.2f}s"
+            + (f", {result.failed} failed" if result.failed else "")
+        )
+    return 0 if results else 1
+
+
+async def prefetch(
+    concurrency: int, sprites: bool, transport: httpx.AsyncBaseTransport | None = None
+) -> int:
+    """Fill the cache for the whole Pokedex; return an exit code."""
+    DATA_DIR.mkdir(exist_ok=True)
+
+    def report(progress: PrefetchProgress) -> None:
+        print(
+            f"\r{progress.resource}: {progress.completed + progress.failed}/{progress.total} "
+            f"({progress.failed} failed, {progress.items_per_second:.1f}/s)",
+            end="", flush=True,
+        )
+
+    async with PokeAPIClient(transport=transport) as api:
+        cache = CacheManager(api_client=api)
+        downloader = SpriteDownloader(api, max_cache_size=PREFETCH_SPRITE_CACHE_SIZE) if sprites else None
+        try:
+            results = await Prefetcher(
+                cache, downloader, on_progress=report, concurrency=concurrency
+            ).run()
+        finally:
+            if downloader:
+                await downloader.close()
+            await cache.close()
+    print()
+    for result in results:
+        print(
+            f"{result.resource:>16}: {result.completed}/{result.total} in {result.elapsed:.1f}s "
+            f"({result.items_per_second:.1f}/s), {result.failed} failed"
+        )
+    return 1 if any(result.failed for result in results) else 0
+
+
+async def snapshot(action: str, path: Path) -> int:
+    """Export the cache to a snapshot file, or import one; return an exit code."""
+    DATA_DIR.mkdir(exist_ok=True)
+    db = CacheDatabase()
+    # Large limit so opening the sprite directory never evicts anything
+    sprites = SpriteDownloader(max_cache_size=PREFETCH_SPRITE_CACHE_SIZE)
+    try:
+        if action == "export":
+            await db.initialize()
+            manifest = await export_snapshot(db, sprites, path)
+        else:
+            manifest = await import_snapshot(path, db, sprites)
+    except (OSError, ValueError, tarfile.TarError) as e:
+        print(f"Snapshot {action} failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        await sprites.close()
+        await db.close()
+    total = sum(entry["size"] for entry in manifest["files"].values())
+    print(
+        f"{'Exported' if action == 'export' else 'Imported'} {path}: "
+        f"{len(manifest['files'])} files, {manifest['sprites']} sprites, {total / 1024 / 1024:.1f} MB"
+    )
+    return 0
+
+
+def cassette_transport(args: argparse.Namespace) -> CassetteTransport | None:
+    """The record/replay transport asked for on the command line, if any."""
+    if args.record:
+        return CassetteTransport(args.record, RECORD)
+    if args.replay:
+        return CassetteTransport(
+            args.replay, REPLAY, latency=args.latency / 1000, bandwidth=args.bandwidth * 1000,
+        )
+    return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the Pokedex app, or one of the cache maintenance commands."""
+    parser = argparse.ArgumentParser(description=f"{APP_NAME} v{APP_VERSION}")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record", type=Path, metavar="CASSETTE", help="save every API response to a cassette file",
+    )
+    cassette.add_argument(
+        "--replay", type=Path, metavar="CASSETTE", help="serve API responses from a cassette, offline",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=CASSETTE_LATENCY * 1000, metavar="MS",
+        help=f"synthetic latency per replayed response (default {CASSETTE_LATENCY * 1000:.0f})",
+    )
+    parser.add_argument(
+        "--bandwidth", type=float, default=CASSETTE_BANDWIDTH / 1000, metavar="KB/S",
+        help=f"replay bandwidth, 0 for unlimited (default {CASSETTE_BANDWIDTH / 1000:.0f})",
+    )
+    commands = parser.add_subparsers(dest="command")
+    import_parser = commands.add_parser(
+        "import", help="load a local PokeAPI data dump (api-data layout) into the cache"
+    )
+    import_parser.add_argument("path", type=Path, help="dump checkout, or its api/v2 directory")
+    import_parser.add_argument(
+        "--workers", type=int, default=IMPORT_WORKERS,
+        help=f"parser processes (default {IMPORT_WORKERS}; 1 parses in-process)",
+    )
+    prefetch_parser = commands.add_parser(
+        "prefetch", help="fill the cache for every Pokemon, then exit (resumes if interrupted)"
+    )
+    prefetch_parser.add_argument(
+        "--concurrency", type=int, default=PREFETCH_CONCURRENCY,
+        help=f"requests in flight (default {PREFETCH_CONCURRENCY})",
+    )
+    prefetch_parser.add_argument(
+        "--no-sprites", dest="sprites", action="store_false", help="skip default sprites",
+    )
+    snapshot_parser = commands.add_parser(
+        "snapshot", help="export or import a portable cache snapshot (database and sprites)"
+    )
+    snapshot_parser.add_argument("action", choices=["export", "import"])
+    snapshot_parser.add_argument("path", type=Path, help="snapshot file")
+    args = parser.parse_args(argv)
+    try:
+        transport = cassette_transport(args)
+    except (OSError, ValueError) as e:
+        print(f"Cannot open cassette: {e}", file=sys.stderr)
+        return 1
+
+    if args.command == "import":
+        return asyncio.run(import_dump(args.path, args.workers))
+    if args.command == "prefetch":
+        return asyncio.run(prefetch(args.concurrency, args.sprites, transport))
+    if args.command == "snapshot":
+        return asyncio.run(snapshot(args.action, args.path))
+
+    app = PokedexApp(transport=transport)
     app.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Per-host circuit breaker for outgoing requests."""
+import time
+
+from src.constants import HTTP_BREAKER_FAILURES, HTTP_BREAKER_RESET_TIMEOUT
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"{host} is unavailable; requests fail fast for {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Stops requests to a host after repeated failures.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    check() raises CircuitOpenError without touching the network. Once
+    `reset_timeout` has passed one trial request is let through (half
+    open): a success closes the circuit, a failure opens it again. If the
+    trial never reports back, another is allowed after `reset_timeout`.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = HTTP_BREAKER_FAILURES,
+        reset_timeout: float = HTTP_BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        self.host = host
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self.opened = 0
+        self.rejected = 0
+
+    def check(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent now."""
+        if self.state == CLOSED:
+            return
+        now = time.monotonic()
+        retry_in = self._opened_at + self._reset_timeout - now
+        if retry_in <= 0:
+            # Let one trial request through and re-arm the timeout
+            self.state = HALF_OPEN
+            self._opened_at = now
+            return
+        self.rejected += 1
+        raise CircuitOpenError(self.host, retry_in)
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self._failures >= self._failure_threshold
+        ):
+            self.state = OPEN
+            self._opened_at = time.monotonic()
+            self.opened += 1
+
+    def get_stats(self) -> dict:
+        """Get the circuit state and how often it opened or rejected a request."""
+        return {
+            "state": self.state,
+            "failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
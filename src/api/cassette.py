@@ -0,0 +1,132 @@
+"""Record/replay transport for running against recorded PokeAPI responses.
+
+In record mode every GET goes to the real network and its response is
+kept; the cassette file is written when the transport is closed (the
+client closes it). In replay mode responses come only from the file,
+after a synthetic delay of `latency` plus the body size over `bandwidth`,
+so cold- and warm-cache runs are repeatable and need no network.
+"""
+import asyncio
+import base64
+import json
+import logging
+import os
+from pathlib import Path
+
+import httpx
+
+from src.constants import CASSETTE_FORMAT_VERSION
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Dropped when recording: the stored body is already decoded and re-framed on replay
+_HOP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+
+class CassetteMissError(LookupError):
+    """A replayed request that was never recorded."""
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """httpx transport that records responses to a file, or replays them.
+
+    Replay answers a conditional GET whose If-None-Match matches the
+    recorded ETag with a 304, like the live API. Requests missing from the
+    cassette raise CassetteMissError rather than going to the network.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        mode: str = REPLAY,
+        latency: float = 0.0,
+        bandwidth: float = 0.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency  # Seconds added to every replayed response
+        self.bandwidth = bandwidth  # Bytes per second for replayed bodies; 0 is unlimited
+        self._inner = transport
+        self._interactions: dict[str, dict] = {}
+        self._dirty = False
+        self.replayed = 0
+        self.recorded = 0
+        if mode == REPLAY or self.path.exists():
+            self._load()
+        if mode == RECORD and self._inner is None:
+            self._inner = httpx.AsyncHTTPTransport()
+
+    def _load(self) -> None:
+        data = json.loads(self.path.read_text())
+        if data.get("version") != CASSETTE_FORMAT_VERSION:
+            raise ValueError(
+                f"Cassette format {data.get('version')} is not supported "
+                f"(expected {CASSETTE_FORMAT_VERSION})"
+            )
+        self._interactions = {entry["url"]: entry for entry in data["interactions"]}
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == RECORD:
+            return await self._record(request)
+        return await self._replay(request)
+
+    async def _record(self, request: httpx.Request) -> httpx.Response:
+        response = await self._inner.handle_async_request(request)
+        body = await response.aread()
+        await response.aclose()
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _HOP_HEADERS]
+        # A 304 only means our copy was current; keep the full response recorded earlier
+        if request.method == "GET" and response.status_code != 304:
+            self._interactions[str(request.url)] = {
+                "url": str(request.url),
+                "status": response.status_code,
+                "headers": headers,
+                "body": base64.b64encode(body).decode("ascii"),
+            }
+            self._dirty = True
+            self.recorded += 1
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def _replay(self, request: httpx.Request) -> httpx.Response:
+        entry = self._interactions.get(str(request.url))
+        if entry is None or request.method != "GET":
+            raise CassetteMissError(f"Not in cassette {self.path.name}: {request.method} {request.url}")
+        headers = httpx.Headers(entry["headers"])
+        etag = headers.get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        else:
+            status, body = entry["status"], base64.b64decode(entry["body"])
+        delay = self.latency + (len(body) / self.bandwidth if self.bandwidth else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        self.replayed += 1
+        return httpx.Response(status, headers=headers, content=body, request=request)
+
+    def save(self) -> None:
+        """Write recorded responses to the cassette file, replacing it atomically."""
+        if not self._dirty:
+            return
+        partial = self.path.with_name(self.path.name + ".partial")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial.write_text(json.dumps({
+            "version": CASSETTE_FORMAT_VERSION,
+            "interactions": sorted(self._interactions.values(), key=lambda e: e["url"]),
+        }))
+        os.replace(partial, self.path)
+        self._dirty = False
+        logger.info(f"Saved {len(self._interactions)} responses to cassette {self.path}")
+
+    async def aclose(self) -> None:
+        if self.mode == RECORD:
+            self.save()
+            await self._inner.aclose()
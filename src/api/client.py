@@ -1,40 +1,268 @@
 """Async HTTP client for PokeAPI."""
-import httpx
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from typing import Any
 
+import httpx
+
+try:
+    import h2
+except ImportError:  # Optional dependency; without it requests use HTTP/1.1
+    h2 = None
+
+from src.api.breaker import CircuitBreaker, CLOSED
+from src.api.limiter import AdaptiveLimiter
+from src.constants import (
+    HTTP_MAX_RETRIES, HTTP_RETRY_BASE_DELAY, HTTP_RETRY_MAX_DELAY,
+    HTTP_CONCURRENCY_INITIAL, HTTP_CONCURRENCY_MAX, HTTP_HOST_CONNECTIONS, HTTP2_ENABLED,
+)
+
+logger = logging.getLogger(__name__)
+
+# Worth another attempt: throttling and transient server-side failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Responses that mean the server wants fewer requests from us
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+@dataclass(slots=True)
+class ConditionalResponse:
+    """Result of a conditional GET.
+
+    `not_modified` is True when the server answered 304, in which case
+    `body` is None and the cached copy is still current.
+    """
+    body: Any
+    etag: str | None
+    last_modified: str | None
+    not_modified: bool = False
+
+
+def _pool_limits(connections: int) -> httpx.Limits:
+    return httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+
+
+@dataclass(slots=True)
+class _Host:
+    """Concurrency limit and circuit breaker for one host."""
+    limiter: AdaptiveLimiter
+    breaker: CircuitBreaker
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
 
 class PokeAPIClient:
-    """Manages httpx.AsyncClient for PokeAPI requests."""
+    """Manages httpx.AsyncClient for PokeAPI and sprite requests.
+
+    One client is meant to be shared by everything that downloads, so all
+    requests reuse the same warm connections. Each host in
+    HTTP_HOST_CONNECTIONS gets its own connection pool, and HTTP/2 is used
+    when the optional h2 package is installed. Use it as an async context
+    manager, or call close(), to release the connections.
+
+    Requests to each host run under their own AdaptiveLimiter, which
+    shrinks the number in flight when that host throttles and grows it
+    back on success. 429s,
+    transient 5xx responses and connection errors are retried up to
+    `max_retries` times, waiting for the server's Retry-After if given and
+    otherwise an exponential backoff with full jitter.
 
-    def __init__(self) -> None:
+    Each host has a CircuitBreaker: once it has failed repeatedly, requests
+    to it raise CircuitOpenError at once instead of waiting out timeouts.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        max_retries: int = HTTP_MAX_RETRIES,
+        retry_base_delay: float = HTTP_RETRY_BASE_DELAY,
+        retry_max_delay: float = HTTP_RETRY_MAX_DELAY,
+    ) -> None:
         self._client: httpx.AsyncClient | None = None
+        self._transport = transport  # e.g. httpx.MockTransport in tests; replaces the pools
+        self._http2 = HTTP2_ENABLED and h2 is not None
+        self._max_retries = max_retries
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        self._hosts: dict[str, _Host] = {}
+        self.requests = 0
+        self.retries = 0
+        self.failed = 0
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
+            mounts = None
+            if self._transport is None:
+                mounts = {
+                    f"https://{host}": httpx.AsyncHTTPTransport(
+                        http2=self._http2, limits=_pool_limits(connections)
+                    )
+                    for host, connections in HTTP_HOST_CONNECTIONS.items()
+                }
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(30.0, connect=10.0),
                 follow_redirects=True,
-                limits=httpx.Limits(
-                    max_connections=10,
-                    max_keepalive_connections=5,
-                ),
+                http2=self._http2,
+                # Each host's limiter decides how many requests run; its pool only caps it
+                limits=_pool_limits(HTTP_CONCURRENCY_MAX),
+                transport=self._transport,
+                mounts=mounts,
             )
         return self._client
 
+    def _host(self, url: str) -> _Host:
+        host = httpx.URL(url).host
+        state = self._hosts.get(host)
+        if state is None:
+            connections = HTTP_HOST_CONNECTIONS.get(host, HTTP_CONCURRENCY_MAX)
+            state = self._hosts[host] = _Host(
+                AdaptiveLimiter(initial=min(HTTP_CONCURRENCY_INITIAL, connections), maximum=connections),
+                CircuitBreaker(host),
+            )
+        return state
+
+    async def _send(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        """GET `url` within the concurrency limit, retrying transient failures.
+
+        Returns the last response, even an error one, once retries run out.
+        """
+        client = await self._get_client()
+        host = self._host(url)
+        breaker, limiter = host.breaker, host.limiter
+        attempt = 0
+        while True:
+            response = None
+            breaker.check()
+            async with limiter:
+                self.requests += 1
+                try:
+                    response = await client.get(url, headers=headers)
+                except httpx.TransportError as e:
+                    breaker.record_failure()
+                    if attempt >= self._max_retries:
+                        self.failed += 1
+                        raise
+                    error = f"{type(e).__name__}: {e}"
+                else:
+                    if response.status_code >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                    if response.status_code in THROTTLE_STATUSES:
+                        limiter.on_throttle()
+                    elif response.status_code < 500:
+                        limiter.on_success()
+                    if response.status_code not in RETRY_STATUSES:
+                        return response
+                    if attempt >= self._max_retries:
+                        self.failed += 1
+                        return response
+                    error = f"HTTP {response.status_code}"
+
+            delay = self._retry_delay(attempt, response)
+            attempt += 1
+            self.retries += 1
+            logger.info(f"Retrying {url} in {delay:.2f}s after {error} (attempt {attempt})")
+            await asyncio.sleep(delay)
+
+    def is_degraded(self) -> bool:
+        """Whether any host's circuit is open, so its requests are failing fast."""
+        return any(host.breaker.state != CLOSED for host in self._hosts.values())
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self._retry_max_delay)
+        # Full jitter keeps clients that failed together from retrying together
+        return random.uniform(0, min(self._retry_max_delay, self._retry_base_delay * 2 ** attempt))
+
     async def get_json(self, url: str) -> dict[str, Any]:
         """Fetch JSON from a URL. Raises on HTTP errors."""
-        client = await self._get_client()
-        response = await client.get(url)
+        response = await self._send(url)
         response.raise_for_status()
         return response.json()
 
     async def get_bytes(self, url: str) -> bytes:
         """Fetch raw bytes (for sprite images)."""
-        client = await self._get_client()
-        response = await client.get(url)
+        response = await self._send(url)
         response.raise_for_status()
         return response.content
 
+    async def _get_conditional(
+        self, url: str, etag: str | None, last_modified: str | None
+    ) -> httpx.Response:
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = await self._send(url, headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    async def get_json_conditional(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> ConditionalResponse:
+        """Fetch JSON unless it still matches the given validators."""
+        response = await self._get_conditional(url, etag, last_modified)
+        if response.status_code == 304:
+            return ConditionalResponse(None, etag, last_modified, not_modified=True)
+        return ConditionalResponse(
+            response.json(),
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+
+    async def get_bytes_conditional(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> ConditionalResponse:
+        """Fetch raw bytes unless they still match the given validators."""
+        response = await self._get_conditional(url, etag, last_modified)
+        if response.status_code == 304:
+            return ConditionalResponse(None, etag, last_modified, not_modified=True)
+        return ConditionalResponse(
+            response.content,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+
+    def get_stats(self) -> dict:
+        """Get request, retry and failure counters, and each host's limit and circuit."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "failed": self.failed,
+            "http2": self._http2,
+            "hosts": {
+                name: {**host.limiter.get_stats(), **host.breaker.get_stats()}
+                for name, host in self._hosts.items()
+            },
+        }
+
+    async def __aenter__(self) -> "PokeAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def close(self) -> None:
         """Close the underlying httpx client."""
         if self._client and not self._client.is_closed:
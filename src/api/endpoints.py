@@ -32,3 +32,7 @@ def move_url(id_or_name: int | str) -> str:
 
 def type_url(id_or_name: int | str) -> str:
     return f"{POKEAPI_BASE_URL}/type/{id_or_name}"
+
+
+def generation_url(id_or_name: int | str) -> str:
+    return f"{POKEAPI_BASE_URL}/generation/{id_or_name}"
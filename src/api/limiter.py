@@ -0,0 +1,83 @@
+"""Adaptive concurrency limit for outgoing requests."""
+import asyncio
+import time
+
+from src.constants import (
+    HTTP_CONCURRENCY_INITIAL, HTTP_CONCURRENCY_MIN, HTTP_CONCURRENCY_MAX,
+    HTTP_CONCURRENCY_BACKOFF, HTTP_THROTTLE_COOLDOWN,
+)
+
+
+class AdaptiveLimiter:
+    """Caps requests in flight with an AIMD (additive increase, multiplicative decrease) limit.
+
+    Each success grows the limit by 1/limit, so it climbs by about one per
+    round of requests; each throttle multiplies it by `backoff`. A burst of
+    429s from requests that were already in flight counts once, since
+    throttles within `cooldown` of the last decrease are ignored.
+    """
+
+    def __init__(
+        self,
+        initial: int = HTTP_CONCURRENCY_INITIAL,
+        minimum: int = HTTP_CONCURRENCY_MIN,
+        maximum: int = HTTP_CONCURRENCY_MAX,
+        backoff: float = HTTP_CONCURRENCY_BACKOFF,
+        cooldown: float = HTTP_THROTTLE_COOLDOWN,
+    ) -> None:
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._backoff = backoff
+        self._cooldown = cooldown
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+        self.throttled = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._changed:
+            self._in_flight -= 1
+            self._changed.notify_all()
+
+    def on_success(self) -> None:
+        """Additive increase, up to the maximum.
+
+        Called while the request still holds its slot; waiters re-check
+        the new limit when it is released.
+        """
+        self._limit = min(self._maximum, self._limit + 1 / self._limit)
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease, at most once per cooldown."""
+        self.throttled += 1
+        now = time.monotonic()
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(self._minimum, self._limit * self._backoff)
+        self.decreases += 1
+
+    def get_stats(self) -> dict:
+        """Get the current limit, requests in flight and throttle counters."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "throttled": self.throttled,
+            "decreases": self.decreases,
+        }
@@ -3,7 +3,7 @@ import logging
 import re
 from typing import Any
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from src.models.pokemon import (
     PokemonSummary, PokemonDetail, PokemonStat,
@@ -14,7 +14,8 @@ from src.models.species import PokemonSpecies
 from src.models.evolution import EvolutionChain, EvolutionNode, EvolutionTrigger
 from src.models.ability import Ability
 from src.models.move import Move
-from src.models.type_info import TypeEffectiveness
+from src.models.type_info import TypeEffectiveness, TypeMember
+from src.models.generation import Generation
 from src.models.form import PokemonForm, PokemonFormSprites
 from src.schemas import pokemon as pokemon_schema
 from src.schemas import species as species_schema
@@ -23,6 +24,16 @@ from src.schemas import move as move_schema
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; each adapter compiles its schema's validator
+_POKEMON_DETAIL_ADAPTER = TypeAdapter(pokemon_schema.PokemonDetailSchema)
+_SPECIES_ADAPTER = TypeAdapter(species_schema.SpeciesSchema)
+_ABILITY_ADAPTER = TypeAdapter(ability_schema.AbilitySchema)
+_MOVE_ADAPTER = TypeAdapter(move_schema.MoveSchema)
+
+
+class SchemaError(ValueError):
+    """A response that does not match its schema."""
+
 
 def parse_id_from_url(url: str) -> int:
     """Extract numeric ID from a PokeAPI resource URL."""
@@ -43,15 +54,40 @@ def parse_pokemon_list(data: dict[str, Any]) -> list[PokemonSummary]:
     return results
 
 
-def parse_pokemon_detail(data: dict[str, Any]) -> PokemonDetail:
-    """Parse /pokemon/{id} response with schema validation."""
-    # Validate response schema
+def parse_pokemon_detail(data: dict[str, Any], validate: bool = True) -> PokemonDetail:
+    """Parse /pokemon/{id} response with schema validation.
+
+    `validate=False` skips validation for trusted, already-validated cache rows.
+    """
+    if not validate:
+        return _pokemon_detail_from_dict(data)
     try:
-        validated = pokemon_schema.PokemonDetailSchema(**data)
+        _POKEMON_DETAIL_ADAPTER.validate_python(data)
     except ValidationError as e:
         logger.error(f"Pokemon detail validation failed: {e}")
-        raise ValueError(f"Invalid Pokemon detail response: {e.error_count()} errors") from e
+        raise SchemaError(f"Invalid Pokemon detail response: {e.error_count()} errors") from e
+    return _pokemon_detail_from_dict(data)
+
 
+def _build_sprites(sprite_data: dict[str, Any], other: dict[str, Any] | None) -> PokemonSprites:
+    """Pick sprite URLs, preferring official artwork for the front sprites."""
+    # Use official artwork for higher quality sprites (475x475 vs 96x96)
+    official_artwork = (other or {}).get("official-artwork") or {}
+
+    return PokemonSprites(
+        front_default=official_artwork.get("front_default") or sprite_data.get("front_default"),
+        front_shiny=official_artwork.get("front_shiny") or sprite_data.get("front_shiny"),
+        front_female=sprite_data.get("front_female"),  # No official artwork for female variants
+        front_shiny_female=sprite_data.get("front_shiny_female"),
+        back_default=sprite_data.get("back_default"),  # No official artwork for back sprites
+        back_shiny=sprite_data.get("back_shiny"),
+        back_female=sprite_data.get("back_female"),
+        back_shiny_female=sprite_data.get("back_shiny_female"),
+    )
+
+
+def _pokemon_detail_from_dict(data: dict[str, Any]) -> PokemonDetail:
+    """Build a PokemonDetail from a raw payload (validated or trusted)."""
     stats = [
         PokemonStat(
             name=s["stat"]["name"],
@@ -93,20 +129,7 @@ def parse_pokemon_detail(data: dict[str, Any]) -> PokemonDetail:
             ))
 
     sprite_data = data.get("sprites", {})
-
-    # Use official artwork for higher quality sprites (475x475 vs 96x96)
-    official_artwork = sprite_data.get("other", {}).get("official-artwork", {})
-
-    sprites = PokemonSprites(
-        front_default=official_artwork.get("front_default") or sprite_data.get("front_default"),
-        front_shiny=official_artwork.get("front_shiny") or sprite_data.get("front_shiny"),
-        front_female=sprite_data.get("front_female"),  # No official artwork for female variants
-        front_shiny_female=sprite_data.get("front_shiny_female"),
-        back_default=sprite_data.get("back_default"),  # No official artwork for back sprites
-        back_shiny=sprite_data.get("back_shiny"),
-        back_female=sprite_data.get("back_female"),
-        back_shiny_female=sprite_data.get("back_shiny_female"),
-    )
+    sprites = _build_sprites(sprite_data, sprite_data.get("other"))
 
     sprite_url = sprites.front_default
 
@@ -162,15 +185,20 @@ def _clean_flavor_text(text: str) -> str:
     return text
 
 
-def parse_pokemon_species(data: dict[str, Any]) -> PokemonSpecies:
+def parse_pokemon_species(data: dict[str, Any], validate: bool = True) -> PokemonSpecies:
     """Parse /pokemon-species/{id} response with schema validation."""
-    # Validate response schema
+    if not validate:
+        return _pokemon_species_from_dict(data)
     try:
-        validated = species_schema.SpeciesSchema(**data)
+        _SPECIES_ADAPTER.validate_python(data)
     except ValidationError as e:
         logger.error(f"Pokemon species validation failed: {e}")
-        raise ValueError(f"Invalid species response: {e.error_count()} errors") from e
+        raise SchemaError(f"Invalid species response: {e.error_count()} errors") from e
+    return _pokemon_species_from_dict(data)
+
 
+def _pokemon_species_from_dict(data: dict[str, Any]) -> PokemonSpecies:
+    """Build a PokemonSpecies from a raw payload (validated or trusted)."""
     flavor_text = ""
     for entry in reversed(data.get("flavor_text_entries", [])):
         if entry["language"]["name"] == "en":
@@ -254,15 +282,20 @@ def parse_evolution_chain(data: dict[str, Any]) -> EvolutionChain:
     )
 
 
-def parse_ability(data: dict[str, Any]) -> Ability:
+def parse_ability(data: dict[str, Any], validate: bool = True) -> Ability:
     """Parse /ability/{id} response with schema validation."""
-    # Validate response schema
+    if not validate:
+        return _ability_from_dict(data)
     try:
-        validated = ability_schema.AbilitySchema(**data)
+        _ABILITY_ADAPTER.validate_python(data)
     except ValidationError as e:
         logger.error(f"Ability validation failed: {e}")
-        raise ValueError(f"Invalid ability response: {e.error_count()} errors") from e
+        raise SchemaError(f"Invalid ability response: {e.error_count()} errors") from e
+    return _ability_from_dict(data)
+
 
+def _ability_from_dict(data: dict[str, Any]) -> Ability:
+    """Build an Ability from a raw payload (validated or trusted)."""
     effect = ""
     short_effect = ""
     for entry in data.get("effect_entries", []):
@@ -286,15 +319,20 @@ def parse_ability(data: dict[str, Any]) -> Ability:
     )
 
 
-def parse_move(data: dict[str, Any]) -> Move:
+def parse_move(data: dict[str, Any], validate: bool = True) -> Move:
     """Parse /move/{id} response with schema validation."""
-    # Validate response schema
+    if not validate:
+        return _move_from_dict(data)
     try:
-        validated = move_schema.MoveSchema(**data)
+        _MOVE_ADAPTER.validate_python(data)
     except ValidationError as e:
         logger.error(f"Move validation failed: {e}")
-        raise ValueError(f"Invalid move response: {e.error_count()} errors") from e
+        raise SchemaError(f"Invalid move response: {e.error_count()} errors") from e
+    return _move_from_dict(data)
 
+
+def _move_from_dict(data: dict[str, Any]) -> Move:
+    """Build a Move from a raw payload (validated or trusted)."""
     effect = ""
     short_effect = ""
     for entry in data.get("effect_entries", []):
@@ -334,6 +372,25 @@ def parse_type_effectiveness(data: dict[str, Any]) -> TypeEffectiveness:
         double_damage_from=[t["name"] for t in damage_relations.get("double_damage_from", [])],
         half_damage_from=[t["name"] for t in damage_relations.get("half_damage_from", [])],
         no_damage_from=[t["name"] for t in damage_relations.get("no_damage_from", [])],
+        pokemon=[
+            TypeMember(
+                pokemon_id=parse_id_from_url(p["pokemon"]["url"]),
+                slot=p.get("slot", 1),
+            )
+            for p in data.get("pokemon", [])
+        ],
+    )
+
+
+def parse_generation(data: dict[str, Any]) -> Generation:
+    """Parse /generation/{id} response."""
+    return Generation(
+        id=data["id"],
+        name=data["name"],
+        species_ids=[
+            parse_id_from_url(s["url"])
+            for s in data.get("pokemon_species", [])
+        ],
     )
 
 
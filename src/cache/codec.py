@@ -0,0 +1,207 @@
+"""Storage codecs for cached API payloads: trimming and compression."""
+import json
+import logging
+import zlib
+from typing import Any, Callable
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency; zlib is always available
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 9
+ZLIB_MAX_DICTIONARY = 32 * 1024  # Only the last 32 KB of a zlib dictionary is used
+
+
+def _english_only(entries: list[dict]) -> list[dict]:
+    return [e for e in entries if e.get("language", {}).get("name") == "en"]
+
+
+def _trim_pokemon_detail(data: dict) -> dict:
+    # Parsers only read the latest version group detail of each move
+    moves = [
+        {**m, "version_group_details": m.get("version_group_details", [])[-1:]}
+        for m in data.get("moves", [])
+    ]
+    sprites = {k: v for k, v in data.get("sprites", {}).items() if k not in ("versions", "other")}
+    official = (data.get("sprites", {}).get("other") or {}).get("official-artwork")
+    if official:
+        sprites["other"] = {"official-artwork": official}
+    trimmed = {
+        k: v for k, v in data.items()
+        if k not in ("game_indices", "location_area_encounters", "past_abilities", "cries")
+    }
+    trimmed["moves"] = moves
+    trimmed["sprites"] = sprites
+    return trimmed
+
+
+def _trim_species(data: dict) -> dict:
+    trimmed = {
+        k: v for k, v in data.items()
+        if k not in ("names", "pokedex_numbers", "pal_park_encounters", "form_descriptions")
+    }
+    trimmed["flavor_text_entries"] = _english_only(data.get("flavor_text_entries", []))
+    trimmed["genera"] = _english_only(data.get("genera", []))
+    return trimmed
+
+
+def _trim_ability(data: dict) -> dict:
+    trimmed = {k: v for k, v in data.items() if k not in ("names", "pokemon", "effect_changes")}
+    trimmed["effect_entries"] = _english_only(data.get("effect_entries", []))
+    trimmed["flavor_text_entries"] = _english_only(data.get("flavor_text_entries", []))
+    return trimmed
+
+
+def _trim_move(data: dict) -> dict:
+    trimmed = {
+        k: v for k, v in data.items()
+        if k not in (
+            "names", "learned_by_pokemon", "flavor_text_entries", "machines",
+            "past_values", "effect_changes", "contest_combos",
+        )
+    }
+    trimmed["effect_entries"] = _english_only(data.get("effect_entries", []))
+    return trimmed
+
+
+def _trim_type(data: dict) -> dict:
+    return {
+        k: v for k, v in data.items()
+        if k not in ("names", "moves", "game_indices", "past_damage_relations", "sprites")
+    }
+
+
+def _trim_generation(data: dict) -> dict:
+    return {
+        k: v for k, v in data.items()
+        if k not in ("names", "moves", "abilities", "types", "version_groups")
+    }
+
+
+# Per-table trimming: drops fields and localizations the parsers never read
+TRIMMERS: dict[str, Callable[[dict], dict]] = {
+    "pokemon_detail": _trim_pokemon_detail,
+    "pokemon_species": _trim_species,
+    "ability": _trim_ability,
+    "move": _trim_move,
+    "type": _trim_type,
+    "generation": _trim_generation,
+}
+
+
+def trim_payload(table: str, data: dict) -> dict:
+    """Return `data` without the fields the app never reads for `table`."""
+    trimmer = TRIMMERS.get(table)
+    return trimmer(data) if trimmer else data
+
+
+def build_dictionary(
+    samples: dict[str, list[bytes]], codec: str, size: int = 64 * 1024
+) -> bytes:
+    """Build a compression dictionary from sample payloads grouped by table.
+
+    zstd trains a real dictionary. zlib has no trainer and only sees the
+    last 32 KB of its preset dictionary, so each table gets an equal slice
+    of that window; the last table in `samples` ends up nearest the data,
+    where matches are cheapest, so pass the largest table last.
+    """
+    if codec == "zstd" and zstandard is not None:
+        flat = [sample for table_samples in samples.values() for sample in table_samples]
+        return zstandard.train_dictionary(size, flat).as_bytes()
+    tables = [table_samples for table_samples in samples.values() if table_samples]
+    if not tables:
+        return b""
+    budget = ZLIB_MAX_DICTIONARY // len(tables)
+    return b"".join(b"".join(table_samples)[:budget] for table_samples in tables)
+
+
+class PayloadCodec:
+    """Encodes payloads for storage and decodes any stored format.
+
+    Rows record the codec they were written with (e.g. "json", "zlib",
+    "zstd", or "zlib:3" when dictionary 3 was used), so rows written with
+    any codec stay readable after the configured codec changes.
+    """
+
+    def __init__(
+        self,
+        name: str = "json",
+        trim: bool = False,
+        dictionaries: dict[int, bytes] | None = None,
+        dictionary_id: int | None = None,
+    ) -> None:
+        if name == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; falling back to zlib storage")
+            name = "zlib"
+        if name not in ("json", "zlib", "zstd"):
+            raise ValueError(f"Unknown storage codec: {name}")
+        self.name = name
+        self.trim = trim
+        self._dictionaries: dict[int, bytes] = dict(dictionaries or {})
+        self._dictionary_id = dictionary_id if dictionary_id in self._dictionaries else None
+        self._zstd_compressor = None
+        self._zstd_decompressors: dict[int | None, Any] = {}
+
+    @property
+    def tag(self) -> str:
+        """Codec value recorded on rows written by this codec."""
+        if self.name != "json" and self._dictionary_id is not None:
+            return f"{self.name}:{self._dictionary_id}"
+        return self.name
+
+    def add_dictionary(self, dictionary_id: int, dictionary: bytes, activate: bool = True) -> None:
+        self._dictionaries[dictionary_id] = dictionary
+        if activate:
+            self._dictionary_id = dictionary_id
+            self._zstd_compressor = None
+
+    def encode(self, table: str, data: dict) -> tuple[str | bytes, str]:
+        """Return the stored value and the codec tag to record with it."""
+        if self.trim:
+            data = trim_payload(table, data)
+        text = json.dumps(data, separators=(",", ":"))
+        if self.name == "json":
+            return text, "json"
+        raw = text.encode("utf-8")
+        dictionary = self._dictionaries.get(self._dictionary_id) if self._dictionary_id else None
+        if self.name == "zlib":
+            if dictionary:
+                compressor = zlib.compressobj(ZLIB_LEVEL, zdict=dictionary)
+                return compressor.compress(raw) + compressor.flush(), self.tag
+            return zlib.compress(raw, ZLIB_LEVEL), self.tag
+        if self._zstd_compressor is None:
+            self._zstd_compressor = zstandard.ZstdCompressor(
+                level=ZSTD_LEVEL,
+                dict_data=zstandard.ZstdCompressionDict(dictionary) if dictionary else None,
+            )
+        return self._zstd_compressor.compress(raw), self.tag
+
+    def decode(self, value: str | bytes, tag: str) -> dict:
+        """Decode a stored value written with codec `tag`."""
+        name, _, dict_part = tag.partition(":")
+        if name == "json":
+            return json.loads(value)
+        dictionary_id = int(dict_part) if dict_part else None
+        dictionary = self._dictionaries.get(dictionary_id) if dictionary_id else None
+        if dictionary_id and dictionary is None:
+            raise ValueError(f"Missing storage dictionary {dictionary_id}")
+        if name == "zlib":
+            if dictionary:
+                decompressor = zlib.decompressobj(zdict=dictionary)
+                return json.loads(decompressor.decompress(value) + decompressor.flush())
+            return json.loads(zlib.decompress(value))
+        if name == "zstd":
+            if zstandard is None:
+                raise ValueError("Row is zstd-compressed but zstandard is not installed")
+            decompressor = self._zstd_decompressors.get(dictionary_id)
+            if decompressor is None:
+                decompressor = zstandard.ZstdDecompressor(
+                    dict_data=zstandard.ZstdCompressionDict(dictionary) if dictionary else None,
+                )
+                self._zstd_decompressors[dictionary_id] = decompressor
+            return json.loads(decompressor.decompress(value))
+        raise ValueError(f"Unknown storage codec: {tag}")
@@ -1,174 +1,833 @@
 """Async SQLite database wrapper for caching."""
-import json
+import asyncio
+import os
 import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable
 
 import aiosqlite
 
-from src.constants import CACHE_DB, CACHE_TTL_POKEMON_LIST
+from src.cache.codec import PayloadCodec, build_dictionary
+from src.cache.migrations import (
+    JSON_TABLES, ProgressCallback, run_migrations, schema_version,
+)
+from src.cache.write_queue import WriteBehindQueue
+from src.constants import (
+    CACHE_DB, CACHE_TTL_POKEMON_LIST, CACHE_STORAGE_CODEC, CACHE_STORAGE_TRIM,
+    CACHE_WRITE_BATCH_SIZE, CACHE_WRITE_FLUSH_INTERVAL,
+    CACHE_READ_CONNECTIONS, CACHE_MMAP_SIZE, CACHE_PAGE_CACHE_KB,
+    SNAPSHOT_BACKUP_PAGES, CACHE_MAX_BYTES, CACHE_TABLE_MAX_BYTES,
+    CACHE_ACCESS_BATCH_SIZE, CACHE_EVICTION_BATCH_SIZE,
+)
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached API payload and its bookkeeping columns."""
+    data: dict
+    cached_at: float
+    validated: bool  # Payload already passed schema validation when saved
+    etag: str | None = None  # HTTP validators for conditional revalidation
+    last_modified: str | None = None
 
 
 class CacheDatabase:
-    """Provides async SQLite operations for the Pokedex cache."""
+    """Provides async SQLite operations for the Pokedex cache.
+
+    Writes are buffered in a write-behind queue and committed in groups;
+    reads see buffered rows immediately, so callers never notice the delay.
+
+    The database runs in WAL mode, so readers never wait on a commit.
+    `read_connections` adds a pool of read-only connections, each with its
+    own aiosqlite worker thread. For the small point lookups this cache
+    does, thread hand-offs cost more than the SQLite work, so the pool is
+    off by default; it pays off when reads are slow (cold disk, big scans).
+
+    Cached payloads are kept within `max_bytes` overall and the per-table
+    limits in `table_max_bytes` by enforce_budget(), which evicts the
+    least recently read rows. Reads only note the row; the `last_accessed`
+    updates are queued in batches with the other writes.
+    """
 
-    def __init__(self, db_path: str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | None = None,
+        codec: str = CACHE_STORAGE_CODEC,
+        trim: bool = CACHE_STORAGE_TRIM,
+        read_connections: int = CACHE_READ_CONNECTIONS,
+        on_migration_progress: ProgressCallback | None = None,
+        max_bytes: int = CACHE_MAX_BYTES,
+        table_max_bytes: dict[str, int] | None = None,
+    ) -> None:
         self._db_path = str(db_path or CACHE_DB)
+        self._max_bytes = max_bytes
+        self._table_max_bytes = dict(
+            CACHE_TABLE_MAX_BYTES if table_max_bytes is None else table_max_bytes
+        )
+        # Rows read since the last batch of last_accessed updates: (table, id) -> time
+        self._accessed: dict[tuple[str, int], float] = {}
+        self._on_migration_progress = on_migration_progress
         self._db: aiosqlite.Connection | None = None
+        self._read_connections = read_connections
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._codec = PayloadCodec(codec, trim=trim)
+        self._writes: WriteBehindQueue | None = None
+        # Read-your-writes copies of queued rows: (table, id) -> (seq, name, entry)
+        self._pending_rows: dict[tuple[str, int], tuple[int, str | None, CacheEntry]] = {}
+        self._pending_meta: dict[str, str] = {}
+        self._pending_misses: dict[tuple[str, str], tuple[str, float]] = {}
+        self._write_seq = 0
 
     async def initialize(self) -> None:
-        """Open connection and create tables if needed."""
+        """Open connections and create tables if needed."""
         self._db = await aiosqlite.connect(self._db_path)
-        self._db.row_factory = aiosqlite.Row
-        await self._create_tables()
+        try:
+            self._db.row_factory = aiosqlite.Row
+            await self._configure(self._db)
+            await self._db.execute("PRAGMA journal_mode = WAL")
+            # Until the reader pool is open, reads fall back to the writer
+            await self._migrate()
+            await self._open_readers()
+        except BaseException:
+            # Don't leave aiosqlite worker threads behind to block exit
+            await self.close()
+            raise
+        self._writes = WriteBehindQueue(
+            self._db,
+            batch_size=CACHE_WRITE_BATCH_SIZE,
+            interval=CACHE_WRITE_FLUSH_INTERVAL,
+            on_flushed=self._on_writes_flushed,
+            on_failed=self._on_writes_failed,
+        )
+        self._writes.start()
 
-    async def _create_tables(self) -> None:
+    @staticmethod
+    async def _configure(conn: aiosqlite.Connection) -> None:
+        """Apply per-connection tuning."""
+        # NORMAL is durable across app crashes in WAL mode; only a power
+        # loss can drop the last commits, which are re-fetchable cache rows
+        await conn.execute("PRAGMA synchronous = NORMAL")
+        await conn.execute(f"PRAGMA mmap_size = {CACHE_MMAP_SIZE}")
+        await conn.execute(f"PRAGMA cache_size = -{CACHE_PAGE_CACHE_KB}")
+        await conn.execute("PRAGMA temp_store = MEMORY")
+        await conn.execute("PRAGMA busy_timeout = 5000")
+
+    async def _open_readers(self) -> None:
+        """Open the read-only connection pool."""
+        if self._db_path == ":memory:":
+            return  # A private in-memory database cannot be shared
+        for _ in range(self._read_connections):
+            uri = Path(self._db_path).resolve().as_uri() + "?mode=ro"
+            conn = await aiosqlite.connect(uri, uri=True)
+            self._readers.append(conn)  # Tracked first so close() cleans up on failure
+            conn.row_factory = aiosqlite.Row
+            await self._configure(conn)
+            await conn.execute("PRAGMA query_only = ON")
+            self._idle_readers.put_nowait(conn)
+
+    @asynccontextmanager
+    async def _reading(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read connection, or the writer if there is no pool."""
         assert self._db is not None
-        await self._db.executescript("""
-            CREATE TABLE IF NOT EXISTS pokemon_list (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                url TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS pokemon_list_meta (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS pokemon_detail (
-                id INTEGER PRIMARY KEY,
-                data_json TEXT NOT NULL,
-                cached_at REAL NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS pokemon_species (
-                id INTEGER PRIMARY KEY,
-                data_json TEXT NOT NULL,
-                cached_at REAL NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS evolution_chain (
-                id INTEGER PRIMARY KEY,
-                data_json TEXT NOT NULL,
-                cached_at REAL NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS ability (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                data_json TEXT NOT NULL,
-                cached_at REAL NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS move (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                data_json TEXT NOT NULL,
-                cached_at REAL NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS type (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                data_json TEXT NOT NULL,
-                cached_at REAL NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS form (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                data_json TEXT NOT NULL,
-                cached_at REAL NOT NULL
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_pokemon_list_name
-                ON pokemon_list(name);
-
-            CREATE INDEX IF NOT EXISTS idx_ability_name
-                ON ability(name);
-
-            CREATE INDEX IF NOT EXISTS idx_move_name
-                ON move(name);
-
-            CREATE INDEX IF NOT EXISTS idx_type_name
-                ON type(name);
-
-            CREATE INDEX IF NOT EXISTS idx_form_name
-                ON form(name);
-        """)
-        await self._db.commit()
-
-    async def get_pokemon_list(self) -> list[dict] | None:
-        """Return cached Pokemon list or None if stale/missing."""
+        if not self._readers:
+            yield self._db
+            return
+        conn = await self._idle_readers.get()
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put_nowait(conn)
+
+    async def _migrate(self) -> None:
+        """Bring the schema up to date, then load compression dictionaries."""
         assert self._db is not None
-        async with self._db.execute(
-            "SELECT value FROM pokemon_list_meta WHERE key = 'cached_at'"
-        ) as cursor:
-            row = await cursor.fetchone()
-            if row is None:
-                return None
-            cached_at = float(row["value"])
-            if time.time() - cached_at > CACHE_TTL_POKEMON_LIST:
-                return None
+        await run_migrations(self._db, on_progress=self._on_migration_progress)
+        await self._load_dictionaries()
 
-        async with self._db.execute(
-            "SELECT id, name, url FROM pokemon_list ORDER BY id"
-        ) as cursor:
-            rows = await cursor.fetchall()
-            if not rows:
-                return None
-            return [dict(row) for row in rows]
+    async def schema_version(self) -> int:
+        """Latest schema migration applied to the database."""
+        assert self._db is not None
+        return await schema_version(self._db)
+
+    async def get_pokemon_list(
+        self, ttl: float = CACHE_TTL_POKEMON_LIST
+    ) -> list[dict] | None:
+        """Return cached Pokemon list or None if older than `ttl`/missing."""
+        assert self._db is not None
+        await self.flush()
+        async with self._reading() as conn:
+            async with conn.execute(
+                "SELECT value FROM pokemon_list_meta WHERE key = 'cached_at'"
+            ) as cursor:
+                row = await cursor.fetchone()
+                if row is None:
+                    return None
+                cached_at = float(row["value"])
+                if time.time() - cached_at > ttl:
+                    return None
+
+            async with conn.execute(
+                "SELECT id, name, url FROM pokemon_list ORDER BY id"
+            ) as cursor:
+                rows = await cursor.fetchall()
+                if not rows:
+                    return None
+                return [dict(row) for row in rows]
 
     async def save_pokemon_list(self, pokemon_list: list[dict]) -> None:
         """Save the full Pokemon list to cache."""
-        assert self._db is not None
-        await self._db.execute("DELETE FROM pokemon_list")
-        await self._db.executemany(
+        assert self._writes is not None
+        self._writes.execute("DELETE FROM pokemon_list")
+        self._writes.executemany(
             "INSERT INTO pokemon_list (id, name, url) VALUES (?, ?, ?)",
             [(p["id"], p["name"], p["url"]) for p in pokemon_list],
         )
-        await self._db.execute(
+        await self.set_meta("cached_at", str(time.time()))
+
+    async def get_meta(self, key: str) -> str | None:
+        """Get a value from the metadata key/value table."""
+        assert self._db is not None
+        if key in self._pending_meta:
+            return self._pending_meta[key]
+        async with self._reading() as conn:
+            async with conn.execute(
+                "SELECT value FROM pokemon_list_meta WHERE key = ?", (key,)
+            ) as cursor:
+                row = await cursor.fetchone()
+        return row["value"] if row else None
+
+    async def set_meta(self, key: str, value: str) -> None:
+        """Store a value in the metadata key/value table."""
+        assert self._writes is not None
+        self._pending_meta[key] = value
+        self._writes.execute(
             "INSERT OR REPLACE INTO pokemon_list_meta (key, value) VALUES (?, ?)",
-            ("cached_at", str(time.time())),
+            (key, value),
+            key=("meta", key, value),
+        )
+
+    async def get_cached_entry(
+        self, table: str, item_id: int, ttl: float
+    ) -> CacheEntry | None:
+        """Get a cached payload with its metadata, or None if stale/missing."""
+        assert self._db is not None
+        pending = self._pending_rows.get((table, item_id))
+        if pending is not None:
+            return self._fresh(pending[2], ttl)
+        async with self._reading() as conn:
+            async with conn.execute(
+                f"SELECT id, data_json, cached_at, validated, codec, etag, last_modified "
+                f"FROM {table} WHERE id = ?",
+                (item_id,),
+            ) as cursor:
+                row = await cursor.fetchone()
+        return self._entry_from_row(table, row, ttl)
+
+    async def get_cached_entry_by_name(
+        self, table: str, name: str, ttl: float
+    ) -> CacheEntry | None:
+        """Get a cached payload from a name-indexed table, or None if stale/missing."""
+        assert self._db is not None
+        for (pending_table, _), (_, pending_name, entry) in self._pending_rows.items():
+            if pending_table == table and pending_name == name:
+                return self._fresh(entry, ttl)
+        async with self._reading() as conn:
+            async with conn.execute(
+                f"SELECT id, data_json, cached_at, validated, codec, etag, last_modified "
+                f"FROM {table} WHERE name = ? "
+                f"ORDER BY cached_at DESC LIMIT 1",
+                (name,),
+            ) as cursor:
+                row = await cursor.fetchone()
+        return self._entry_from_row(table, row, ttl)
+
+    @staticmethod
+    def _fresh(entry: CacheEntry, ttl: float) -> CacheEntry | None:
+        return entry if time.time() - entry.cached_at <= ttl else None
+
+    def _entry_from_row(
+        self, table: str, row: aiosqlite.Row | None, ttl: float
+    ) -> CacheEntry | None:
+        if row is None:
+            return None
+        if time.time() - row["cached_at"] > ttl:
+            return None
+        self._note_access(table, row["id"])
+        return CacheEntry(
+            data=self._codec.decode(row["data_json"], row["codec"]),
+            cached_at=row["cached_at"],
+            validated=bool(row["validated"]),
+            etag=row["etag"],
+            last_modified=row["last_modified"],
         )
-        await self._db.commit()
 
     async def get_cached_json(
         self, table: str, item_id: int, ttl: float
     ) -> dict | None:
         """Get cached JSON from a table, or None if stale/missing."""
-        assert self._db is not None
-        async with self._db.execute(
-            f"SELECT data_json, cached_at FROM {table} WHERE id = ?",
-            (item_id,),
-        ) as cursor:
-            row = await cursor.fetchone()
-            if row is None:
-                return None
-            if time.time() - row["cached_at"] > ttl:
-                return None
-            return json.loads(row["data_json"])
+        entry = await self.get_cached_entry(table, item_id, ttl)
+        return entry.data if entry else None
+
+    async def get_cached_json_by_name(
+        self, table: str, name: str, ttl: float
+    ) -> dict | None:
+        """Get cached JSON from a name-indexed table, or None if stale/missing."""
+        entry = await self.get_cached_entry_by_name(table, name, ttl)
+        return entry.data if entry else None
 
     async def save_cached_json(
-        self, table: str, item_id: int, data: dict, name: str | None = None
+        self,
+        table: str,
+        item_id: int,
+        data: dict,
+        name: str | None = None,
+        validated: bool = False,
+        etag: str | None = None,
+        last_modified: str | None = None,
     ) -> None:
-        """Save JSON data to a cache table."""
-        assert self._db is not None
+        """Save JSON data to a cache table.
+
+        Pass `validated=True` when the payload has already passed schema
+        validation, so later cache hits can skip it. `etag` and
+        `last_modified` are the response's HTTP validators, used to
+        revalidate the row with a conditional GET once it goes stale.
+        """
+        assert self._writes is not None
+        cached_at = time.time()
+        value, codec = self._codec.encode(table, data)
+        self._write_seq += 1
+        self._pending_rows[(table, item_id)] = (
+            self._write_seq, name,
+            CacheEntry(data, cached_at, validated, etag, last_modified),
+        )
+        key = ("row", table, item_id, self._write_seq)
         if name is not None:
-            await self._db.execute(
-                f"INSERT OR REPLACE INTO {table} (id, name, data_json, cached_at) "
-                f"VALUES (?, ?, ?, ?)",
-                (item_id, name, json.dumps(data), time.time()),
+            self._writes.execute(
+                f"INSERT OR REPLACE INTO {table} "
+                f"(id, name, data_json, cached_at, validated, codec, etag, last_modified, "
+                f"last_accessed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (item_id, name, value, cached_at, int(validated), codec, etag, last_modified,
+                 cached_at),
+                key=key,
             )
         else:
-            await self._db.execute(
-                f"INSERT OR REPLACE INTO {table} (id, data_json, cached_at) "
-                f"VALUES (?, ?, ?)",
-                (item_id, json.dumps(data), time.time()),
+            self._writes.execute(
+                f"INSERT OR REPLACE INTO {table} "
+                f"(id, data_json, cached_at, validated, codec, etag, last_modified, "
+                f"last_accessed) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (item_id, value, cached_at, int(validated), codec, etag, last_modified,
+                 cached_at),
+                key=key,
+            )
+
+    async def save_cached_json_many(
+        self,
+        table: str,
+        rows: list[tuple[int, str | None, dict]],
+        validated: bool = False,
+    ) -> None:
+        """Save many `(id, name, data)` rows to a cache table in one transaction.
+
+        Meant for bulk loads: rows go straight to the database instead of
+        through the write-behind queue, so they are not mirrored in memory.
+        """
+        assert self._db is not None and self._writes is not None
+        cached_at = time.time()
+        named, unnamed = [], []
+        for item_id, name, data in rows:
+            value, codec = self._codec.encode(table, data)
+            if name is not None:
+                named.append((item_id, name, value, cached_at, int(validated), codec, cached_at))
+            else:
+                unnamed.append((item_id, value, cached_at, int(validated), codec, cached_at))
+        # Queued writes for the same rows must land first, not after the bulk load
+        await self.flush()
+        async with self._writes.lock:
+            if named:
+                await self._db.executemany(
+                    f"INSERT OR REPLACE INTO {table} "
+                    f"(id, name, data_json, cached_at, validated, codec, last_accessed) "
+                    f"VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    named,
+                )
+            if unnamed:
+                await self._db.executemany(
+                    f"INSERT OR REPLACE INTO {table} "
+                    f"(id, data_json, cached_at, validated, codec, last_accessed) "
+                    f"VALUES (?, ?, ?, ?, ?, ?)",
+                    unnamed,
+                )
+            await self._db.commit()
+
+    async def touch_cached_entry(
+        self, table: str, item_id: int | None = None, name: str | None = None
+    ) -> None:
+        """Mark a row as fresh after the server confirmed it is unchanged (304)."""
+        assert self._writes is not None
+        cached_at = time.time()
+        column, value = ("id", item_id) if item_id is not None else ("name", name)
+        for (pending_table, pending_id), (_, pending_name, entry) in self._pending_rows.items():
+            if pending_table == table and (
+                pending_id == item_id if column == "id" else pending_name == name
+            ):
+                entry.cached_at = cached_at
+        self._writes.execute(
+            f"UPDATE {table} SET cached_at = ? WHERE {column} = ?", (cached_at, value)
+        )
+        # Committed now so the next read does not see the row as stale again
+        await self.flush()
+
+    async def get_missing(self, kind: str, key: str, ttl: float) -> str | None:
+        """Why a resource was recorded as missing, or None if not within `ttl`."""
+        assert self._db is not None
+        pending = self._pending_misses.get((kind, key))
+        if pending is None:
+            async with self._reading() as conn:
+                async with conn.execute(
+                    "SELECT reason, cached_at FROM missing_resource WHERE kind = ? AND key = ?",
+                    (kind, key),
+                ) as cursor:
+                    row = await cursor.fetchone()
+            if row is None:
+                return None
+            pending = (row["reason"], row["cached_at"])
+        reason, cached_at = pending
+        return reason if time.time() - cached_at <= ttl else None
+
+    async def save_missing(self, kind: str, key: str, reason: str) -> None:
+        """Record that a resource could not be fetched, for negative caching."""
+        assert self._writes is not None
+        cached_at = time.time()
+        self._pending_misses[(kind, key)] = (reason, cached_at)
+        self._writes.execute(
+            "INSERT OR REPLACE INTO missing_resource (kind, key, reason, cached_at) "
+            "VALUES (?, ?, ?, ?)",
+            (kind, key, reason, cached_at),
+            key=("missing", kind, key, cached_at),
+        )
+
+    async def purge_missing(self, ttl: float) -> int:
+        """Delete negative cache entries older than `ttl`; return how many."""
+        assert self._db is not None and self._writes is not None
+        await self.flush()
+        async with self._writes.lock:
+            cursor = await self._db.execute(
+                "DELETE FROM missing_resource WHERE cached_at < ?", (time.time() - ttl,)
+            )
+            await self._db.commit()
+        return cursor.rowcount
+
+    def _on_writes_flushed(self, keys: list) -> None:
+        """Drop read-your-writes copies once their rows are committed."""
+        for key in keys:
+            if key[0] == "row":
+                _, table, item_id, seq = key
+                pending = self._pending_rows.get((table, item_id))
+                if pending is not None and pending[0] == seq:
+                    del self._pending_rows[(table, item_id)]
+            elif key[0] == "meta":
+                _, meta_key, value = key
+                if self._pending_meta.get(meta_key) == value:
+                    del self._pending_meta[meta_key]
+            elif key[0] == "missing":
+                _, kind, item_key, cached_at = key
+                pending = self._pending_misses.get((kind, item_key))
+                if pending is not None and pending[1] == cached_at:
+                    del self._pending_misses[(kind, item_key)]
+
+    def _on_writes_failed(self, keys: list) -> None:
+        """Forget rows that could not be stored so reads stop serving them."""
+        self._on_writes_flushed(keys)
+
+    def _note_access(self, table: str, item_id: int) -> None:
+        """Record a cache hit for LRU eviction, without a write on the read path."""
+        self._accessed[(table, item_id)] = time.time()
+        if len(self._accessed) >= CACHE_ACCESS_BATCH_SIZE:
+            self._queue_accesses()
+
+    def _queue_accesses(self) -> None:
+        """Hand recorded hits to the write queue as one batched UPDATE per table."""
+        if not self._accessed or self._writes is None:
+            return
+        by_table: dict[str, list[tuple[float, int]]] = {}
+        for (table, item_id), accessed_at in self._accessed.items():
+            by_table.setdefault(table, []).append((accessed_at, item_id))
+        self._accessed = {}
+        for table, params in by_table.items():
+            self._writes.executemany(
+                f"UPDATE {table} SET last_accessed = ? WHERE id = ?", params
+            )
+
+    async def flush(self) -> None:
+        """Commit all buffered writes now."""
+        if self._writes is not None:
+            self._queue_accesses()
+            await self._writes.flush()
+
+    async def table_sizes(self) -> dict[str, int]:
+        """Payload bytes stored in each cache table."""
+        assert self._db is not None
+        await self.flush()
+        sizes = {}
+        for table in JSON_TABLES:
+            async with self._db.execute(
+                f"SELECT COALESCE(SUM(LENGTH(data_json)), 0) FROM {table}"
+            ) as cursor:
+                (sizes[table],) = await cursor.fetchone()
+        return sizes
+
+    async def enforce_budget(self, batch_size: int = CACHE_EVICTION_BATCH_SIZE) -> dict:
+        """Evict least recently used rows until every byte budget is met.
+
+        Per-table budgets are applied first, then the overall one across
+        all tables. Freed pages are returned to the filesystem with an
+        incremental vacuum. Returns the rows and bytes evicted.
+        """
+        assert self._db is not None and self._writes is not None
+        sizes = await self.table_sizes()
+        evicted_rows = evicted_bytes = 0
+        # Held throughout so queued writes don't interleave with the deletes
+        async with self._writes.lock:
+            for table, budget in self._table_max_bytes.items():
+                if sizes.get(table, 0) > budget:
+                    rows, freed = await self._evict([table], sizes[table] - budget, batch_size)
+                    sizes[table] -= freed
+                    evicted_rows += rows
+                    evicted_bytes += freed
+            excess = sum(sizes.values()) - self._max_bytes
+            if excess > 0:
+                rows, freed = await self._evict(list(JSON_TABLES), excess, batch_size)
+                evicted_rows += rows
+                evicted_bytes += freed
+            if evicted_rows:
+                # Each result row is one page handed back; stepping through them does the work
+                async with self._db.execute("PRAGMA incremental_vacuum") as cursor:
+                    await cursor.fetchall()
+                await self._db.commit()
+        return {"rows": evicted_rows, "bytes": evicted_bytes}
+
+    async def _evict(self, tables: list[str], excess: int, batch_size: int) -> tuple[int, int]:
+        """Delete the least recently used rows of `tables` until `excess` bytes are freed."""
+        assert self._db is not None
+        candidates = " UNION ALL ".join(
+            f"SELECT '{table}' AS tbl, id, last_accessed, LENGTH(data_json) AS size FROM {table}"
+            for table in tables
+        )
+        evicted = freed = 0
+        while freed < excess:
+            async with self._db.execute(
+                f"SELECT tbl, id, size FROM ({candidates}) ORDER BY last_accessed LIMIT ?",
+                (batch_size,),
+            ) as cursor:
+                victims = await cursor.fetchall()
+            if not victims:
+                break
+            by_table: dict[str, list[tuple[int]]] = {}
+            for victim in victims:
+                if freed >= excess:
+                    break
+                by_table.setdefault(victim["tbl"], []).append((victim["id"],))
+                freed += victim["size"]
+                evicted += 1
+            for table, ids in by_table.items():
+                await self._db.executemany(f"DELETE FROM {table} WHERE id = ?", ids)
+                for (item_id,) in ids:
+                    self._accessed.pop((table, item_id), None)
+            await self._db.commit()
+        return evicted, freed
+
+    def get_write_stats(self) -> dict:
+        """Get write-behind queue depth and flush counters."""
+        return self._writes.get_stats() if self._writes else {}
+
+    async def _load_dictionaries(self) -> None:
+        """Load stored compression dictionaries and activate the current one."""
+        assert self._db is not None
+        async with self._db.execute(
+            "SELECT id, codec, data FROM storage_dictionary ORDER BY id"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        active = await self.get_meta("storage_dictionary_id")
+        for row in rows:
+            # Rows may reference any dictionary; only the active one is used for writes
+            is_active = (
+                active is not None
+                and row["id"] == int(active)
+                and row["codec"] == self._codec.name
             )
-        await self._db.commit()
+            self._codec.add_dictionary(row["id"], row["data"], activate=is_active)
+
+    async def train_storage_dictionary(self, samples_per_table: int = 50) -> int | None:
+        """Build a compression dictionary from cached rows and make it active.
+
+        Returns the new dictionary id, or None if the codec is plain JSON or
+        there is nothing cached to learn from. Existing rows keep their old
+        encoding until `migrate_storage` rewrites them.
+        """
+        assert self._db is not None and self._writes is not None
+        if self._codec.name == "json":
+            return None
+        await self.flush()
+        plain = PayloadCodec("json", trim=self._codec.trim)
+        row_counts = {}
+        for table in JSON_TABLES:
+            async with self._db.execute(f"SELECT COUNT(*) FROM {table}") as cursor:
+                row_counts[table] = (await cursor.fetchone())[0]
+        # Largest tables last: they sit nearest the data in a zlib window
+        samples: dict[str, list[bytes]] = {}
+        for table in sorted(JSON_TABLES, key=row_counts.__getitem__):
+            async with self._db.execute(
+                f"SELECT data_json, codec FROM {table} ORDER BY RANDOM() LIMIT ?",
+                (samples_per_table,),
+            ) as cursor:
+                samples[table] = [
+                    plain.encode(table, self._codec.decode(row["data_json"], row["codec"]))[0]
+                    .encode("utf-8")
+                    for row in await cursor.fetchall()
+                ]
+        if not any(samples.values()):
+            return None
+
+        dictionary = build_dictionary(samples, self._codec.name)
+        async with self._writes.lock:
+            cursor = await self._db.execute(
+                "INSERT INTO storage_dictionary (codec, data, created_at) VALUES (?, ?, ?)",
+                (self._codec.name, dictionary, time.time()),
+            )
+            dictionary_id = cursor.lastrowid
+            await self._db.commit()
+        await self.set_meta("storage_dictionary_id", str(dictionary_id))
+        self._codec.add_dictionary(dictionary_id, dictionary)
+        return dictionary_id
+
+    async def migrate_storage(
+        self,
+        batch_size: int = 200,
+        on_progress: Callable[[str, int], None] | None = None,
+    ) -> int:
+        """Re-encode rows written with another codec, in batched transactions.
+
+        Rows stay readable throughout, since each row records its own codec.
+        Returns the number of rows rewritten.
+        """
+        assert self._db is not None and self._writes is not None
+        await self.flush()
+        target = self._codec.tag
+        total = 0
+        for table in JSON_TABLES:
+            last_id = -1
+            while True:
+                # Hold the write lock per batch so queued writes neither
+                # interleave with the UPDATEs nor get overwritten by them
+                async with self._writes.lock:
+                    async with self._db.execute(
+                        f"SELECT id, data_json, codec FROM {table} "
+                        f"WHERE codec != ? AND id > ? ORDER BY id LIMIT ?",
+                        (target, last_id, batch_size),
+                    ) as cursor:
+                        rows = await cursor.fetchall()
+                    if not rows:
+                        break
+                    updates = []
+                    for row in rows:
+                        data = self._codec.decode(row["data_json"], row["codec"])
+                        value, codec = self._codec.encode(table, data)
+                        updates.append((value, codec, row["id"]))
+                    await self._db.executemany(
+                        f"UPDATE {table} SET data_json = ?, codec = ? WHERE id = ?",
+                        updates,
+                    )
+                    await self._db.commit()
+                last_id = rows[-1]["id"]
+                total += len(rows)
+                if on_progress:
+                    on_progress(table, total)
+        return total
+
+    async def storage_report(self, decode_samples: int = 50) -> dict:
+        """Report on-disk size, row counts, codecs and decode time per table."""
+        assert self._db is not None
+        await self.flush()
+        tables = {}
+        for table in JSON_TABLES:
+            async with self._db.execute(
+                f"SELECT codec, COUNT(*) AS rows, SUM(LENGTH(data_json)) AS bytes "
+                f"FROM {table} GROUP BY codec"
+            ) as cursor:
+                by_codec = {row["codec"]: (row["rows"], row["bytes"] or 0) for row in await cursor.fetchall()}
+
+            async with self._db.execute(
+                f"SELECT data_json, codec FROM {table} LIMIT ?", (decode_samples,)
+            ) as cursor:
+                samples = await cursor.fetchall()
+            start = time.perf_counter()
+            for row in samples:
+                self._codec.decode(row["data_json"], row["codec"])
+            elapsed = time.perf_counter() - start
+
+            tables[table] = {
+                "rows": sum(rows for rows, _ in by_codec.values()),
+                "bytes": sum(size for _, size in by_codec.values()),
+                "codecs": {codec: rows for codec, (rows, _) in by_codec.items()},
+                "decode_ms_per_row": (elapsed / len(samples) * 1000) if samples else 0.0,
+            }
+        return {
+            "codec": self._codec.tag,
+            "file_bytes": os.path.getsize(self._db_path) if os.path.exists(self._db_path) else 0,
+            "tables": tables,
+        }
+
+    @property
+    def path(self) -> Path:
+        """Location of the database file."""
+        return Path(self._db_path)
+
+    async def backup(self, dest: Path, pages: int = SNAPSHOT_BACKUP_PAGES) -> None:
+        """Write a consistent copy of the database to `dest`.
+
+        Uses SQLite's online backup, `pages` pages per step, so memory use
+        stays flat however large the cache is. The copy is a single file in
+        rollback-journal mode, ready to be shipped elsewhere.
+        """
+        assert self._db is not None
+        await self.flush()
+        async with aiosqlite.connect(dest) as target:
+            await self._db.backup(target, pages=pages, sleep=0)
+            await target.execute("PRAGMA journal_mode=DELETE")
+
+    async def install(self, source: Path) -> None:
+        """Replace the database file with `source`, e.g. a restored backup.
+
+        `source` is integrity-checked first and then renamed over the
+        database, so it must be on the same filesystem. The database must
+        be closed; it can be initialized again afterwards.
+        """
+        if self._db is not None:
+            raise RuntimeError("Close the cache database before replacing it")
+        async with aiosqlite.connect(source) as conn:
+            async with conn.execute("PRAGMA quick_check") as cursor:
+                (result,) = await cursor.fetchone()
+        if result != "ok":
+            raise ValueError(f"Database {source} failed its integrity check: {result}")
+        # A leftover WAL would be replayed onto the new file
+        for suffix in ("-wal", "-shm"):
+            Path(self._db_path + suffix).unlink(missing_ok=True)
+        os.replace(source, self._db_path)
+
+    async def get_pokemon_index(self) -> list[dict]:
+        """Return every row of the precomputed list index."""
+        assert self._db is not None
+        await self.flush()
+        async with self._reading() as conn:
+            async with conn.execute(
+                "SELECT * FROM pokemon_index ORDER BY id"
+            ) as cursor:
+                rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def upsert_index_detail(
+        self,
+        pokemon_id: int,
+        name: str,
+        species_id: int,
+        types: list[str],
+        stats: dict[str, int],
+    ) -> None:
+        """Record types and base stats for a Pokemon in the list index.
+
+        A form inherits the generation of its species if that is already known.
+        """
+        assert self._writes is not None
+        self._writes.execute(
+            """
+            INSERT INTO pokemon_index (
+                id, name, species_id, types, base_stat_total,
+                hp, attack, defense, special_attack, special_defense, speed,
+                generation
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, (
+                SELECT generation FROM pokemon_index
+                WHERE species_id = ? AND generation IS NOT NULL LIMIT 1
+            ))
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name,
+                species_id = excluded.species_id,
+                types = excluded.types,
+                base_stat_total = excluded.base_stat_total,
+                hp = excluded.hp,
+                attack = excluded.attack,
+                defense = excluded.defense,
+                special_attack = excluded.special_attack,
+                special_defense = excluded.special_defense,
+                speed = excluded.speed,
+                generation = COALESCE(pokemon_index.generation, excluded.generation)
+            """,
+            (
+                pokemon_id, name, species_id, ",".join(types), sum(stats.values()),
+                stats.get("hp"), stats.get("attack"), stats.get("defense"),
+                stats.get("special-attack"), stats.get("special-defense"),
+                stats.get("speed"),
+                species_id,
+            ),
+        )
+
+    async def upsert_index_species_generation(
+        self, species_id: int, generation: str, name: str | None = None
+    ) -> None:
+        """Record the generation of a species for the species and all its forms."""
+        assert self._writes is not None
+        self._writes.execute(
+            """
+            INSERT INTO pokemon_index (id, name, species_id, generation)
+            VALUES (?1, ?2, ?1, ?3)
+            ON CONFLICT(id) DO UPDATE SET
+                name = COALESCE(pokemon_index.name, excluded.name),
+                species_id = COALESCE(pokemon_index.species_id, excluded.species_id),
+                generation = excluded.generation
+            """,
+            (species_id, name, generation),
+        )
+        self._writes.execute(
+            "UPDATE pokemon_index SET generation = ? WHERE species_id = ?",
+            (generation, species_id),
+        )
+
+    async def upsert_index_metadata(
+        self, types: dict[int, list[str]], generations: dict[int, str]
+    ) -> None:
+        """Record type names and generation for many Pokemon ids at once."""
+        assert self._writes is not None
+        self._writes.executemany(
+            """
+            INSERT INTO pokemon_index (id, types, generation) VALUES (?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                types = COALESCE(excluded.types, pokemon_index.types),
+                generation = COALESCE(excluded.generation, pokemon_index.generation)
+            """,
+            [
+                (
+                    pokemon_id,
+                    ",".join(types[pokemon_id]) if pokemon_id in types else None,
+                    generations.get(pokemon_id),
+                )
+                for pokemon_id in types.keys() | generations.keys()
+            ],
+        )
 
     async def close(self) -> None:
-        """Close the database connection."""
-        if self._db:
-            await self._db.close()
-            self._db = None
+        """Flush pending writes and close the database connection."""
+        try:
+            if self._writes is not None:
+                self._queue_accesses()
+                await self._writes.close()
+        finally:
+            self._writes = None
+            for conn in self._readers:
+                await conn.close()
+            self._readers = []
+            self._idle_readers = asyncio.Queue()
+            if self._db:
+                await self._db.close()
+                self._db = None
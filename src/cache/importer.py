@@ -0,0 +1,224 @@
+"""Offline import of a local PokeAPI data dump into the cache database.
+
+The dump uses the layout of the PokeAPI/api-data repository: one
+`<resource>/<id>/index.json` file per resource under `api/v2`.
+"""
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from src.api.endpoints import pokemon_detail_url
+from src.api.parsers import (
+    parse_pokemon_detail, parse_pokemon_species, parse_evolution_chain,
+    parse_ability, parse_move, parse_type_effectiveness, parse_generation,
+    parse_pokemon_form,
+)
+from src.cache.database import CacheDatabase
+from src.constants import IMPORT_WORKERS, IMPORT_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Dump directory -> cache table, in import order
+DUMP_RESOURCES: dict[str, str] = {
+    "pokemon": "pokemon_detail",
+    "pokemon-species": "pokemon_species",
+    "evolution-chain": "evolution_chain",
+    "ability": "ability",
+    "move": "move",
+    "type": "type",
+    "pokemon-form": "form",
+    "generation": "generation",
+}
+
+# Tables looked up by name; the others are keyed by id only
+_NAMED_TABLES = {"ability", "move", "type", "form", "generation"}
+
+_PARSERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "pokemon_detail": parse_pokemon_detail,
+    "pokemon_species": parse_pokemon_species,
+    "evolution_chain": parse_evolution_chain,
+    "ability": parse_ability,
+    "move": parse_move,
+    "type": parse_type_effectiveness,
+    "form": parse_pokemon_form,
+    "generation": parse_generation,
+}
+
+
+@dataclass(slots=True)
+class ImportProgress:
+    """Rows imported so far for one resource."""
+    resource: str
+    imported: int
+    failed: int
+    total: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.imported / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ProgressCallback = Callable[[ImportProgress], None]
+
+
+def find_dump_root(path: Path) -> Path:
+    """Return the `api/v2` directory of a dump, given it or any parent of it."""
+    for candidate in (path, path / "api" / "v2", path / "data" / "api" / "v2"):
+        if (candidate / "pokemon").is_dir():
+            return candidate
+    raise FileNotFoundError(f"No PokeAPI data dump found under {path}")
+
+
+def _resource_files(directory: Path) -> list[Path]:
+    """Per-resource index files, in id order (the list index.json is skipped)."""
+    files = [
+        entry / "index.json"
+        for entry in directory.iterdir()
+        if entry.is_dir() and entry.name.isdigit()
+    ]
+    return sorted(files, key=lambda f: int(f.parent.name))
+
+
+def _parse_files(table: str, paths: list[str]) -> tuple[list[tuple], list[str]]:
+    """Load and validate a chunk of dump files.
+
+    Runs in a worker process, so it takes and returns only picklable data:
+    `(id, name, data, index)` rows, where `index` holds what the list index
+    needs for Pokemon and species, and one message per file that failed.
+    """
+    parse = _PARSERS[table]
+    rows, errors = [], []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            model = parse(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            errors.append(f"{path}: {e}")
+            continue
+        index = None
+        if table == "pokemon_detail":
+            index = (
+                model.name,
+                model.species_id,
+                [t.name for t in sorted(model.types, key=lambda t: t.slot)],
+                {s.name: s.base_stat for s in model.stats},
+            )
+        elif table == "pokemon_species":
+            index = (model.name, model.generation)
+        name = model.name if table in _NAMED_TABLES else None
+        rows.append((model.id, name, data, index))
+    return rows, errors
+
+
+class DatasetImporter:
+    """Bulk-loads a PokeAPI data dump into the cache tables without network.
+
+    Files are parsed and schema-validated in a process pool, `batch_size`
+    files per job, while the event loop writes each finished batch in a
+    single transaction. With `workers=1` everything runs in-process.
+    """
+
+    def __init__(
+        self,
+        db: CacheDatabase,
+        on_progress: ProgressCallback | None = None,
+        workers: int = IMPORT_WORKERS,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> None:
+        self._db = db
+        self._on_progress = on_progress
+        self._workers = max(1, workers)
+        self._batch_size = max(1, batch_size)
+        self._pokemon: dict[int, str] = {}
+
+    async def run(self, path: Path) -> list[ImportProgress]:
+        """Import every known resource found in the dump; return per-resource totals."""
+        root = find_dump_root(Path(path))
+        executor = ProcessPoolExecutor(self._workers) if self._workers > 1 else None
+        results = []
+        try:
+            for resource, table in DUMP_RESOURCES.items():
+                directory = root / resource
+                if not directory.is_dir():
+                    logger.info(f"Dump has no {resource} directory, skipping")
+                    continue
+                results.append(await self._import_resource(executor, resource, table, directory))
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        if self._pokemon:
+            await self._db.save_pokemon_list([
+                {"id": pokemon_id, "name": name, "url": pokemon_detail_url(pokemon_id)}
+                for pokemon_id, name in sorted(self._pokemon.items())
+            ])
+        await self._db.flush()
+        return results
+
+    async def _import_resource(
+        self, executor: Executor | None, resource: str, table: str, directory: Path
+    ) -> ImportProgress:
+        files = [str(f) for f in _resource_files(directory)]
+        chunks = [
+            files[i:i + self._batch_size]
+            for i in range(0, len(files), self._batch_size)
+        ]
+        progress = ImportProgress(resource, 0, 0, len(files), 0.0)
+        start = time.perf_counter()
+
+        if executor is None:
+            for chunk in chunks:
+                await self._store(table, *_parse_files(table, chunk), progress)
+                progress.elapsed = time.perf_counter() - start
+                self._report(progress)
+            return progress
+
+        loop = asyncio.get_running_loop()
+        pending: set[asyncio.Future] = set()
+        chunk_iter = iter(chunks)
+        while True:
+            # Keep every worker busy, with one chunk queued behind each
+            for chunk in chunk_iter:
+                pending.add(loop.run_in_executor(executor, _parse_files, table, chunk))
+                if len(pending) >= self._workers * 2:
+                    break
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                await self._store(table, *future.result(), progress)
+            progress.elapsed = time.perf_counter() - start
+            self._report(progress)
+        return progress
+
+    async def _store(
+        self, table: str, rows: list[tuple], errors: list[str], progress: ImportProgress
+    ) -> None:
+        for error in errors:
+            logger.warning(f"Skipping {error}")
+        progress.failed += len(errors)
+        if not rows:
+            return
+        await self._db.save_cached_json_many(
+            table, [(item_id, name, data) for item_id, name, data, _ in rows], validated=True
+        )
+        for item_id, _, _, index in rows:
+            if table == "pokemon_detail":
+                name, species_id, types, stats = index
+                self._pokemon[item_id] = name
+                await self._db.upsert_index_detail(item_id, name, species_id, types, stats)
+            elif table == "pokemon_species":
+                name, generation = index
+                await self._db.upsert_index_species_generation(item_id, generation, name=name)
+        progress.imported += len(rows)
+
+    def _report(self, progress: ImportProgress) -> None:
+        if self._on_progress:
+            self._on_progress(progress)
@@ -0,0 +1,53 @@
+"""Single-flight registry for coalescing concurrent cache lookups."""
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class InFlightRegistry:
+    """Shares one in-progress awaitable per key between concurrent callers.
+
+    The first caller for a key starts the work; any caller arriving while
+    it is still running awaits the same task instead of starting its own.
+    Once the task finishes the key is released, so later calls start fresh.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the shared result for `key`, starting `factory()` if needed."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            self.started += 1
+            task.add_done_callback(lambda t, k=key: self._release(k, t))
+        else:
+            self.coalesced += 1
+        # Shield so one cancelled waiter does not cancel the fetch for the rest
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Mark the exception as retrieved when every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a fetch for `key` is running, so a run() call would join it."""
+        return key in self._tasks
+
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched."""
+        return len(self._tasks)
+
+    def get_stats(self) -> dict:
+        """Get counters for started and coalesced requests."""
+        return {
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight(),
+        }
@@ -1,139 +1,703 @@
 """Cache manager orchestrating API calls and database caching."""
-from src.api.client import PokeAPIClient
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+import httpx
+
+from src.api.breaker import CircuitOpenError
+from src.api.client import PokeAPIClient, ConditionalResponse
 from src.api.endpoints import (
     pokemon_list_url, pokemon_detail_url, species_url,
-    evolution_chain_url, ability_url, move_url, type_url,
+    evolution_chain_url, ability_url, move_url, type_url, generation_url,
 )
 from src.api.parsers import (
     parse_pokemon_list, parse_pokemon_detail, parse_pokemon_species,
     parse_evolution_chain, parse_ability, parse_move, parse_type_effectiveness,
+    parse_id_from_url, parse_generation, parse_pokemon_form, SchemaError,
 )
-from src.cache.database import CacheDatabase
-from src.models.pokemon import PokemonSummary, PokemonDetail
+from src.cache.database import CacheDatabase, CacheEntry
+from src.cache.inflight import InFlightRegistry
+from src.cache.memory import ModelLRUCache
+from src.cache.metrics import CacheMetrics
+from src.cache.refresh import BackgroundRefresher
+from src.models.pokemon import PokemonSummary, PokemonDetail, PokemonIndexEntry
 from src.models.species import PokemonSpecies
 from src.models.evolution import EvolutionChain
 from src.models.ability import Ability
 from src.models.move import Move
 from src.models.type_info import TypeEffectiveness
+from src.models.generation import Generation
+from src.models.form import PokemonForm
 from src.constants import (
-    CACHE_TTL_POKEMON_DETAIL, CACHE_TTL_SPECIES,
-    CACHE_TTL_EVOLUTION, CACHE_TTL_ABILITY,
+    CACHE_TTL_POKEMON_LIST, CACHE_TTL_POKEMON_DETAIL, CACHE_TTL_SPECIES,
+    CACHE_TTL_EVOLUTION, CACHE_TTL_ABILITY, CACHE_TTL_MOVE,
+    CACHE_TTL_TYPE, CACHE_TTL_FORM, CACHE_TTL_GENERATION,
+    CACHE_HARD_TTL_POKEMON_LIST, CACHE_HARD_TTL_POKEMON_DETAIL, CACHE_HARD_TTL_SPECIES,
+    CACHE_HARD_TTL_EVOLUTION, CACHE_HARD_TTL_ABILITY, CACHE_HARD_TTL_MOVE,
+    CACHE_HARD_TTL_TYPE, CACHE_HARD_TTL_FORM, CACHE_HARD_TTL_GENERATION, CACHE_TTL_MISSING,
+    CACHE_REFRESH_CONCURRENCY, CACHE_REFRESH_MIN_INTERVAL, CACHE_REFRESH_FAILURE_COOLDOWN,
+    L1_CACHE_CAPACITY, L1_CACHE_MAX_BYTES, CACHE_DICTIONARY_MIN_ROWS,
 )
 
+logger = logging.getLogger(__name__)
+
+
+class MissingResourceError(LookupError):
+    """A lookup that recently 404ed or failed validation, served from the negative cache."""
+
+    def __init__(self, kind: str, key: Hashable, reason: str) -> None:
+        super().__init__(f"{kind} {key!r} is unavailable ({reason}); not retrying yet")
+        self.kind = kind
+        self.key = key
+        self.reason = reason
+
+
+def is_unavailable(error: Exception) -> bool:
+    """Whether `error` means the API could not answer, rather than answered no."""
+    if isinstance(error, (CircuitOpenError, httpx.TransportError)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return False
+
 
 class CacheManager:
     """Orchestrates API fetching with SQLite caching.
 
-    All public methods are async. They check the cache first,
-    and only hit the API if the cache is stale or missing.
+    All public methods are async. They check the in-memory cache, then
+    SQLite, and only hit the API if the cache is missing or past its hard
+    expiry. Entries past their regular TTL are returned as-is while a
+    background refresh replaces them. Concurrent lookups for the same
+    resource share a single fetch. Lookups that 404 or fail validation are
+    remembered for CACHE_TTL_MISSING and fail with MissingResourceError
+    until then, without touching the network.
+
+    If the API is unreachable (its circuit is open, the connection fails,
+    or it answers 5xx/429) a lookup falls back to a cached row of any age.
+    `degraded` reports when requests are failing fast.
+
+    Every tier records its outcome and latency per resource kind in
+    `metrics`; get_metrics() reports them with the other cache counters.
     """
 
-    def __init__(self) -> None:
-        self._api = PokeAPIClient()
-        self._db = CacheDatabase()
+    def __init__(
+        self,
+        api_client: PokeAPIClient | None = None,
+        db: CacheDatabase | None = None,
+    ) -> None:
+        # A client passed in is shared, so its owner closes it
+        self._owns_api = api_client is None
+        self._api = api_client or PokeAPIClient()
+        self._db = db or CacheDatabase()
+        self._inflight = InFlightRegistry()
+        self._memory = ModelLRUCache(L1_CACHE_CAPACITY, L1_CACHE_MAX_BYTES)
+        self._refresher = BackgroundRefresher(
+            CACHE_REFRESH_CONCURRENCY,
+            CACHE_REFRESH_MIN_INTERVAL,
+            CACHE_REFRESH_FAILURE_COOLDOWN,
+        )
+        self.metrics = CacheMetrics()
+        # Lookups answered from an expired row because the API was unreachable
+        self._served_expired: set[tuple[str, Hashable]] = set()
         self._initialized = False
 
+    async def _get(
+        self, kind: str, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Serve from the in-memory cache, else coalesce into one fetch."""
+        start = time.perf_counter()
+        model = self._memory.get(kind, key)
+        self.metrics.observe(
+            kind, "l1", "miss" if model is None else "hit", time.perf_counter() - start
+        )
+        if model is not None:
+            return model
+
+        async def load():
+            await self.initialize()
+            start = time.perf_counter()
+            reason = await self._db.get_missing(kind, str(key), CACHE_TTL_MISSING)
+            if reason is not None:
+                self.metrics.observe(kind, "negative", "hit", time.perf_counter() - start)
+                raise MissingResourceError(kind, key, reason)
+            try:
+                model = await fetch()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    await self._remember_missing(kind, key, "HTTP 404")
+                raise
+            except SchemaError as e:
+                await self._remember_missing(kind, key, str(e))
+                raise
+            if (kind, key) in self._served_expired:
+                # Kept out of memory, so the next lookup tries the API again
+                self._served_expired.discard((kind, key))
+            else:
+                # Store before yielding, so a background refresh scheduled by
+                # `fetch` can only invalidate after the stale model is in place
+                self._memory.put(kind, key, model)
+            return model
+
+        if (kind, key) not in self._inflight:
+            return await self._inflight.run((kind, key), load)
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            model = await self._inflight.run((kind, key), load)
+            outcome = "hit"
+            return model
+        finally:
+            self.metrics.observe(kind, "coalesced", outcome, time.perf_counter() - start)
+
+    async def _remember_missing(self, kind: str, key: Hashable, reason: str) -> None:
+        logger.info(f"Caching miss for {kind} {key!r} for {CACHE_TTL_MISSING}s: {reason}")
+        await self._db.save_missing(kind, str(key), reason)
+
     async def initialize(self) -> None:
         if not self._initialized:
-            await self._db.initialize()
+            # Concurrent first lookups must not open the database twice
+            await self._inflight.run("initialize", self._db.initialize)
             self._initialized = True
 
+    def _refresh_if_stale(
+        self,
+        cached_at: float,
+        ttl: float,
+        kind: str,
+        key: Hashable,
+        download: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Schedule a background re-download of an entry older than `ttl`."""
+        if time.time() - cached_at <= ttl:
+            return
+
+        async def refresh():
+            # None means the server confirmed the cached copy (304)
+            if await download() is not None:
+                # The next lookup re-reads the new row instead of the stale model
+                self._memory.invalidate(kind, key)
+
+        self._refresher.schedule((kind, key), refresh)
+
+    async def _download_or_stale(
+        self,
+        kind: str,
+        key: Hashable,
+        download: Callable[[], Awaitable[Any]],
+        expired: Callable[[], Awaitable[Any]],
+        parse: Callable[[Any], Any],
+    ) -> Any:
+        """Download, or fall back to a row past its hard expiry if the API is unreachable."""
+        try:
+            return await download()
+        except Exception as e:
+            if not is_unavailable(e):
+                raise
+            start = time.perf_counter()
+            entry = await expired()
+            if not entry:
+                raise
+            self.metrics.observe(kind, "expired", "hit", time.perf_counter() - start)
+            logger.warning(f"API unavailable, serving expired {kind} {key!r}: {e}")
+            self._served_expired.add((kind, key))
+            return parse(entry)
+
+    async def _lookup(self, kind: str, lookup: Awaitable[Any]) -> Any:
+        """Await a SQLite lookup, recording its latency and whether it hit."""
+        start = time.perf_counter()
+        result = await lookup
+        self.metrics.observe(kind, "sqlite", "hit" if result else "miss", time.perf_counter() - start)
+        return result
+
+    async def _http(
+        self, kind: str, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> ConditionalResponse:
+        """Conditional GET of `url`, recording its latency and outcome."""
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await self._api.get_json_conditional(url, etag, last_modified)
+            outcome = "not_modified" if response.not_modified else "ok"
+            return response
+        finally:
+            self.metrics.observe(kind, "http", outcome, time.perf_counter() - start)
+
+    async def _request(self, kind: str, url: str, cached: CacheEntry | None) -> ConditionalResponse:
+        """GET `url`, revalidating with the cached entry's validators if any."""
+        if cached is None:
+            return await self._http(kind, url)
+        return await self._http(kind, url, cached.etag, cached.last_modified)
+
     async def get_pokemon_list(self) -> list[PokemonSummary]:
         """Get the full Pokemon list (cached)."""
         await self.initialize()
-        cached = await self._db.get_pokemon_list()
+        cached = await self._lookup(
+            "pokemon_list", self._db.get_pokemon_list(CACHE_HARD_TTL_POKEMON_LIST)
+        )
         if cached:
-            return [
-                PokemonSummary(id=p["id"], name=p["name"], url=p["url"])
-                for p in cached
-            ]
-        data = await self._api.get_json(pokemon_list_url(limit=2000))
-        summaries = parse_pokemon_list(data)
+            cached_at = float(await self._db.get_meta("cached_at") or 0)
+            self._refresh_if_stale(
+                cached_at, CACHE_TTL_POKEMON_LIST, "pokemon_list", None,
+                lambda: self._download_pokemon_list(revalidate=True),
+            )
+            return self._summaries(cached)
+        return await self._download_or_stale(
+            "pokemon_list", None, self._download_pokemon_list,
+            lambda: self._db.get_pokemon_list(float("inf")), self._summaries,
+        )
+
+    @staticmethod
+    def _summaries(rows: list[dict]) -> list[PokemonSummary]:
+        return [PokemonSummary(id=p["id"], name=p["name"], url=p["url"]) for p in rows]
+
+    async def _download_pokemon_list(self, revalidate: bool = False) -> list[PokemonSummary] | None:
+        etag = last_modified = None
+        if revalidate:
+            etag = await self._db.get_meta("pokemon_list_etag")
+            last_modified = await self._db.get_meta("pokemon_list_last_modified")
+        response = await self._http(
+            "pokemon_list", pokemon_list_url(limit=2000), etag, last_modified
+        )
+        if response.not_modified:
+            await self._db.set_meta("cached_at", str(time.time()))
+            return None
+        summaries = parse_pokemon_list(response.body)
         await self._db.save_pokemon_list(
             [{"id": s.id, "name": s.name, "url": s.url} for s in summaries]
         )
+        for key, value in (
+            ("pokemon_list_etag", response.etag),
+            ("pokemon_list_last_modified", response.last_modified),
+        ):
+            await self._db.set_meta(key, value or "")
         return summaries
 
     async def get_pokemon_detail(self, pokemon_id: int) -> PokemonDetail:
         """Get full Pokemon detail (cached)."""
-        await self.initialize()
-        cached = await self._db.get_cached_json(
-            "pokemon_detail", pokemon_id, CACHE_TTL_POKEMON_DETAIL
+        return await self._get(
+            "pokemon_detail", pokemon_id, lambda: self._fetch_pokemon_detail(pokemon_id)
         )
+
+    async def _fetch_pokemon_detail(self, pokemon_id: int) -> PokemonDetail:
+        await self.initialize()
+        cached = await self._lookup("pokemon_detail", self._db.get_cached_entry(
+            "pokemon_detail", pokemon_id, CACHE_HARD_TTL_POKEMON_DETAIL
+        ))
         if cached:
-            return parse_pokemon_detail(cached)
-        data = await self._api.get_json(pokemon_detail_url(pokemon_id))
-        await self._db.save_cached_json("pokemon_detail", pokemon_id, data)
-        return parse_pokemon_detail(data)
+            self._refresh_if_stale(
+                cached.cached_at, CACHE_TTL_POKEMON_DETAIL, "pokemon_detail", pokemon_id,
+                lambda: self._download_pokemon_detail(pokemon_id, cached),
+            )
+            return parse_pokemon_detail(cached.data, validate=not cached.validated)
+        return await self._download_or_stale(
+            "pokemon_detail", pokemon_id, lambda: self._download_pokemon_detail(pokemon_id),
+            lambda: self._db.get_cached_entry("pokemon_detail", pokemon_id, float("inf")),
+            lambda entry: parse_pokemon_detail(entry.data, validate=not entry.validated),
+        )
+
+    async def _download_pokemon_detail(
+        self, pokemon_id: int, cached: CacheEntry | None = None
+    ) -> PokemonDetail | None:
+        response = await self._request("pokemon_detail", pokemon_detail_url(pokemon_id), cached)
+        if response.not_modified:
+            await self._db.touch_cached_entry("pokemon_detail", item_id=pokemon_id)
+            return None
+        data = response.body
+        detail = parse_pokemon_detail(data)
+        await self._db.save_cached_json(
+            "pokemon_detail", pokemon_id, data, validated=True,
+            etag=response.etag, last_modified=response.last_modified,
+        )
+        await self._db.upsert_index_detail(
+            detail.id,
+            detail.name,
+            detail.species_id,
+            [t.name for t in sorted(detail.types, key=lambda t: t.slot)],
+            {s.name: s.base_stat for s in detail.stats},
+        )
+        return detail
 
     async def get_species(self, pokemon_id: int) -> PokemonSpecies:
         """Get Pokemon species data (cached)."""
-        await self.initialize()
-        cached = await self._db.get_cached_json(
-            "pokemon_species", pokemon_id, CACHE_TTL_SPECIES
+        return await self._get(
+            "pokemon_species", pokemon_id, lambda: self._fetch_species(pokemon_id)
         )
+
+    async def _fetch_species(self, pokemon_id: int) -> PokemonSpecies:
+        await self.initialize()
+        cached = await self._lookup("pokemon_species", self._db.get_cached_entry(
+            "pokemon_species", pokemon_id, CACHE_HARD_TTL_SPECIES
+        ))
         if cached:
-            return parse_pokemon_species(cached)
-        data = await self._api.get_json(species_url(pokemon_id))
-        await self._db.save_cached_json("pokemon_species", pokemon_id, data)
-        return parse_pokemon_species(data)
+            self._refresh_if_stale(
+                cached.cached_at, CACHE_TTL_SPECIES, "pokemon_species", pokemon_id,
+                lambda: self._download_species(pokemon_id, cached),
+            )
+            return parse_pokemon_species(cached.data, validate=not cached.validated)
+        return await self._download_or_stale(
+            "pokemon_species", pokemon_id, lambda: self._download_species(pokemon_id),
+            lambda: self._db.get_cached_entry("pokemon_species", pokemon_id, float("inf")),
+            lambda entry: parse_pokemon_species(entry.data, validate=not entry.validated),
+        )
+
+    async def _download_species(
+        self, pokemon_id: int, cached: CacheEntry | None = None
+    ) -> PokemonSpecies | None:
+        response = await self._request("pokemon_species", species_url(pokemon_id), cached)
+        if response.not_modified:
+            await self._db.touch_cached_entry("pokemon_species", item_id=pokemon_id)
+            return None
+        data = response.body
+        species = parse_pokemon_species(data)
+        await self._db.save_cached_json(
+            "pokemon_species", pokemon_id, data, validated=True,
+            etag=response.etag, last_modified=response.last_modified,
+        )
+        await self._db.upsert_index_species_generation(
+            species.id, species.generation, name=species.name
+        )
+        return species
 
     async def get_evolution_chain(self, chain_id: int) -> EvolutionChain:
         """Get evolution chain (cached)."""
-        await self.initialize()
-        cached = await self._db.get_cached_json(
-            "evolution_chain", chain_id, CACHE_TTL_EVOLUTION
+        return await self._get(
+            "evolution_chain", chain_id, lambda: self._fetch_evolution_chain(chain_id)
         )
+
+    async def _fetch_evolution_chain(self, chain_id: int) -> EvolutionChain:
+        await self.initialize()
+        cached = await self._lookup("evolution_chain", self._db.get_cached_entry(
+            "evolution_chain", chain_id, CACHE_HARD_TTL_EVOLUTION
+        ))
         if cached:
-            return parse_evolution_chain(cached)
-        data = await self._api.get_json(evolution_chain_url(chain_id))
-        await self._db.save_cached_json("evolution_chain", chain_id, data)
-        return parse_evolution_chain(data)
+            self._refresh_if_stale(
+                cached.cached_at, CACHE_TTL_EVOLUTION, "evolution_chain", chain_id,
+                lambda: self._download_evolution_chain(chain_id, cached),
+            )
+            return parse_evolution_chain(cached.data)
+        return await self._download_or_stale(
+            "evolution_chain", chain_id, lambda: self._download_evolution_chain(chain_id),
+            lambda: self._db.get_cached_entry("evolution_chain", chain_id, float("inf")),
+            lambda entry: parse_evolution_chain(entry.data),
+        )
+
+    async def _download_evolution_chain(
+        self, chain_id: int, cached: CacheEntry | None = None
+    ) -> EvolutionChain | None:
+        response = await self._request("evolution_chain", evolution_chain_url(chain_id), cached)
+        if response.not_modified:
+            await self._db.touch_cached_entry("evolution_chain", item_id=chain_id)
+            return None
+        data = response.body
+        chain = parse_evolution_chain(data)
+        await self._db.save_cached_json(
+            "evolution_chain", chain_id, data, validated=True,
+            etag=response.etag, last_modified=response.last_modified,
+        )
+        return chain
 
     async def get_ability(self, ability_name: str) -> Ability:
         """Get ability details (cached)."""
+        return await self._get(
+            "ability", ability_name, lambda: self._fetch_ability(ability_name)
+        )
+
+    async def _fetch_ability(self, ability_name: str) -> Ability:
         await self.initialize()
-        data = await self._api.get_json(ability_url(ability_name))
+        cached = await self._lookup("ability", self._db.get_cached_entry_by_name(
+            "ability", ability_name, CACHE_HARD_TTL_ABILITY
+        ))
+        if cached:
+            self._refresh_if_stale(
+                cached.cached_at, CACHE_TTL_ABILITY, "ability", ability_name,
+                lambda: self._download_ability(ability_name, cached),
+            )
+            return parse_ability(cached.data, validate=not cached.validated)
+        return await self._download_or_stale(
+            "ability", ability_name, lambda: self._download_ability(ability_name),
+            lambda: self._db.get_cached_entry_by_name("ability", ability_name, float("inf")),
+            lambda entry: parse_ability(entry.data, validate=not entry.validated),
+        )
+
+    async def _download_ability(
+        self, ability_name: str, cached: CacheEntry | None = None
+    ) -> Ability | None:
+        response = await self._request("ability", ability_url(ability_name), cached)
+        if response.not_modified:
+            await self._db.touch_cached_entry("ability", name=ability_name)
+            return None
+        data = response.body
         ability = parse_ability(data)
         await self._db.save_cached_json(
-            "ability", ability.id, data, name=ability_name
+            "ability", ability.id, data, name=ability_name,
+            validated=True,
+            etag=response.etag, last_modified=response.last_modified,
         )
         return ability
 
     async def get_move(self, move_name: str) -> Move:
         """Get move details (cached)."""
+        return await self._get(
+            "move", move_name, lambda: self._fetch_move(move_name)
+        )
+
+    async def _fetch_move(self, move_name: str) -> Move:
         await self.initialize()
-        data = await self._api.get_json(move_url(move_name))
+        cached = await self._lookup("move", self._db.get_cached_entry_by_name(
+            "move", move_name, CACHE_HARD_TTL_MOVE
+        ))
+        if cached:
+            self._refresh_if_stale(
+                cached.cached_at, CACHE_TTL_MOVE, "move", move_name,
+                lambda: self._download_move(move_name, cached),
+            )
+            return parse_move(cached.data, validate=not cached.validated)
+        return await self._download_or_stale(
+            "move", move_name, lambda: self._download_move(move_name),
+            lambda: self._db.get_cached_entry_by_name("move", move_name, float("inf")),
+            lambda entry: parse_move(entry.data, validate=not entry.validated),
+        )
+
+    async def _download_move(
+        self, move_name: str, cached: CacheEntry | None = None
+    ) -> Move | None:
+        response = await self._request("move", move_url(move_name), cached)
+        if response.not_modified:
+            await self._db.touch_cached_entry("move", name=move_name)
+            return None
+        data = response.body
         move = parse_move(data)
         await self._db.save_cached_json(
-            "move", move.id, data, name=move_name
+            "move", move.id, data, name=move_name,
+            validated=True,
+            etag=response.etag, last_modified=response.last_modified,
         )
         return move
 
     async def get_type(self, type_name: str) -> TypeEffectiveness:
         """Get type effectiveness data (cached)."""
+        return await self._get(
+            "type", type_name, lambda: self._fetch_type(type_name)
+        )
+
+    async def _fetch_type(self, type_name: str) -> TypeEffectiveness:
         await self.initialize()
-        data = await self._api.get_json(type_url(type_name))
+        cached = await self._lookup("type", self._db.get_cached_entry_by_name(
+            "type", type_name, CACHE_HARD_TTL_TYPE
+        ))
+        if cached:
+            self._refresh_if_stale(
+                cached.cached_at, CACHE_TTL_TYPE, "type", type_name,
+                lambda: self._download_type(type_name, cached),
+            )
+            return parse_type_effectiveness(cached.data)
+        return await self._download_or_stale(
+            "type", type_name, lambda: self._download_type(type_name),
+            lambda: self._db.get_cached_entry_by_name("type", type_name, float("inf")),
+            lambda entry: parse_type_effectiveness(entry.data),
+        )
+
+    async def _download_type(
+        self, type_name: str, cached: CacheEntry | None = None
+    ) -> TypeEffectiveness | None:
+        response = await self._request("type", type_url(type_name), cached)
+        if response.not_modified:
+            await self._db.touch_cached_entry("type", name=type_name)
+            return None
+        data = response.body
         type_eff = parse_type_effectiveness(data)
         await self._db.save_cached_json(
-            "type", type_eff.id, data, name=type_name
+            "type", type_eff.id, data, name=type_name,
+            validated=True,
+            etag=response.etag, last_modified=response.last_modified,
         )
         return type_eff
 
-    async def get_pokemon_form(self, form_url: str) -> 'PokemonForm':
+    async def get_generation(self, generation_name: str) -> Generation:
+        """Get generation membership data (cached)."""
+        return await self._get(
+            "generation", generation_name, lambda: self._fetch_generation(generation_name)
+        )
+
+    async def _fetch_generation(self, generation_name: str) -> Generation:
+        await self.initialize()
+        cached = await self._lookup("generation", self._db.get_cached_entry_by_name(
+            "generation", generation_name, CACHE_HARD_TTL_GENERATION
+        ))
+        if cached:
+            self._refresh_if_stale(
+                cached.cached_at, CACHE_TTL_GENERATION, "generation", generation_name,
+                lambda: self._download_generation(generation_name, cached),
+            )
+            return parse_generation(cached.data)
+        return await self._download_or_stale(
+            "generation", generation_name, lambda: self._download_generation(generation_name),
+            lambda: self._db.get_cached_entry_by_name("generation", generation_name, float("inf")),
+            lambda entry: parse_generation(entry.data),
+        )
+
+    async def _download_generation(
+        self, generation_name: str, cached: CacheEntry | None = None
+    ) -> Generation | None:
+        response = await self._request("generation", generation_url(generation_name), cached)
+        if response.not_modified:
+            await self._db.touch_cached_entry("generation", name=generation_name)
+            return None
+        data = response.body
+        generation = parse_generation(data)
+        await self._db.save_cached_json(
+            "generation", generation.id, data, name=generation_name,
+            validated=True,
+            etag=response.etag, last_modified=response.last_modified,
+        )
+        return generation
+
+    async def get_pokemon_form(self, form_url: str) -> PokemonForm:
         """Get Pokemon form details (cached)."""
-        from src.models.form import PokemonForm
-        from src.api.parsers import parse_pokemon_form
+        return await self._get(
+            "form", form_url, lambda: self._fetch_pokemon_form(form_url)
+        )
 
+    async def _fetch_pokemon_form(self, form_url: str) -> PokemonForm:
         await self.initialize()
-        data = await self._api.get_json(form_url)
+        # Form URLs end in the numeric form id, which is the table key
+        cached = await self._lookup("form", self._db.get_cached_entry(
+            "form", parse_id_from_url(form_url), CACHE_HARD_TTL_FORM
+        ))
+        if cached:
+            self._refresh_if_stale(
+                cached.cached_at, CACHE_TTL_FORM, "form", form_url,
+                lambda: self._download_pokemon_form(form_url, cached),
+            )
+            return parse_pokemon_form(cached.data)
+        return await self._download_or_stale(
+            "form", form_url, lambda: self._download_pokemon_form(form_url),
+            lambda: self._db.get_cached_entry("form", parse_id_from_url(form_url), float("inf")),
+            lambda entry: parse_pokemon_form(entry.data),
+        )
+
+    async def _download_pokemon_form(
+        self, form_url: str, cached: CacheEntry | None = None
+    ) -> PokemonForm | None:
+        response = await self._request("form", form_url, cached)
+        if response.not_modified:
+            await self._db.touch_cached_entry("form", item_id=parse_id_from_url(form_url))
+            return None
+        data = response.body
         form = parse_pokemon_form(data)
         await self._db.save_cached_json(
-            "form", form.id, data, name=form.name
+            "form", form.id, data, name=form.name,
+            validated=True,
+            etag=response.etag, last_modified=response.last_modified,
         )
         return form
 
+    async def get_pokemon_index(self) -> list[PokemonIndexEntry]:
+        """Get the precomputed list index in a single query."""
+        await self.initialize()
+        entries = []
+        for row in await self._db.get_pokemon_index():
+            stats = {
+                "hp": row["hp"],
+                "attack": row["attack"],
+                "defense": row["defense"],
+                "special-attack": row["special_attack"],
+                "special-defense": row["special_defense"],
+                "speed": row["speed"],
+            }
+            entries.append(PokemonIndexEntry(
+                id=row["id"],
+                name=row["name"],
+                types=row["types"].split(",") if row["types"] else [],
+                generation=row["generation"],
+                base_stat_total=row["base_stat_total"],
+                stats={k: v for k, v in stats.items() if v is not None},
+            ))
+        return entries
+
+    async def save_index_metadata(
+        self, types: dict[int, list[str]], generations: dict[int, str]
+    ) -> None:
+        """Persist type/generation data keyed by Pokemon id into the list index."""
+        await self.initialize()
+        if types or generations:
+            await self._db.upsert_index_metadata(types, generations)
+
+    async def get_meta(self, key: str) -> str | None:
+        """Get a stored metadata value (e.g. a warm-up checkpoint)."""
+        await self.initialize()
+        return await self._db.get_meta(key)
+
+    async def set_meta(self, key: str, value: str) -> None:
+        """Store a metadata value."""
+        await self.initialize()
+        await self._db.set_meta(key, value)
+
+    async def optimize_storage(self) -> dict:
+        """Bring stored rows up to the configured codec and report storage use.
+
+        Trains a compression dictionary once enough rows are cached, then
+        re-encodes rows written with an older codec (e.g. plain JSON from
+        earlier versions), then evicts rows past the byte budgets. Rows
+        stay readable throughout.
+        """
+        await self.initialize()
+        report = await self._db.storage_report()
+        cached_rows = sum(t["rows"] for t in report["tables"].values())
+        if (
+            await self._db.get_meta("storage_dictionary_id") is None
+            and cached_rows >= CACHE_DICTIONARY_MIN_ROWS
+        ):
+            await self._db.train_storage_dictionary()
+        migrated = await self._db.migrate_storage()
+        evicted = await self._db.enforce_budget()
+        await self._db.purge_missing(CACHE_TTL_MISSING)
+        report = await self._db.storage_report()
+        report["migrated"] = migrated
+        report["evicted"] = evicted
+        return report
+
+    async def enforce_budget(self) -> dict:
+        """Evict least recently used rows past the cache's byte budgets."""
+        await self.initialize()
+        return await self._db.enforce_budget()
+
+    def get_inflight_stats(self) -> dict:
+        """Get request coalescing counters."""
+        return self._inflight.get_stats()
+
+    def get_memory_stats(self) -> dict:
+        """Get in-memory model cache usage and hit/miss/eviction counters."""
+        return self._memory.get_stats()
+
+    def get_write_stats(self) -> dict:
+        """Get write-behind queue depth and flush counters."""
+        return self._db.get_write_stats()
+
+    def get_refresh_stats(self) -> dict:
+        """Get background refresh counters."""
+        return self._refresher.get_stats()
+
+    @property
+    def degraded(self) -> bool:
+        """Whether the API is being skipped because its circuit breaker is open."""
+        return self._api.is_degraded()
+
+    def get_metrics(self) -> dict:
+        """Get per-tier outcome counters and latencies with every other cache counter."""
+        return {
+            "tiers": self.metrics.snapshot(),
+            "memory": self.get_memory_stats(),
+            "inflight": self.get_inflight_stats(),
+            "writes": self.get_write_stats(),
+            "refresh": self.get_refresh_stats(),
+            "http": self._api.get_stats(),
+        }
+
     async def close(self) -> None:
         """Clean up resources."""
-        await self._api.close()
+        await self._refresher.close()
+        if self._owns_api:
+            await self._api.close()
         await self._db.close()
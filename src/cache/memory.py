@@ -0,0 +1,127 @@
+"""In-process LRU cache of parsed model dataclasses."""
+import sys
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from typing import Any, Hashable
+
+
+def estimate_size(obj: Any) -> int:
+    """Approximate memory footprint of a model in bytes.
+
+    Walks dataclasses, lists, tuples and dicts; shared objects are counted once.
+    """
+    seen: set[int] = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if is_dataclass(item) and not isinstance(item, type):
+            stack.extend(getattr(item, f.name) for f in fields(item))
+        elif isinstance(item, (list, tuple, set)):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+    return total
+
+
+class ModelLRUCache:
+    """Bounded LRU of parsed models, partitioned by resource kind.
+
+    Each kind has its own entry limit, and all kinds share an approximate
+    byte budget. When either is exceeded the least recently used entries
+    are evicted (from the same kind for the entry limit, globally for bytes).
+    """
+
+    def __init__(
+        self,
+        capacities: dict[str, int],
+        max_bytes: int,
+        default_capacity: int = 64,
+    ) -> None:
+        self._capacities = dict(capacities)
+        self._default_capacity = default_capacity
+        self._max_bytes = max_bytes
+        # Global recency order across kinds: (kind, key) -> (model, size)
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[Any, int]] = OrderedDict()
+        self._counts: dict[str, int] = {}
+        self._bytes = 0
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self._evictions: dict[str, int] = {}
+
+    def get(self, kind: str, key: Hashable) -> Any | None:
+        """Return the cached model or None, updating recency on a hit."""
+        entry = self._entries.get((kind, key))
+        if entry is None:
+            self._misses[kind] = self._misses.get(kind, 0) + 1
+            return None
+        self._entries.move_to_end((kind, key))
+        self._hits[kind] = self._hits.get(kind, 0) + 1
+        return entry[0]
+
+    def put(self, kind: str, key: Hashable, model: Any) -> None:
+        """Insert or replace a model, then enforce the kind and byte limits."""
+        capacity = self._capacities.get(kind, self._default_capacity)
+        if capacity <= 0:
+            return
+        existing = self._entries.get((kind, key))
+        if existing is not None and existing[0] is model:
+            self._entries.move_to_end((kind, key))
+            return
+        size = estimate_size(model)
+        if size > self._max_bytes:
+            return
+
+        self._remove((kind, key))
+        self._entries[(kind, key)] = (model, size)
+        self._counts[kind] = self._counts.get(kind, 0) + 1
+        self._bytes += size
+
+        while self._counts[kind] > capacity:
+            oldest = next(k for k in self._entries if k[0] == kind)
+            self._evict(oldest)
+        while self._bytes > self._max_bytes:
+            self._evict(next(iter(self._entries)))
+
+    def invalidate(self, kind: str, key: Hashable) -> None:
+        """Drop one entry, e.g. after the underlying row was refreshed."""
+        self._remove((kind, key))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._counts.clear()
+        self._bytes = 0
+
+    def _evict(self, entry_key: tuple[str, Hashable]) -> None:
+        kind = entry_key[0]
+        self._remove(entry_key)
+        self._evictions[kind] = self._evictions.get(kind, 0) + 1
+
+    def _remove(self, entry_key: tuple[str, Hashable]) -> None:
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._counts[entry_key[0]] -= 1
+            self._bytes -= entry[1]
+
+    def get_stats(self) -> dict:
+        """Get size, byte usage and hit/miss/eviction counters per kind."""
+        kinds = set(self._counts) | set(self._hits) | set(self._misses)
+        return {
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "kinds": {
+                kind: {
+                    "entries": self._counts.get(kind, 0),
+                    "capacity": self._capacities.get(kind, self._default_capacity),
+                    "hits": self._hits.get(kind, 0),
+                    "misses": self._misses.get(kind, 0),
+                    "evictions": self._evictions.get(kind, 0),
+                }
+                for kind in sorted(kinds)
+            },
+        }
@@ -0,0 +1,68 @@
+"""Build list filter metadata from bulk /type and /generation resources."""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+from src.cache.manager import CacheManager
+from src.constants import TYPE_COLORS, GENERATION_MAP
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class FilterMetadata:
+    """Type and generation lookups for the Pokemon list filters."""
+    types: dict[int, list[str]] = field(default_factory=dict)        # pokemon id -> type names
+    generations: dict[int, str] = field(default_factory=dict)        # species id -> generation
+    failed: list[str] = field(default_factory=list)                  # resources that could not load
+
+
+class FilterMetadataLoader:
+    """Loads filter metadata from 18 type and 9 generation resources.
+
+    Each /type/{name} response lists every Pokemon with that type, and each
+    /generation/{name} response lists every species introduced in it, so a
+    few dozen requests replace one detail and one species fetch per Pokemon.
+    Generation membership is keyed by species id, which equals the Pokemon
+    id for default forms; alternate forms are left for per-Pokemon lookup.
+    """
+
+    def __init__(self, cache: CacheManager) -> None:
+        self._cache = cache
+
+    async def load(self) -> FilterMetadata:
+        """Fetch all type and generation resources concurrently."""
+        type_names = list(TYPE_COLORS.keys())
+        generation_names = list(GENERATION_MAP.keys())
+
+        results = await asyncio.gather(
+            *(self._cache.get_type(name) for name in type_names),
+            *(self._cache.get_generation(name) for name in generation_names),
+            return_exceptions=True,
+        )
+        type_results = results[:len(type_names)]
+        generation_results = results[len(type_names):]
+
+        metadata = FilterMetadata()
+        slotted: dict[int, list[tuple[int, str]]] = {}
+
+        for name, result in zip(type_names, type_results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to load type {name}: {result}")
+                metadata.failed.append(f"type/{name}")
+                continue
+            for member in result.pokemon:
+                slotted.setdefault(member.pokemon_id, []).append((member.slot, name))
+
+        for pokemon_id, entries in slotted.items():
+            metadata.types[pokemon_id] = [name for _, name in sorted(entries)]
+
+        for name, result in zip(generation_names, generation_results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to load generation {name}: {result}")
+                metadata.failed.append(f"generation/{name}")
+                continue
+            for species_id in result.species_ids:
+                metadata.generations[species_id] = result.name
+
+        return metadata
@@ -0,0 +1,93 @@
+"""Outcome counters and latency histograms per resource kind and cache tier."""
+import bisect
+import math
+
+from src.constants import METRICS_LATENCY_BUCKETS_MS
+
+
+class LatencyHistogram:
+    """Counts latencies into fixed buckets, so memory stays constant.
+
+    Percentiles are estimated as the upper bound of the bucket holding
+    them, capped at the largest latency seen.
+    """
+
+    def __init__(self, bounds_ms: tuple[float, ...] = METRICS_LATENCY_BUCKETS_MS) -> None:
+        self._bounds = tuple(bounds_ms)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self._counts[bisect.bisect_left(self._bounds, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """Estimated latency in ms below which a `q` fraction of samples fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                break
+        if index == len(self._bounds):
+            return self.max_ms
+        return min(self._bounds[index], self.max_ms)
+
+    def to_dict(self) -> dict:
+        buckets = {
+            str(bound): count
+            for bound, count in zip(self._bounds + ("inf",), self._counts)
+            if count
+        }
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p90_ms": self.percentile(0.9),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": buckets,
+        }
+
+
+class CacheMetrics:
+    """Records how each lookup was served and how long it took.
+
+    Samples are keyed by resource kind (e.g. "move") and tier: "l1" for
+    the in-memory model cache, "coalesced" for callers that joined a fetch
+    already in flight, "negative" for known-missing resources, "sqlite"
+    for the database lookup, "http" for network requests and "expired"
+    for rows served past their hard expiry while the API was unreachable.
+    Each key has counters per outcome ("hit", "miss", "ok", "error", ...)
+    and one latency histogram.
+    """
+
+    def __init__(self) -> None:
+        self._outcomes: dict[tuple[str, str], dict[str, int]] = {}
+        self._latency: dict[tuple[str, str], LatencyHistogram] = {}
+
+    def observe(self, kind: str, tier: str, outcome: str, seconds: float) -> None:
+        key = (kind, tier)
+        outcomes = self._outcomes.setdefault(key, {})
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        histogram = self._latency.get(key)
+        if histogram is None:
+            histogram = self._latency[key] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def snapshot(self) -> dict:
+        """Counters and latency summaries as {kind: {tier: {...}}}."""
+        result: dict[str, dict] = {}
+        for kind, tier in sorted(self._outcomes):
+            result.setdefault(kind, {})[tier] = {
+                "outcomes": dict(self._outcomes[(kind, tier)]),
+                "latency": self._latency[(kind, tier)].to_dict(),
+            }
+        return result
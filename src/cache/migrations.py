@@ -0,0 +1,292 @@
+"""Versioned schema migrations for the cache database.
+
+Each database records the migrations applied to it in `schema_version`.
+On open, every migration newer than the recorded version runs in order.
+Databases created before versioning start at version 0; since they may
+already have some of the later columns, every migration is written to be
+safe on a database that already has its changes. A migration that
+rewrites rows does so in batches, committing each, so a large cache is
+upgraded in place without one long transaction, and an interrupted
+upgrade resumes on the next start.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import aiosqlite
+
+from src.constants import MIGRATION_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Tables holding one cached API payload per row
+JSON_TABLES = (
+    "pokemon_detail", "pokemon_species", "evolution_chain",
+    "ability", "move", "type", "form", "generation",
+)
+
+RowProgress = Callable[[int], None]
+
+
+@dataclass(slots=True)
+class Migration:
+    """One schema step; `apply` gets the connection and a rows-done callback."""
+    version: int
+    description: str
+    apply: Callable[[aiosqlite.Connection, RowProgress], Awaitable[None]]
+
+
+ProgressCallback = Callable[[Migration, int], None]
+
+
+async def add_column(conn: aiosqlite.Connection, table: str, column: str, decl: str) -> None:
+    """Add a column unless the table already has it."""
+    async with conn.execute(f"PRAGMA table_info({table})") as cursor:
+        columns = {row[1] for row in await cursor.fetchall()}
+    if column not in columns:
+        await conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+async def update_in_batches(
+    conn: aiosqlite.Connection,
+    table: str,
+    assignment: str,
+    where: str,
+    on_progress: RowProgress | None = None,
+    batch_size: int = MIGRATION_BATCH_SIZE,
+) -> int:
+    """Run `UPDATE table SET assignment WHERE where` in id-ordered batches.
+
+    Each batch is committed on its own. `where` must stop matching a row
+    once it is updated, so a rerun after an interruption picks up only
+    the rows still left. Returns the number of rows updated.
+    """
+    total = 0
+    last_id = -1
+    while True:
+        async with conn.execute(
+            f"SELECT id FROM {table} WHERE ({where}) AND id > ? ORDER BY id LIMIT ?",
+            (last_id, batch_size),
+        ) as cursor:
+            ids = [row[0] for row in await cursor.fetchall()]
+        if not ids:
+            return total
+        cursor = await conn.execute(
+            f"UPDATE {table} SET {assignment} WHERE ({where}) AND id BETWEEN ? AND ?",
+            (ids[0], ids[-1]),
+        )
+        await conn.commit()
+        total += cursor.rowcount
+        last_id = ids[-1]
+        if on_progress:
+            on_progress(total)
+
+
+async def _base_tables(conn: aiosqlite.Connection, on_progress: RowProgress) -> None:
+    await conn.executescript("""
+        CREATE TABLE IF NOT EXISTS pokemon_list (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            url TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS pokemon_list_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS pokemon_detail (
+            id INTEGER PRIMARY KEY,
+            data_json TEXT NOT NULL,
+            cached_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS pokemon_species (
+            id INTEGER PRIMARY KEY,
+            data_json TEXT NOT NULL,
+            cached_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS evolution_chain (
+            id INTEGER PRIMARY KEY,
+            data_json TEXT NOT NULL,
+            cached_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS ability (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            data_json TEXT NOT NULL,
+            cached_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS move (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            data_json TEXT NOT NULL,
+            cached_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS type (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            data_json TEXT NOT NULL,
+            cached_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS form (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            data_json TEXT NOT NULL,
+            cached_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_pokemon_list_name ON pokemon_list(name);
+        CREATE INDEX IF NOT EXISTS idx_ability_name ON ability(name);
+        CREATE INDEX IF NOT EXISTS idx_move_name ON move(name);
+        CREATE INDEX IF NOT EXISTS idx_type_name ON type(name);
+        CREATE INDEX IF NOT EXISTS idx_form_name ON form(name);
+    """)
+
+
+async def _generation_table(conn: aiosqlite.Connection, on_progress: RowProgress) -> None:
+    await conn.executescript("""
+        CREATE TABLE IF NOT EXISTS generation (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            data_json TEXT NOT NULL,
+            cached_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_generation_name ON generation(name);
+    """)
+
+
+async def _validated_column(conn: aiosqlite.Connection, on_progress: RowProgress) -> None:
+    for table in JSON_TABLES:
+        await add_column(conn, table, "validated", "INTEGER NOT NULL DEFAULT 0")
+
+
+async def _pokemon_index(conn: aiosqlite.Connection, on_progress: RowProgress) -> None:
+    await conn.executescript("""
+        CREATE TABLE IF NOT EXISTS pokemon_index (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            species_id INTEGER,
+            types TEXT,
+            generation TEXT,
+            base_stat_total INTEGER,
+            hp INTEGER,
+            attack INTEGER,
+            defense INTEGER,
+            special_attack INTEGER,
+            special_defense INTEGER,
+            speed INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_pokemon_index_species
+            ON pokemon_index(species_id);
+    """)
+
+
+async def _storage_codec(conn: aiosqlite.Connection, on_progress: RowProgress) -> None:
+    for table in JSON_TABLES:
+        await add_column(conn, table, "codec", "TEXT NOT NULL DEFAULT 'json'")
+    await conn.executescript("""
+        CREATE TABLE IF NOT EXISTS storage_dictionary (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            codec TEXT NOT NULL,
+            data BLOB NOT NULL,
+            created_at REAL NOT NULL
+        );
+    """)
+
+
+async def _http_validators(conn: aiosqlite.Connection, on_progress: RowProgress) -> None:
+    for table in JSON_TABLES:
+        await add_column(conn, table, "etag", "TEXT")
+        await add_column(conn, table, "last_modified", "TEXT")
+
+
+async def _last_accessed(conn: aiosqlite.Connection, on_progress: RowProgress) -> None:
+    done = 0
+    for table in JSON_TABLES:
+        await add_column(conn, table, "last_accessed", "REAL")
+        # Rows cached before access tracking count as last used when cached
+        done += await update_in_batches(
+            conn, table, "last_accessed = cached_at", "last_accessed IS NULL",
+            on_progress=lambda rows: on_progress(done + rows),
+        )
+
+
+async def _incremental_vacuum(conn: aiosqlite.Connection, on_progress: RowProgress) -> None:
+    async with conn.execute("PRAGMA auto_vacuum") as cursor:
+        (mode,) = await cursor.fetchone()
+    if mode != 2:  # INCREMENTAL
+        await conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        # Switching modes only takes effect once the file is rebuilt
+        await conn.execute("VACUUM")
+
+
+async def _missing_resources(conn: aiosqlite.Connection, on_progress: RowProgress) -> None:
+    await conn.executescript("""
+        CREATE TABLE IF NOT EXISTS missing_resource (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            reason TEXT NOT NULL,
+            cached_at REAL NOT NULL,
+            PRIMARY KEY (kind, key)
+        );
+    """)
+
+
+# Append only: never edit or reorder a migration that has shipped
+MIGRATIONS: list[Migration] = [
+    Migration(1, "base tables", _base_tables),
+    Migration(2, "generation table", _generation_table),
+    Migration(3, "validated flag on cached payloads", _validated_column),
+    Migration(4, "pokemon list index", _pokemon_index),
+    Migration(5, "storage codec and compression dictionaries", _storage_codec),
+    Migration(6, "HTTP validators for revalidation", _http_validators),
+    Migration(7, "last access time for LRU eviction", _last_accessed),
+    Migration(8, "incremental auto-vacuum", _incremental_vacuum),
+    Migration(9, "negative cache of missing resources", _missing_resources),
+]
+
+
+async def schema_version(conn: aiosqlite.Connection) -> int:
+    """Latest migration applied to the database, or 0 if none is recorded."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at REAL NOT NULL
+        )
+    """)
+    async with conn.execute("SELECT MAX(version) FROM schema_version") as cursor:
+        (version,) = await cursor.fetchone()
+    return version or 0
+
+
+async def run_migrations(
+    conn: aiosqlite.Connection,
+    migrations: list[Migration] = MIGRATIONS,
+    on_progress: ProgressCallback | None = None,
+) -> list[int]:
+    """Apply every migration newer than the database; return the versions applied."""
+    current = await schema_version(conn)
+    latest = max((m.version for m in migrations), default=0)
+    if current > latest:
+        raise RuntimeError(
+            f"Cache database is at schema version {current}, newer than this "
+            f"version of the app supports ({latest})"
+        )
+
+    applied = []
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version <= current:
+            continue
+        logger.info(f"Migrating cache database to v{migration.version}: {migration.description}")
+
+        def report(rows: int, migration: Migration = migration) -> None:
+            if on_progress:
+                on_progress(migration, rows)
+
+        await migration.apply(conn, report)
+        await conn.execute(
+            "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+            (migration.version, migration.description, time.time()),
+        )
+        await conn.commit()
+        applied.append(migration.version)
+    return applied
@@ -0,0 +1,144 @@
+"""Headless prefetch of the whole Pokedex into the cache."""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Hashable
+
+from src.cache.manager import CacheManager
+from src.sprites.downloader import SpriteDownloader
+from src.constants import PREFETCH_CONCURRENCY, SPRITES_DIR
+
+logger = logging.getLogger(__name__)
+
+# Number of default sprites the last prefetch left on disk
+PREFETCHED_SPRITES_KEY = "prefetched_sprites"
+
+
+@dataclass(slots=True)
+class PrefetchProgress:
+    """Progress of one prefetch phase."""
+    resource: str
+    completed: int
+    failed: int
+    total: int
+    elapsed: float
+
+    @property
+    def items_per_second(self) -> float:
+        done = self.completed + self.failed
+        return done / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ProgressCallback = Callable[[PrefetchProgress], None]
+
+
+class Prefetcher:
+    """Fills the cache for every Pokemon and everything its screens show.
+
+    Phases run in dependency order: the list, then each Pokemon, its
+    species and evolution chain, the moves, abilities and types those
+    reference, and finally each Pokemon's default sprite. Everything goes
+    through CacheManager, so entries already cached are cheap hits and a
+    run that was interrupted resumes where it stopped.
+    """
+
+    def __init__(
+        self,
+        cache: CacheManager,
+        sprites: SpriteDownloader | None = None,
+        on_progress: ProgressCallback | None = None,
+        concurrency: int = PREFETCH_CONCURRENCY,
+        sprites_dir: Path | None = None,
+    ) -> None:
+        self._cache = cache
+        self._sprites = sprites
+        self._on_progress = on_progress
+        self._concurrency = max(1, concurrency)
+        self._sprites_dir = Path(sprites_dir or SPRITES_DIR)
+
+    async def run(self) -> list[PrefetchProgress]:
+        """Prefetch everything; return the totals of each phase."""
+        results = []
+
+        async def phase(resource: str, keys: list, fetch: Callable[[Any], Awaitable[Any]]) -> list:
+            progress, values = await self._run_phase(resource, keys, fetch)
+            results.append(progress)
+            return values
+
+        pokemon_list = await self._cache.get_pokemon_list()
+        details = await phase(
+            "pokemon", [p.id for p in pokemon_list], self._cache.get_pokemon_detail
+        )
+        species = await phase(
+            "pokemon-species", sorted({d.species_id for d in details}), self._cache.get_species
+        )
+        await phase(
+            "evolution-chain",
+            sorted({s.evolution_chain_id for s in species if s.evolution_chain_id}),
+            self._cache.get_evolution_chain,
+        )
+        await phase("move", sorted({m.name for d in details for m in d.moves}), self._cache.get_move)
+        await phase(
+            "ability", sorted({a.name for d in details for a in d.abilities}), self._cache.get_ability
+        )
+        await phase("type", sorted({t.name for d in details for t in d.types}), self._cache.get_type)
+
+        if self._sprites is not None:
+            wanted = sorted(
+                (d.id, d.sprites.front_default)
+                for d in details if d.sprites and d.sprites.front_default
+            )
+            stored = await phase("sprite", wanted, self._fetch_sprite)
+            await self._cache.set_meta(PREFETCHED_SPRITES_KEY, str(len(stored)))
+        return results
+
+    async def _fetch_sprite(self, item: tuple[int, str]) -> Path:
+        pokemon_id, url = item
+        # Same file the detail screen renders
+        path = self._sprites_dir / f"{pokemon_id}_front_default.png"
+        await self._sprites.fetch_sprite(url, path)
+        return path
+
+    async def _run_phase(
+        self, resource: str, keys: list[Hashable], fetch: Callable[[Any], Awaitable[Any]]
+    ) -> tuple[PrefetchProgress, list]:
+        """Fetch every key with bounded concurrency; return progress and results."""
+        progress = PrefetchProgress(resource, 0, 0, len(keys), 0.0)
+        values: list = []
+        queue: asyncio.Queue = asyncio.Queue()
+        for key in keys:
+            queue.put_nowait(key)
+        start = time.perf_counter()
+
+        async def worker() -> None:
+            while True:
+                key = await queue.get()
+                try:
+                    values.append(await fetch(key))
+                    progress.completed += 1
+                except Exception as e:
+                    progress.failed += 1
+                    logger.warning(f"Failed to prefetch {resource} {key}: {e}")
+                finally:
+                    queue.task_done()
+                progress.elapsed = time.perf_counter() - start
+                self._report(progress)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self._concurrency, queue.qsize()))
+        ]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        progress.elapsed = time.perf_counter() - start
+        return progress, values
+
+    def _report(self, progress: PrefetchProgress) -> None:
+        if self._on_progress:
+            self._on_progress(progress)
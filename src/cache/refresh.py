@@ -0,0 +1,100 @@
+"""Background refresh of stale cache entries (stale-while-revalidate)."""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """Runs deduplicated, rate-limited refreshes off the caller's path.
+
+    A key that is already queued or running is not scheduled again, at
+    most `concurrency` refreshes run at once, and starts are spaced at
+    least `min_interval` seconds apart. A key whose refresh failed is not
+    retried for `failure_cooldown` seconds, so an unreachable API does
+    not turn every stale cache hit into another request.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        min_interval: float,
+        failure_cooldown: float,
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._min_interval = min_interval
+        self._failure_cooldown = failure_cooldown
+        self._next_start = 0.0
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self._failed_at: dict[Hashable, float] = {}
+        self.scheduled = 0
+        self.deduplicated = 0
+        self.suppressed = 0
+        self.completed = 0
+        self.failed = 0
+
+    def schedule(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> bool:
+        """Queue a refresh of `key`; return False if it was skipped."""
+        if key in self._tasks:
+            self.deduplicated += 1
+            return False
+        failed_at = self._failed_at.get(key)
+        if failed_at is not None and time.monotonic() - failed_at < self._failure_cooldown:
+            self.suppressed += 1
+            return False
+        self._tasks[key] = asyncio.create_task(self._run(key, factory))
+        self.scheduled += 1
+        return True
+
+    async def _run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            async with self._semaphore:
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self._min_interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+                    # Space the next start from when this one really began
+                    self._next_start = max(
+                        self._next_start, time.monotonic() + self._min_interval
+                    )
+                await factory()
+            self.completed += 1
+            self._failed_at.pop(key, None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failed += 1
+            self._failed_at[key] = time.monotonic()
+            logger.warning(f"Background refresh of {key} failed: {e}")
+        finally:
+            self._tasks.pop(key, None)
+
+    def pending(self) -> int:
+        """Number of refreshes queued or running."""
+        return len(self._tasks)
+
+    async def wait(self) -> None:
+        """Wait for every queued refresh to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel queued and running refreshes."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict:
+        """Get counters for scheduled, skipped, completed and failed refreshes."""
+        return {
+            "scheduled": self.scheduled,
+            "deduplicated": self.deduplicated,
+            "suppressed": self.suppressed,
+            "completed": self.completed,
+            "failed": self.failed,
+            "pending": self.pending(),
+        }
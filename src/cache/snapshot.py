@@ -0,0 +1,171 @@
+"""Portable snapshots of the warm cache: database plus sprites in one file.
+
+A snapshot is an uncompressed tar (the database rows and PNGs are already
+compressed) holding an online backup of the database, the sprite files,
+and a manifest with the format version and a SHA-256 of every file. The
+manifest is written last, so both export and import stream member by
+member and never hold a whole file in memory.
+"""
+import asyncio
+import hashlib
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+from typing import BinaryIO
+
+from src.cache.database import CacheDatabase
+from src.cache.prefetch import PREFETCHED_SPRITES_KEY
+from src.sprites.downloader import SpriteDownloader
+from src.constants import APP_VERSION, SNAPSHOT_FORMAT_VERSION, SNAPSHOT_CHUNK_SIZE
+
+SNAPSHOT_FORMAT = "pokedex-cache-snapshot"
+MANIFEST_NAME = "manifest.json"
+DATABASE_NAME = "pokedex_cache.db"
+SPRITES_PREFIX = "sprites/"
+
+
+class _HashingReader:
+    """File wrapper that hashes everything read through it."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self._hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._f.read(size)
+        self._hash.update(chunk)
+        return chunk
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def _add_file(tar: tarfile.TarFile, path: Path, name: str) -> dict:
+    info = tar.gettarinfo(path, name)
+    with open(path, "rb") as f:
+        reader = _HashingReader(f)
+        tar.addfile(info, reader)
+    return {"size": info.size, "sha256": reader.hexdigest()}
+
+
+def _write_archive(dest: Path, database: Path, sprites: list[Path]) -> dict:
+    files = {}
+    with tarfile.open(dest, "w") as tar:
+        files[DATABASE_NAME] = _add_file(tar, database, DATABASE_NAME)
+        for sprite in sprites:
+            files[SPRITES_PREFIX + sprite.name] = _add_file(tar, sprite, SPRITES_PREFIX + sprite.name)
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "app_version": APP_VERSION,
+            "created_at": time.time(),
+            "sprites": sum(1 for sprite in sprites if sprite.suffix == ".png"),
+            "files": files,
+        }
+        data = json.dumps(manifest, indent=2).encode()
+        info = tarfile.TarInfo(MANIFEST_NAME)
+        info.size = len(data)
+        info.mtime = int(manifest["created_at"])
+        tar.addfile(info, io.BytesIO(data))
+    return manifest
+
+
+async def export_snapshot(db: CacheDatabase, sprites: SpriteDownloader, dest: Path) -> dict:
+    """Write a snapshot of `db` and the sprite directory to `dest`; return its manifest.
+
+    The artifact is assembled under a temporary name and renamed into
+    place, so `dest` never holds a partial snapshot.
+    """
+    dest = Path(dest)
+    partial = dest.with_name(dest.name + ".partial")
+    with tempfile.TemporaryDirectory(dir=dest.parent) as tmpdir:
+        database = Path(tmpdir) / DATABASE_NAME
+        await db.backup(database)
+        try:
+            manifest = await asyncio.to_thread(
+                _write_archive, partial, database, sprites.sprite_files()
+            )
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+    os.replace(partial, dest)
+    return manifest
+
+
+def _staged_path(staging: Path, name: str) -> Path:
+    """Where an archive member is unpacked; rejects anything unexpected."""
+    if name == DATABASE_NAME:
+        return staging / DATABASE_NAME
+    if name.startswith(SPRITES_PREFIX):
+        filename = name[len(SPRITES_PREFIX):]
+        if filename and "/" not in filename and "\\" not in filename and not filename.startswith("."):
+            return staging / "sprites" / filename
+    raise ValueError(f"Unexpected file in snapshot: {name}")
+
+
+def _unpack(artifact: Path, staging: Path) -> dict:
+    """Unpack a snapshot into `staging` and verify it against its manifest."""
+    (staging / "sprites").mkdir()
+    digests: dict[str, str] = {}
+    manifest = None
+    with tarfile.open(artifact, "r|") as tar:
+        for member in tar:
+            if not member.isfile():
+                raise ValueError(f"Unexpected entry in snapshot: {member.name}")
+            source = tar.extractfile(member)
+            if member.name == MANIFEST_NAME:
+                manifest = json.load(source)
+                continue
+            digest = hashlib.sha256()
+            with open(_staged_path(staging, member.name), "wb") as out:
+                while chunk := source.read(SNAPSHOT_CHUNK_SIZE):
+                    digest.update(chunk)
+                    out.write(chunk)
+            digests[member.name] = digest.hexdigest()
+
+    if manifest is None:
+        raise ValueError("Snapshot has no manifest")
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError("Not a Pokedex cache snapshot")
+    if manifest.get("version") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"Snapshot format {manifest.get('version')} is not supported "
+            f"(expected {SNAPSHOT_FORMAT_VERSION})"
+        )
+    expected = {name: entry["sha256"] for name, entry in manifest["files"].items()}
+    mismatched = sorted(
+        name for name in expected.keys() | digests.keys()
+        if expected.get(name) != digests.get(name)
+    )
+    if mismatched:
+        raise ValueError(f"Snapshot checksum mismatch: {', '.join(mismatched[:5])}")
+    if DATABASE_NAME not in digests:
+        raise ValueError("Snapshot has no database")
+    return manifest
+
+
+async def import_snapshot(artifact: Path, db: CacheDatabase, sprites: SpriteDownloader) -> dict:
+    """Verify a snapshot and swap its database and sprites in; return its manifest.
+
+    Nothing is replaced unless every file matches the manifest. `db` must
+    be closed; it is left open on the imported database. The snapshot is
+    staged next to the database, which should share a filesystem with the
+    sprite directory so both swaps are plain renames.
+    """
+    staging = Path(tempfile.mkdtemp(prefix=".snapshot-", dir=db.path.parent))
+    try:
+        manifest = await asyncio.to_thread(_unpack, Path(artifact), staging)
+        await db.install(staging / DATABASE_NAME)
+        sprites.install_sprites(staging / "sprites")
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    await db.initialize()
+    # Keep the TUI from trimming the shipped sprites back to its LRU limit
+    await db.set_meta(PREFETCHED_SPRITES_KEY, str(manifest["sprites"]))
+    return manifest
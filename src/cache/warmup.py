@@ -0,0 +1,171 @@
+"""Background warm-up of list filter metadata (types and generation)."""
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from src.cache.manager import CacheManager
+from src.models.pokemon import PokemonSummary
+from src.constants import WARMUP_CONCURRENCY, WARMUP_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY = "warmup_checkpoint"
+
+
+@dataclass(slots=True)
+class WarmupProgress:
+    """Snapshot of warm-up progress."""
+    completed: int
+    failed: int
+    total: int
+    elapsed: float
+    resumed: int = 0  # Completed entries restored from the checkpoint
+
+    @property
+    def items_per_second(self) -> float:
+        """Throughput of entries actually fetched in this run."""
+        fetched = self.completed - self.resumed
+        return fetched / self.elapsed if self.elapsed > 0 else 0.0
+
+
+BatchCallback = Callable[[dict[int, list[str]], dict[int, str]], None]
+ProgressCallback = Callable[[WarmupProgress], None]
+
+
+class MetadataWarmup:
+    """Fetches type and generation data for every Pokemon with bounded concurrency.
+
+    A fixed pool of workers pulls Pokemon from a queue. Results are handed
+    to `on_batch` in groups of `batch_size`, and each batch is written to the
+    list index and to a checkpoint so an interrupted warm-up resumes where
+    it left off.
+    """
+
+    def __init__(
+        self,
+        cache: CacheManager,
+        on_batch: BatchCallback | None = None,
+        on_progress: ProgressCallback | None = None,
+        concurrency: int = WARMUP_CONCURRENCY,
+        batch_size: int = WARMUP_BATCH_SIZE,
+    ) -> None:
+        self._cache = cache
+        self._on_batch = on_batch
+        self._on_progress = on_progress
+        self._concurrency = max(1, concurrency)
+        self._batch_size = max(1, batch_size)
+        self._checkpoint: dict[int, tuple[list[str], str]] = {}
+        self._batch_types: dict[int, list[str]] = {}
+        self._batch_gens: dict[int, str] = {}
+        self._completed = 0
+        self._resumed = 0
+        self._failed = 0
+        self._total = 0
+        self._started_at = 0.0
+
+    @property
+    def progress(self) -> WarmupProgress:
+        return WarmupProgress(
+            completed=self._completed,
+            failed=self._failed,
+            total=self._total,
+            elapsed=time.perf_counter() - self._started_at if self._started_at else 0.0,
+            resumed=self._resumed,
+        )
+
+    async def run(self, pokemon_list: list[PokemonSummary]) -> WarmupProgress:
+        """Warm metadata for `pokemon_list`, resuming from any saved checkpoint."""
+        self._started_at = time.perf_counter()
+        self._total = len(pokemon_list)
+        await self._load_checkpoint()
+
+        # Replay checkpointed entries straight to the UI
+        wanted = {p.id for p in pokemon_list}
+        for pokemon_id, (types, generation) in self._checkpoint.items():
+            if pokemon_id in wanted:
+                self._batch_types[pokemon_id] = types
+                self._batch_gens[pokemon_id] = generation
+                self._resumed += 1
+        self._completed = self._resumed
+        await self._flush_batch(save=False)
+
+        queue: asyncio.Queue[PokemonSummary] = asyncio.Queue()
+        for pokemon in pokemon_list:
+            if pokemon.id not in self._checkpoint:
+                queue.put_nowait(pokemon)
+
+        workers = [
+            asyncio.create_task(self._worker(queue))
+            for _ in range(min(self._concurrency, queue.qsize()))
+        ]
+        try:
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        await self._flush_batch()
+        return self.progress
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            pokemon = await queue.get()
+            try:
+                detail = await self._cache.get_pokemon_detail(pokemon.id)
+                species = await self._cache.get_species(detail.species_id)
+                self._batch_types[pokemon.id] = [t.name for t in detail.types]
+                self._batch_gens[pokemon.id] = species.generation
+                self._completed += 1
+            except Exception as e:
+                self._failed += 1
+                logger.warning(f"Failed to load metadata for {pokemon.name} (#{pokemon.id}): {e}")
+            finally:
+                queue.task_done()
+
+            if len(self._batch_types) >= self._batch_size:
+                await self._flush_batch()
+
+    async def _flush_batch(self, save: bool = True) -> None:
+        """Deliver pending results to the UI and persist the checkpoint."""
+        if not self._batch_types:
+            return
+        types, gens = self._batch_types, self._batch_gens
+        self._batch_types, self._batch_gens = {}, {}
+
+        for pokemon_id, type_names in types.items():
+            self._checkpoint[pokemon_id] = (type_names, gens.get(pokemon_id, ""))
+
+        if self._on_batch:
+            self._on_batch(types, gens)
+        if self._on_progress:
+            self._on_progress(self.progress)
+        if save:
+            await self._cache.save_index_metadata(types, gens)
+            await self._save_checkpoint()
+
+    async def _load_checkpoint(self) -> None:
+        raw = await self._cache.get_meta(CHECKPOINT_KEY)
+        if not raw:
+            return
+        try:
+            entries = json.loads(raw)
+            self._checkpoint = {
+                int(pokemon_id): (types, generation)
+                for pokemon_id, (types, generation) in entries.items()
+            }
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable warm-up checkpoint: {e}")
+            self._checkpoint = {}
+
+    async def _save_checkpoint(self) -> None:
+        await self._cache.set_meta(
+            CHECKPOINT_KEY,
+            json.dumps({
+                str(pokemon_id): [types, generation]
+                for pokemon_id, (types, generation) in self._checkpoint.items()
+            }),
+        )
@@ -0,0 +1,162 @@
+"""Write-behind buffer that groups cache writes into batched transactions."""
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Hashable, Sequence
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindQueue:
+    """Buffers SQL writes and commits them together.
+
+    Callers enqueue statements and return immediately. Pending statements
+    are written in one transaction when `batch_size` is reached, every
+    `interval` seconds, or when `flush()` is called (e.g. on close).
+    Statements run in the order they were enqueued.
+
+    If a batch fails, each of its statements is retried in its own
+    transaction so one bad row cannot take unrelated writes down with it.
+    Keys of statements that still fail are passed to `on_failed`.
+    """
+
+    def __init__(
+        self,
+        connection: aiosqlite.Connection,
+        batch_size: int,
+        interval: float,
+        on_flushed: Callable[[list[Hashable]], None] | None = None,
+        on_failed: Callable[[list[Hashable]], None] | None = None,
+    ) -> None:
+        self._db = connection
+        self._batch_size = max(1, batch_size)
+        self._interval = interval
+        self._on_flushed = on_flushed
+        self._on_failed = on_failed
+        self._ops: list[tuple[str, Sequence[Any], bool, Hashable | None]] = []
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+        self._flush_task: asyncio.Task | None = None
+        self.max_depth = 0
+        self.flushes = 0
+        self.statements_flushed = 0
+        self.last_flush_ms = 0.0
+        self.errors = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        """Start the periodic flush timer."""
+        if self._timer is None and self._interval > 0:
+            self._timer = asyncio.create_task(self._flush_periodically())
+
+    @property
+    def depth(self) -> int:
+        return len(self._ops)
+
+    def execute(
+        self, sql: str, params: Sequence[Any] = (), key: Hashable | None = None
+    ) -> None:
+        """Queue a single statement.
+
+        `key` is passed to `on_flushed` once the statement is committed,
+        so callers can drop any read-your-writes copy they kept.
+        """
+        self._enqueue((sql, params, False, key))
+
+    def executemany(self, sql: str, params: Sequence[Sequence[Any]]) -> None:
+        """Queue a statement to run once per parameter row."""
+        self._enqueue((sql, params, True, None))
+
+    def _enqueue(self, op: tuple[str, Sequence[Any], bool, Hashable | None]) -> None:
+        self._ops.append(op)
+        self.max_depth = max(self.max_depth, len(self._ops))
+        if len(self._ops) >= self._batch_size and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            # Flush off the caller's path so it never waits on disk; one
+            # scheduled flush picks up everything queued before it runs
+            self._flush_task = asyncio.create_task(self.flush())
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Held while a batch is written; hold it to use the connection directly."""
+        return self._lock
+
+    async def flush(self) -> None:
+        """Write every pending statement, in a single transaction if possible."""
+        async with self._lock:
+            if not self._ops:
+                return
+            ops, self._ops = self._ops, []
+            start = time.perf_counter()
+            try:
+                await self._run(ops)
+                written, failed = ops, []
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Cache write batch of {len(ops)} statements failed: {e}")
+                await self._db.rollback()
+                written, failed = await self._run_individually(ops)
+            finally:
+                self.last_flush_ms = (time.perf_counter() - start) * 1000
+            self.flushes += 1
+            self.statements_flushed += len(written)
+            self.dropped += len(failed)
+            if self._on_flushed:
+                self._on_flushed([key for *_, key in written if key is not None])
+            if failed and self._on_failed:
+                self._on_failed([key for *_, key in failed if key is not None])
+
+    async def _run(self, ops: list) -> None:
+        for sql, params, many, _ in ops:
+            if many:
+                await self._db.executemany(sql, params)
+            else:
+                await self._db.execute(sql, params)
+        await self._db.commit()
+
+    async def _run_individually(self, ops: list) -> tuple[list, list]:
+        """Retry each statement alone; return (written, failed) ops."""
+        written, failed = [], []
+        for op in ops:
+            try:
+                await self._run([op])
+                written.append(op)
+            except Exception as e:
+                logger.error(f"Dropping cache write `{op[0].split('(')[0].strip()}`: {e}")
+                await self._db.rollback()
+                failed.append(op)
+        return written, failed
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Periodic cache flush failed: {e}")
+
+    async def close(self) -> None:
+        """Stop the timer and write out everything still pending."""
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+    def get_stats(self) -> dict:
+        """Get queue depth and flush counters."""
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "flushes": self.flushes,
+            "statements_flushed": self.statements_flushed,
+            "last_flush_ms": self.last_flush_ms,
+            "errors": self.errors,
+            "dropped": self.dropped,
+        }
@@ -14,12 +14,118 @@ CACHE_DB = DATA_DIR / "pokedex_cache.db"
 POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"
 SPRITE_BASE_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon"
 
+HTTP_MAX_RETRIES = 3              # Extra attempts after a 429, 5xx or connection error
+HTTP_RETRY_BASE_DELAY = 0.5       # Seconds; backoff doubles per attempt, with full jitter
+HTTP_RETRY_MAX_DELAY = 30.0       # Cap on any single wait, including a server's Retry-After
+HTTP_CONCURRENCY_INITIAL = 10     # Requests in flight at start (AIMD limiter)
+HTTP_CONCURRENCY_MIN = 1
+HTTP_CONCURRENCY_MAX = 20         # Limit for hosts not listed below
+HTTP_HOST_CONNECTIONS: dict[str, int] = {  # Pool size per host; also its concurrency limit
+    "pokeapi.co": 20,
+    "raw.githubusercontent.com": 16,
+}
+HTTP2_ENABLED = True              # Multiplex over HTTP/2 when the optional h2 package is installed
+HTTP_CONCURRENCY_BACKOFF = 0.5    # Limit is multiplied by this on throttling
+HTTP_THROTTLE_COOLDOWN = 1.0      # Seconds before another throttle can shrink the limit again
+HTTP_BREAKER_FAILURES = 5         # Consecutive failures to a host before its circuit opens
+HTTP_BREAKER_RESET_TIMEOUT = 30.0 # Seconds an open circuit fails fast before a trial request
+DEGRADED_CHECK_INTERVAL = 1.0     # Seconds between checks for the degraded-mode indicator
+
 # --- Cache TTL (seconds) ---
 CACHE_TTL_POKEMON_LIST = 86400 * 7     # 7 days
 CACHE_TTL_POKEMON_DETAIL = 86400 * 30  # 30 days
 CACHE_TTL_SPECIES = 86400 * 30
 CACHE_TTL_EVOLUTION = 86400 * 30
 CACHE_TTL_ABILITY = 86400 * 30
+CACHE_TTL_MOVE = 86400 * 30
+CACHE_TTL_TYPE = 86400 * 30
+CACHE_TTL_FORM = 86400 * 30
+CACHE_TTL_GENERATION = 86400 * 7  # Membership grows when new Pokemon are added
+
+# Past its TTL an entry is still served while a background refresh runs;
+# only past its hard expiry does a lookup wait on the network
+CACHE_HARD_TTL_POKEMON_LIST = 86400 * 90
+CACHE_HARD_TTL_POKEMON_DETAIL = 86400 * 365
+CACHE_HARD_TTL_SPECIES = 86400 * 365
+CACHE_HARD_TTL_EVOLUTION = 86400 * 365
+CACHE_HARD_TTL_ABILITY = 86400 * 365
+CACHE_HARD_TTL_MOVE = 86400 * 365
+CACHE_HARD_TTL_TYPE = 86400 * 365
+CACHE_HARD_TTL_FORM = 86400 * 365
+CACHE_HARD_TTL_GENERATION = 86400 * 90
+
+# Lookups that 404ed or failed schema validation fail fast until this passes
+CACHE_TTL_MISSING = 3600
+
+CACHE_REFRESH_CONCURRENCY = 2         # Background refreshes running at once
+CACHE_REFRESH_MIN_INTERVAL = 0.25     # Seconds between background refresh starts
+CACHE_REFRESH_FAILURE_COOLDOWN = 300  # Seconds before a failed refresh is retried
+SPRITE_TTL = 86400 * 30               # Sprites are revalidated in the background after this
+SPRITE_CACHE_SIZE = 75                # Sprite files kept on disk (LRU)
+
+# --- Cache storage format ---
+CACHE_STORAGE_CODEC = "zlib"  # "json", "zlib", or "zstd" (needs the zstandard package)
+CACHE_STORAGE_TRIM = True     # Drop payload fields the app never reads before storing
+CACHE_DICTIONARY_MIN_ROWS = 200  # Cached rows needed before training a storage dictionary
+CACHE_WRITE_BATCH_SIZE = 100      # Queued cache writes committed per transaction
+CACHE_WRITE_FLUSH_INTERVAL = 1.0  # Seconds before queued writes are committed anyway
+CACHE_READ_CONNECTIONS = 0        # Extra read-only connections; 0 reads through the writer
+CACHE_MMAP_SIZE = 64 * 1024 * 1024
+CACHE_PAGE_CACHE_KB = 8 * 1024    # Page cache per connection
+MIGRATION_BATCH_SIZE = 500        # Rows rewritten per transaction by schema migrations
+
+# --- Cache size budget (payload bytes; rows past it are evicted LRU-first) ---
+CACHE_MAX_BYTES = 256 * 1024 * 1024   # All cached tables together
+CACHE_TABLE_MAX_BYTES: dict[str, int] = {
+    "pokemon_detail":  128 * 1024 * 1024,
+    "pokemon_species":  64 * 1024 * 1024,
+    "move":             32 * 1024 * 1024,
+}
+CACHE_ACCESS_BATCH_SIZE = 200     # Reads recorded before their last_accessed update is queued
+CACHE_EVICTION_BATCH_SIZE = 500   # Rows deleted per transaction when evicting
+CACHE_EVICTION_INTERVAL = 600     # Seconds between budget checks while the app runs
+
+# --- In-memory (L1) model cache ---
+L1_CACHE_CAPACITY: dict[str, int] = {  # Max parsed models kept per resource kind
+    "pokemon_detail": 64,
+    "pokemon_species": 64,
+    "evolution_chain": 64,
+    "ability": 256,
+    "move": 512,
+    "type": 32,
+    "generation": 16,
+    "form": 64,
+}
+L1_CACHE_MAX_BYTES = 32 * 1024 * 1024  # Approximate budget across all kinds
+
+# --- Cache metrics ---
+METRICS_FILE = DATA_DIR / "metrics.json"  # Written on exit
+METRICS_LATENCY_BUCKETS_MS = (            # Histogram bucket upper bounds; one more catches the rest
+    0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+METRICS_REFRESH_INTERVAL = 1.0            # Seconds between debug screen updates
+
+# --- Metadata warm-up ---
+WARMUP_CONCURRENCY = 8    # Pokemon fetched in parallel
+WARMUP_BATCH_SIZE = 50    # Pokemon per list panel update / checkpoint write
+
+# --- Offline dataset import ---
+IMPORT_WORKERS = 4        # Processes parsing dump files in parallel; 1 parses in-process
+IMPORT_BATCH_SIZE = 200   # Files parsed per job and rows written per transaction
+
+# --- Headless prefetch ---
+PREFETCH_CONCURRENCY = 10          # Requests queued at once; the client's limiter may run fewer
+PREFETCH_SPRITE_CACHE_SIZE = 5000  # Sprite LRU limit while prefetching; keeps every default sprite
+
+# --- Cache snapshots ---
+SNAPSHOT_FORMAT_VERSION = 1         # Bump when the artifact layout changes
+SNAPSHOT_BACKUP_PAGES = 1024        # Database pages copied per online backup step
+SNAPSHOT_CHUNK_SIZE = 1024 * 1024   # Bytes streamed at a time when unpacking
+
+# --- Record/replay cassettes ---
+CASSETTE_FORMAT_VERSION = 1    # Bump when the cassette file layout changes
+CASSETTE_LATENCY = 0.05        # Default seconds of synthetic latency per replayed response
+CASSETTE_BANDWIDTH = 1_000_000 # Default replay bandwidth in bytes per second
 
 # --- Sprite rendering ---
 SPRITE_RENDER_WIDTH = 40  # Fits within 44-char container with padding
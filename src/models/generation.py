@@ -0,0 +1,10 @@
+"""Generation data model."""
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class Generation:
+    """Generation data from /generation/{id}."""
+    id: int
+    name: str  # e.g. "generation-i"
+    species_ids: list[int] = field(default_factory=list)
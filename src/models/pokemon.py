@@ -10,6 +10,17 @@ class PokemonSummary:
     url: str
 
 
+@dataclass(slots=True)
+class PokemonIndexEntry:
+    """Precomputed filter/sort data for one Pokemon, stored in the list index."""
+    id: int
+    name: str | None
+    types: list[str]
+    generation: str | None
+    base_stat_total: int | None = None
+    stats: dict[str, int] = field(default_factory=dict)
+
+
 @dataclass(slots=True)
 class PokemonStat:
     """A single base stat."""
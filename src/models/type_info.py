@@ -2,6 +2,13 @@
 from dataclasses import dataclass, field
 
 
+@dataclass(slots=True)
+class TypeMember:
+    """A Pokemon that has this type, and in which slot."""
+    pokemon_id: int
+    slot: int
+
+
 @dataclass(slots=True)
 class TypeEffectiveness:
     """Type damage relations from /type/{id}."""
@@ -15,3 +22,5 @@ class TypeEffectiveness:
     double_damage_from: list[str] = field(default_factory=list)  # Weak to
     half_damage_from: list[str] = field(default_factory=list)    # Resists
     no_damage_from: list[str] = field(default_factory=list)      # Immune to
+    # Pokemon (including form variants) that have this type
+    pokemon: list[TypeMember] = field(default_factory=list)
@@ -10,6 +10,12 @@ class FlavorTextEntrySchema(BaseModel):
     version: dict[str, str]
 
 
+class GenusSchema(BaseModel):
+    """Schema for localized genus entry."""
+    genus: str
+    language: dict[str, str]
+
+
 class SpeciesSchema(BaseModel):
     """Schema for Pokemon species response from /pokemon-species/{id}."""
     id: int = Field(ge=1)
@@ -29,3 +35,7 @@ class SpeciesSchema(BaseModel):
     generation: dict[str, str]
     flavor_text_entries: list[FlavorTextEntrySchema]
     evolution_chain: Optional[dict[str, str]] = None
+    genera: list[GenusSchema] = Field(default_factory=list)
+    color: Optional[dict[str, str]] = None
+    shape: Optional[dict[str, str]] = None
+    habitat: Optional[dict[str, str]] = None
@@ -0,0 +1,98 @@
+"""Debug screen showing live cache metrics."""
+from typing import Callable
+
+from rich.console import Group
+from rich.table import Table
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import VerticalScroll
+from textual.screen import ModalScreen
+from textual.widgets import Static
+
+from src.constants import METRICS_REFRESH_INTERVAL
+
+
+def tier_table(title: str, tiers: dict) -> Table:
+    """One row per kind and tier: outcome counts and latency percentiles."""
+    table = Table(title=title, expand=True)
+    for column in ("Kind", "Tier", "Outcomes", "Count", "p50 ms", "p90 ms", "p99 ms", "Max ms"):
+        table.add_column(column, justify="left" if column in ("Kind", "Tier", "Outcomes") else "right")
+    for kind, by_tier in tiers.items():
+        for tier, stats in by_tier.items():
+            latency = stats["latency"]
+            table.add_row(
+                kind,
+                tier,
+                ", ".join(f"{name} {count}" for name, count in sorted(stats["outcomes"].items())),
+                str(latency["count"]),
+                f"{latency['p50_ms']:.2f}",
+                f"{latency['p90_ms']:.2f}",
+                f"{latency['p99_ms']:.2f}",
+                f"{latency['max_ms']:.2f}",
+            )
+    return table
+
+
+def counters_table(title: str, sections: dict[str, dict]) -> Table:
+    """Flat counters, one row per section."""
+    table = Table(title=title, expand=True)
+    table.add_column("Section")
+    table.add_column("Counters")
+    for name, counters in sections.items():
+        table.add_row(name, ", ".join(
+            f"{key} {value:.1f}" if isinstance(value, float) else f"{key} {value}"
+            for key, value in counters.items()
+            if not isinstance(value, dict)
+        ))
+    return table
+
+
+class MetricsScreen(ModalScreen):
+    """Cache hit/miss counters and latency histograms, refreshed live."""
+
+    BINDINGS = [
+        Binding("escape", "dismiss", "Close"),
+        Binding("d", "dismiss", "Close", show=False),
+    ]
+
+    def __init__(self, collect: Callable[[], dict]) -> None:
+        super().__init__()
+        self._collect = collect
+
+    def compose(self) -> ComposeResult:
+        with VerticalScroll(id="metrics"):
+            yield Static("", id="metrics-body")
+
+    def on_mount(self) -> None:
+        self.update_metrics()
+        self.set_interval(METRICS_REFRESH_INTERVAL, self.update_metrics)
+
+    def update_metrics(self) -> None:
+        metrics = self._collect()
+        cache = metrics.get("cache", {})
+        sprites = metrics.get("sprites", {})
+        memory = cache.get("memory", {})
+        self.query_one("#metrics-body", Static).update(Group(
+            tier_table("Selection phases", metrics.get("selection", {})),
+            tier_table("Cache tiers", cache.get("tiers", {})),
+            counters_table("L1 model cache", {
+                "total": {"bytes": memory.get("bytes", 0), "max_bytes": memory.get("max_bytes", 0)},
+                **memory.get("kinds", {}),
+            }),
+            counters_table("Cache internals", {
+                name: cache.get(name, {}) for name in ("http", "inflight", "writes", "refresh")
+            }),
+            counters_table("HTTP hosts (limit and circuit)", {
+                **cache.get("http", {}).get("hosts", {}),
+                **sprites.get("http", {}).get("hosts", {}),
+            }),
+            tier_table("Sprites", sprites.get("tiers", {})),
+            counters_table("Sprite cache", {
+                "lru": sprites.get("lru", {}),
+                "http": sprites.get("http", {}),
+                "revalidation": {
+                    "revalidated": sprites.get("revalidated", 0),
+                    "not_modified": sprites.get("not_modified", 0),
+                },
+            }),
+        ))
@@ -1,23 +1,56 @@
 """Sprite downloader with disk caching."""
+import json
 import logging
+import os
+import shutil
+import time
 from pathlib import Path
 
 from src.api.client import PokeAPIClient
 from src.api.endpoints import sprite_url
-from src.constants import SPRITES_DIR
-from src.sprites.lru_cache import SpriteLRUCache
+from src.cache.metrics import CacheMetrics
+from src.cache.refresh import BackgroundRefresher
+from src.constants import (
+    SPRITES_DIR, SPRITE_TTL, SPRITE_CACHE_SIZE,
+    CACHE_REFRESH_CONCURRENCY, CACHE_REFRESH_MIN_INTERVAL, CACHE_REFRESH_FAILURE_COOLDOWN,
+)
+from src.sprites.lru_cache import SpriteLRUCache, validators_path
 
 logger = logging.getLogger(__name__)
 
 
 class SpriteDownloader:
-    """Downloads and caches Pokemon sprite PNGs to disk with LRU eviction."""
+    """Downloads and caches Pokemon sprite PNGs to disk with LRU eviction.
 
-    def __init__(self, api_client: PokeAPIClient | None = None, max_cache_size: int = 75) -> None:
+    Each PNG has a small JSON sidecar with the response's ETag and
+    Last-Modified and when it was last checked. Once a sprite is older
+    than SPRITE_TTL it is still used as-is, and a conditional GET runs in
+    the background; a 304 only bumps the check time.
+
+    Disk hits and downloads are recorded in `metrics` under the "sprite"
+    kind, with "disk" and "http" tiers.
+    """
+
+    def __init__(
+        self,
+        api_client: PokeAPIClient | None = None,
+        max_cache_size: int = SPRITE_CACHE_SIZE,
+        sprites_dir: Path | None = None,
+    ) -> None:
+        # A client passed in is shared, so its owner closes it
+        self._owns_api = api_client is None
         self._api = api_client or PokeAPIClient()
-        self._sprites_dir = Path(SPRITES_DIR)
+        self._sprites_dir = Path(sprites_dir or SPRITES_DIR)
         self._sprites_dir.mkdir(parents=True, exist_ok=True)
         self._lru_cache = SpriteLRUCache(self._sprites_dir, max_sprites=max_cache_size)
+        self._refresher = BackgroundRefresher(
+            CACHE_REFRESH_CONCURRENCY,
+            CACHE_REFRESH_MIN_INTERVAL,
+            CACHE_REFRESH_FAILURE_COOLDOWN,
+        )
+        self.metrics = CacheMetrics()
+        self.revalidated = 0
+        self.not_modified = 0
 
     def _sprite_path(self, pokemon_id: int) -> Path:
         return self._sprites_dir / f"{pokemon_id}.png"
@@ -25,15 +58,11 @@ class SpriteDownloader:
     async def get_sprite(self, pokemon_id: int) -> Path | None:
         """Get sprite file path, downloading if necessary."""
         path = self._sprite_path(pokemon_id)
-        if path.exists():
-            # Update access time for LRU tracking
-            self._lru_cache.on_sprite_accessed(path)
+        url = sprite_url(pokemon_id)
+        if self._serve_from_disk(url, path):
             return path
         try:
-            image_bytes = await self._api.get_bytes(sprite_url(pokemon_id))
-            path.write_bytes(image_bytes)
-            # Track new sprite download
-            self._lru_cache.on_sprite_downloaded(path)
+            await self._fetch(url, path)
             return path
         except Exception as e:
             logger.error(f"Failed to download sprite for Pokemon #{pokemon_id}: {e}")
@@ -42,14 +71,118 @@ class SpriteDownloader:
     async def download_sprite(self, url: str, path: Path) -> None:
         """Download a sprite from a URL to a specific path."""
         try:
-            # Check if sprite already exists
-            if path.exists():
-                self._lru_cache.on_sprite_accessed(path)
-                return
+            await self.fetch_sprite(url, path)
+        except Exception as e:
+            logger.warning(f"Failed to download sprite from {url}: {e}")
 
-            image_bytes = await self._api.get_bytes(url)
-            path.write_bytes(image_bytes)
+    async def fetch_sprite(self, url: str, path: Path) -> None:
+        """Like download_sprite, but raises if the download fails."""
+        if not self._serve_from_disk(url, path):
+            await self._fetch(url, path)
+
+    def _serve_from_disk(self, url: str, path: Path) -> bool:
+        """Note a hit on an already downloaded sprite; False if it must be fetched."""
+        start = time.perf_counter()
+        if not path.exists():
+            self.metrics.observe("sprite", "disk", "miss", time.perf_counter() - start)
+            return False
+        # Update access time for LRU tracking
+        self._lru_cache.on_sprite_accessed(path)
+        self._revalidate_if_stale(url, path)
+        self.metrics.observe("sprite", "disk", "hit", time.perf_counter() - start)
+        return True
+
+    async def _fetch(self, url: str, path: Path, validators: dict | None = None) -> None:
+        """GET a sprite, conditionally if `validators` are given, and store it."""
+        validators = validators or {}
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await self._api.get_bytes_conditional(
+                url, validators.get("etag"), validators.get("last_modified")
+            )
+            outcome = "not_modified" if response.not_modified else "ok"
+        finally:
+            self.metrics.observe("sprite", "http", outcome, time.perf_counter() - start)
+        if response.not_modified:
+            self.not_modified += 1
+        else:
+            path.write_bytes(response.body)
             # Track new sprite download
             self._lru_cache.on_sprite_downloaded(path)
-        except Exception as e:
-            logger.warning(f"Failed to download sprite from {url}: {e}")
+        self._write_validators(path, {
+            "etag": response.etag,
+            "last_modified": response.last_modified,
+            "checked_at": time.time(),
+        })
+
+    def _revalidate_if_stale(self, url: str, path: Path) -> None:
+        validators = self._read_validators(path)
+        if time.time() - validators.get("checked_at", 0) <= SPRITE_TTL:
+            return
+
+        async def revalidate():
+            self.revalidated += 1
+            await self._fetch(url, path, validators)
+
+        self._refresher.schedule(str(path), revalidate)
+
+    @staticmethod
+    def _read_validators(path: Path) -> dict:
+        try:
+            return json.loads(validators_path(path).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_validators(path: Path, validators: dict) -> None:
+        try:
+            validators_path(path).write_text(json.dumps(validators))
+        except OSError as e:
+            logger.warning(f"Could not save validators for {path.name}: {e}")
+
+    def get_stats(self) -> dict:
+        """Get LRU usage, revalidation counters and per-tier metrics."""
+        return {
+            "lru": self._lru_cache.get_cache_stats(),
+            "revalidated": self.revalidated,
+            "not_modified": self.not_modified,
+            "tiers": self.metrics.snapshot(),
+            "refresh": self._refresher.get_stats(),
+            "http": self._api.get_stats(),
+        }
+
+    @property
+    def sprites_dir(self) -> Path:
+        return self._sprites_dir
+
+    def sprite_files(self) -> list[Path]:
+        """Every sprite and validator sidecar on disk, in name order."""
+        return sorted(
+            p for p in self._sprites_dir.iterdir()
+            if p.is_file() and p.suffix in (".png", ".json")
+        )
+
+    def install_sprites(self, staged_dir: Path) -> None:
+        """Swap `staged_dir` in as the sprite directory.
+
+        The current directory is renamed aside and deleted only once the new
+        one is in place; `staged_dir` must be on the same filesystem. None of
+        the installed sprites are evicted by the swap.
+        """
+        old_dir = self._sprites_dir.with_name(self._sprites_dir.name + ".old")
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if self._sprites_dir.exists():
+            os.replace(self._sprites_dir, old_dir)
+        os.replace(staged_dir, self._sprites_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+        installed = len(list(self._sprites_dir.glob("*.png")))
+        self._lru_cache = SpriteLRUCache(
+            self._sprites_dir, max_sprites=max(self._lru_cache.max_sprites, installed)
+        )
+
+    async def close(self) -> None:
+        """Cancel background revalidation and close the client if this owns it."""
+        await self._refresher.close()
+        if self._owns_api:
+            await self._api.close()
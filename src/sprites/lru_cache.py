@@ -7,6 +7,16 @@ from typing import Dict
 logger = logging.getLogger(__name__)
 
 
+def validators_path(sprite_path: Path) -> Path:
+    """Sidecar file holding a sprite's HTTP validators."""
+    return sprite_path.with_suffix(".json")
+
+
+def _remove_sprite(sprite_path: Path) -> None:
+    sprite_path.unlink(missing_ok=True)
+    validators_path(sprite_path).unlink(missing_ok=True)
+
+
 class SpriteLRUCache:
     """Manages sprite cache with LRU eviction policy."""
 
@@ -37,7 +47,7 @@ class SpriteLRUCache:
             sprites_to_delete = len(sprite_files) - self.max_sprites
             for sprite_file in sprite_files[:sprites_to_delete]:
                 logger.info(f"LRU cleanup: Removing old sprite {sprite_file.name}")
-                sprite_file.unlink()
+                _remove_sprite(sprite_file)
             # Keep only the newest sprites
             sprite_files = sprite_files[sprites_to_delete:]
 
@@ -80,7 +90,7 @@ class SpriteLRUCache:
             # Delete the file
             if oldest_path.exists():
                 logger.debug(f"LRU eviction: Removing {oldest_path.name}")
-                oldest_path.unlink()
+                _remove_sprite(oldest_path)
 
             # Remove from tracking
             del self.access_times[oldest_sprite]
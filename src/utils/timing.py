@@ -0,0 +1,36 @@
+"""Wall-clock timing of named phases within one operation."""
+import math
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class PhaseTimer:
+    """Accumulates perf_counter seconds per phase name.
+
+    A phase entered more than once (e.g. in a loop) is summed, so
+    `phases` always holds one total per name, in first-entered order.
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of `samples` (0.0 for no samples)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
@@ -49,6 +49,19 @@ class PokemonListPanel(Vertical):
         """Update generation data for a single Pokemon."""
         self._pokemon_gens[pokemon_id] = generation
 
+    def set_metadata_batch(
+        self, types: dict[int, list[str]], gens: dict[int, str]
+    ) -> None:
+        """Update type and generation data for many Pokemon at once.
+
+        Re-filters the list once per batch when a type or generation
+        filter is active, so newly loaded Pokemon appear as they arrive.
+        """
+        self._pokemon_types.update(types)
+        self._pokemon_gens.update(gens)
+        if self._current_type or self._current_gen:
+            self._apply_filters()
+
     def _apply_filters(self) -> None:
         """Filter Pokemon list by search query, generation, and type."""
         filtered = self._all_pokemon
@@ -0,0 +1,27 @@
+"""Shared helpers for the opt-in timing benchmarks.
+
+Timing comparisons are noisy on loaded machines, so benchmark tests only
+run when POKEDEX_BENCHMARKS is set:
+
+    POKEDEX_BENCHMARKS=1 python -m pytest tests -s -k benchmark
+"""
+import os
+import time
+
+import pytest
+
+benchmark = pytest.mark.skipif(
+    not os.environ.get("POKEDEX_BENCHMARKS"),
+    reason="timing benchmark; set POKEDEX_BENCHMARKS=1 to run",
+)
+
+
+def best_time(fn, iterations: int) -> float:
+    """Return the best-of-3 mean seconds per call of `fn()`."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
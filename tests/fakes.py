@@ -0,0 +1,46 @@
+"""Shared test doubles for cache and API tests."""
+import asyncio
+import json
+from pathlib import Path
+
+from src.api.client import ConditionalResponse
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(filename: str) -> dict:
+    """Load JSON fixture file."""
+    with open(FIXTURES_DIR / filename) as f:
+        return json.load(f)
+
+
+class FakeAPIClient:
+    """Stand-in for PokeAPIClient that serves fixtures and counts calls."""
+
+    def __init__(self, payloads: dict[str, dict], delay: float = 0.01) -> None:
+        self.payloads = payloads
+        self.delay = delay
+        self.calls: list[str] = []
+
+    async def get_json(self, url: str) -> dict:
+        self.calls.append(url)
+        await asyncio.sleep(self.delay)
+        for suffix, payload in self.payloads.items():
+            if url.rstrip("/").endswith(suffix):
+                return payload
+        raise ValueError(f"No fixture for {url}")
+
+    async def get_json_conditional(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> ConditionalResponse:
+        return ConditionalResponse(await self.get_json(url), None, None)
+
+    def get_stats(self) -> dict:
+        return {"requests": len(self.calls)}
+
+    def is_degraded(self) -> bool:
+        return False
+
+    async def close(self) -> None:
+        pass
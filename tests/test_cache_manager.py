@@ -0,0 +1,257 @@
+"""Tests for CacheManager read-through caching."""
+import asyncio
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager
+from src.constants import CACHE_TTL_MOVE, CACHE_TTL_POKEMON_LIST
+from tests.fakes import FakeAPIClient, load_fixture
+
+
+def make_api() -> FakeAPIClient:
+    return FakeAPIClient({
+        "/pokemon/25": load_fixture("pokemon_detail.json"),
+        "/pokemon-species/25": load_fixture("pokemon_species.json"),
+        "/ability/static": load_fixture("ability.json"),
+        "/move/thunder-shock": load_fixture("move.json"),
+    }, delay=0)
+
+
+def run_with_manager(tmpdir, api, scenario):
+    """Run `scenario(manager)` against a fresh manager on a temp database."""
+    async def runner():
+        manager = CacheManager(
+            api_client=api, db=CacheDatabase(Path(tmpdir) / "cache.db")
+        )
+        await manager.initialize()
+        try:
+            return await scenario(manager)
+        finally:
+            await manager.close()
+
+    return asyncio.run(runner())
+
+
+class TestNameKeyedReadThrough:
+    """Test that name-keyed resources are served from SQLite when warm."""
+
+    def test_warm_ability_and_move_make_no_http_calls(self):
+        api = make_api()
+
+        async def select(manager):
+            return await asyncio.gather(
+                manager.get_ability("static"),
+                manager.get_move("thunder-shock"),
+            )
+
+        with TemporaryDirectory() as tmpdir:
+            run_with_manager(tmpdir, api, select)
+            assert len(api.calls) == 2
+
+            api.calls.clear()
+            ability, move = run_with_manager(tmpdir, api, select)
+
+        assert api.calls == []
+        assert ability.name == "static"
+        assert move.name == "thunder-shock"
+
+    def test_expired_entry_refetches(self):
+        api = make_api()
+
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+
+            async def seed_stale():
+                db = CacheDatabase(db_path)
+                await db.initialize()
+                await db.save_cached_json(
+                    "ability", 9, load_fixture("ability.json"), name="static"
+                )
+                await db.flush()
+                await db._db.execute("UPDATE ability SET cached_at = 0")
+                await db._db.commit()
+                await db.close()
+
+            asyncio.run(seed_stale())
+
+            async def select(manager):
+                return await manager.get_ability("static")
+
+            run_with_manager(tmpdir, api, select)
+
+        assert len(api.calls) == 1
+
+
+class TestPokemonIndex:
+    """Test that the list index is maintained as data is cached."""
+
+    def test_detail_and_species_populate_index(self):
+        api = make_api()
+
+        async def scenario(manager):
+            await manager.get_pokemon_detail(25)
+            await manager.get_species(25)
+            return await manager.get_pokemon_index()
+
+        with TemporaryDirectory() as tmpdir:
+            index = run_with_manager(tmpdir, api, scenario)
+
+        assert len(index) == 1
+        entry = index[0]
+        assert entry.id == 25
+        assert entry.name == "pikachu"
+        assert entry.types == ["electric"]
+        assert entry.generation == "generation-i"
+        assert entry.stats["hp"] == 35
+        assert entry.base_stat_total == sum(entry.stats.values())
+
+    def test_form_inherits_species_generation(self):
+        form = load_fixture("pokemon_detail.json")
+        form["id"] = 10080
+        form["name"] = "pikachu-rock-star"
+        api = FakeAPIClient({
+            "/pokemon/10080": form,
+            "/pokemon-species/25": load_fixture("pokemon_species.json"),
+        }, delay=0)
+
+        async def scenario(manager):
+            await manager.get_species(25)
+            await manager.get_pokemon_detail(10080)
+            return await manager.get_pokemon_index()
+
+        with TemporaryDirectory() as tmpdir:
+            index = run_with_manager(tmpdir, api, scenario)
+
+        by_id = {e.id: e for e in index}
+        assert by_id[10080].generation == "generation-i"
+
+    def test_bulk_metadata_merges_with_existing_rows(self):
+        async def scenario(manager):
+            await manager.save_index_metadata({1: ["grass", "poison"]}, {})
+            await manager.save_index_metadata({}, {1: "generation-i", 4: "generation-i"})
+            return await manager.get_pokemon_index()
+
+        with TemporaryDirectory() as tmpdir:
+            index = run_with_manager(tmpdir, make_api(), scenario)
+
+        by_id = {e.id: e for e in index}
+        assert by_id[1].types == ["grass", "poison"]
+        assert by_id[1].generation == "generation-i"
+        assert by_id[4].types == []
+
+
+class TestMemoryTier:
+    """Test that repeat lookups are served from the in-memory cache."""
+
+    def test_repeat_lookup_returns_same_model(self):
+        api = make_api()
+
+        async def scenario(manager):
+            first = await manager.get_move("thunder-shock")
+            second = await manager.get_move("thunder-shock")
+            return first, second, manager.get_memory_stats()
+
+        with TemporaryDirectory() as tmpdir:
+            first, second, stats = run_with_manager(tmpdir, api, scenario)
+
+        assert first is second
+        assert stats["kinds"]["move"]["hits"] == 1
+        assert len(api.calls) == 1
+
+
+class TestTrustedCacheHits:
+    """Test that validation is recorded and skipped on trusted rows."""
+
+    def test_fetched_rows_are_marked_validated(self):
+        api = make_api()
+
+        async def scenario(manager):
+            await manager.get_pokemon_detail(25)
+            return await manager._db.get_cached_entry(
+                "pokemon_detail", 25, ttl=3600
+            )
+
+        with TemporaryDirectory() as tmpdir:
+            entry = run_with_manager(tmpdir, api, scenario)
+
+        assert entry.validated
+
+    def test_unvalidated_rows_are_still_checked(self):
+        async def scenario(manager):
+            await manager._db.save_cached_json(
+                "move", 84, {"id": 84, "name": "thunder-shock"}, name="thunder-shock"
+            )
+            return await manager.get_move("thunder-shock")
+
+        with TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError, match="Invalid move response"):
+                run_with_manager(tmpdir, make_api(), scenario)
+
+
+async def age_row(db: CacheDatabase, table: str, seconds: float) -> None:
+    """Commit pending writes, then backdate every row of `table`."""
+    await db.flush()
+    await db._db.execute(f"UPDATE {table} SET cached_at = ?", (time.time() - seconds,))
+    await db._db.commit()
+
+
+class TestStaleWhileRevalidate:
+    """Test that stale entries are served at once and refreshed behind."""
+
+    def test_stale_entry_served_without_waiting(self):
+        api = make_api()
+
+        async def scenario(manager):
+            await manager.get_move("thunder-shock")
+            await age_row(manager._db, "move", CACHE_TTL_MOVE + 60)
+            manager._memory.clear()
+            api.delay = 0.5
+
+            start = time.perf_counter()
+            move = await manager.get_move("thunder-shock")
+            elapsed = time.perf_counter() - start
+
+            await manager._refresher.wait()
+            refreshed = await manager._db.get_cached_entry_by_name(
+                "move", "thunder-shock", ttl=CACHE_TTL_MOVE
+            )
+            return move, elapsed, refreshed, manager.get_refresh_stats()
+
+        with TemporaryDirectory() as tmpdir:
+            move, elapsed, refreshed, stats = run_with_manager(tmpdir, api, scenario)
+
+        assert move.name == "thunder-shock"
+        assert elapsed < 0.25
+        assert len(api.calls) == 2
+        assert refreshed is not None
+        assert stats["completed"] == 1
+
+    def test_stale_pokemon_list_served_and_refreshed_once(self):
+        listing = {"results": [
+            {"name": "pikachu", "url": "https://pokeapi.co/api/v2/pokemon/25/"},
+        ]}
+        api = FakeAPIClient({"/pokemon?limit=2000": listing}, delay=0.2)
+
+        async def scenario(manager):
+            await manager._db.save_pokemon_list(
+                [{"id": 1, "name": "bulbasaur", "url": "https://pokeapi.co/api/v2/pokemon/1/"}]
+            )
+            await manager._db.set_meta("cached_at", str(time.time() - CACHE_TTL_POKEMON_LIST - 60))
+
+            first = await manager.get_pokemon_list()
+            again = await manager.get_pokemon_list()
+            await manager._refresher.wait()
+            fresh = await manager.get_pokemon_list()
+            return first, again, fresh
+
+        with TemporaryDirectory() as tmpdir:
+            first, again, fresh = run_with_manager(tmpdir, api, scenario)
+
+        assert [p.name for p in first] == ["bulbasaur"]
+        assert [p.name for p in again] == ["bulbasaur"]
+        assert [p.name for p in fresh] == ["pikachu"]
+        assert len(api.calls) == 1
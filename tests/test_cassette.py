@@ -0,0 +1,119 @@
+"""Tests for the record/replay cassette transport."""
+import asyncio
+import json
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import httpx
+import pytest
+
+from src.api.cassette import CassetteTransport, CassetteMissError, RECORD, REPLAY
+from src.api.client import PokeAPIClient
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager
+from tests.fakes import load_fixture
+
+MOVE_URL = "https://pokeapi.co/api/v2/move/thunder-shock"
+PNG = b"\x89PNG\r\n\x1a\nfake"
+
+
+class LiveServer:
+    """Stands in for the network while recording."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if request.url.path.endswith(".png"):
+            return httpx.Response(200, content=PNG)
+        if request.url.path.endswith("/move/thunder-shock"):
+            return httpx.Response(
+                200, content=json.dumps(load_fixture("move.json")).encode(),
+                headers={"ETag": '"v1"'},
+            )
+        return httpx.Response(404)
+
+
+async def record(path: Path, server: LiveServer) -> None:
+    transport = CassetteTransport(path, RECORD, transport=httpx.MockTransport(server))
+    async with PokeAPIClient(transport=transport) as api:
+        await api.get_json(MOVE_URL)
+        await api.get_bytes("https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png")
+        with pytest.raises(httpx.HTTPStatusError):
+            await api.get_json("https://pokeapi.co/api/v2/move/no-such-move")
+
+
+class TestCassette:
+    """Test recording once and replaying offline."""
+
+    def test_replay_serves_recorded_responses_without_network(self):
+        server = LiveServer()
+
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "session.cassette"
+
+            async def scenario():
+                await record(path, server)
+                transport = CassetteTransport(path, REPLAY)
+                async with PokeAPIClient(transport=transport, max_retries=0) as api:
+                    move = await api.get_json(MOVE_URL)
+                    sprite = await api.get_bytes(
+                        "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png"
+                    )
+                    revalidated = await api.get_json_conditional(MOVE_URL, etag='"v1"')
+                    with pytest.raises(httpx.HTTPStatusError):
+                        await api.get_json("https://pokeapi.co/api/v2/move/no-such-move")
+                    with pytest.raises(CassetteMissError):
+                        await api.get_json("https://pokeapi.co/api/v2/move/never-recorded")
+                return move, sprite, revalidated, len(transport)
+
+            move, sprite, revalidated, recorded = asyncio.run(scenario())
+
+        assert server.requests == 3
+        assert recorded == 3
+        assert move["name"] == "thunder-shock"
+        assert sprite == PNG
+        assert revalidated.not_modified
+
+    def test_replay_applies_latency_and_bandwidth(self):
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "session.cassette"
+
+            async def scenario():
+                await record(path, LiveServer())
+                size = len(json.dumps(load_fixture("move.json")))
+                transport = CassetteTransport(path, REPLAY, latency=0.05, bandwidth=size / 0.05)
+                async with PokeAPIClient(transport=transport) as api:
+                    start = time.perf_counter()
+                    await api.get_json(MOVE_URL)
+                    return time.perf_counter() - start
+
+            elapsed = asyncio.run(scenario())
+
+        assert 0.1 <= elapsed < 0.5
+
+    def test_cache_manager_runs_cold_then_warm_offline(self):
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "session.cassette"
+
+            async def scenario():
+                await record(path, LiveServer())
+                transport = CassetteTransport(path, REPLAY, latency=0.02)
+                async with PokeAPIClient(transport=transport) as api:
+                    cache = CacheManager(api_client=api, db=CacheDatabase(Path(tmpdir) / "cache.db"))
+                    await cache.get_move("thunder-shock")
+                    await cache.get_move("thunder-shock")
+                    await cache.close()
+                return transport.replayed
+
+            assert asyncio.run(scenario()) == 1
+
+    def test_unknown_format_is_rejected(self):
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "session.cassette"
+            path.write_text(json.dumps({"version": 99, "interactions": []}))
+
+            with pytest.raises(ValueError, match="not supported"):
+                CassetteTransport(path, REPLAY)
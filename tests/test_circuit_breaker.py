@@ -0,0 +1,125 @@
+"""Tests for the per-host circuit breaker and stale fallback when the API is down."""
+import asyncio
+import json
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import httpx
+import pytest
+
+from src.api.breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+from src.api.client import PokeAPIClient
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager
+from src.constants import CACHE_HARD_TTL_MOVE
+from tests.fakes import load_fixture
+
+URL = "https://pokeapi.co/api/v2/move/thunder-shock"
+
+
+class OutageServer:
+    """MockTransport handler that serves a move, or refuses every connection."""
+
+    def __init__(self) -> None:
+        self.down = False
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.down:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(200, content=json.dumps(load_fixture("move.json")).encode())
+
+
+def make_client(server: OutageServer) -> PokeAPIClient:
+    return PokeAPIClient(transport=httpx.MockTransport(server), max_retries=0)
+
+
+class TestCircuitBreaker:
+    """Test state transitions."""
+
+    def test_opens_after_threshold_and_half_opens_after_timeout(self):
+        breaker = CircuitBreaker("pokeapi.co", failure_threshold=2, reset_timeout=0.05)
+
+        breaker.record_failure()
+        breaker.check()
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        state_when_open = breaker.state
+
+        time.sleep(0.06)
+        breaker.check()  # Trial request allowed
+        state_on_trial = breaker.state
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+        time.sleep(0.06)
+        breaker.check()
+        breaker.record_success()
+
+        assert (state_when_open, state_on_trial, breaker.state) == (OPEN, HALF_OPEN, CLOSED)
+        assert breaker.get_stats()["opened"] == 2
+        assert breaker.get_stats()["rejected"] == 2
+
+    def test_client_fails_fast_once_open(self):
+        server = OutageServer()
+        server.down = True
+
+        async def scenario():
+            client = make_client(server)
+            errors = []
+            for _ in range(8):
+                try:
+                    await client.get_json(URL)
+                except Exception as e:
+                    errors.append(type(e))
+            degraded = client.is_degraded()
+            await client.close()
+            return errors, degraded
+
+        errors, degraded = asyncio.run(scenario())
+
+        assert errors[:5] == [httpx.ConnectError] * 5
+        assert errors[5:] == [CircuitOpenError] * 3
+        assert server.requests == 5
+        assert degraded
+
+
+class TestStaleFallback:
+    """Test that CacheManager serves expired rows while the API is unreachable."""
+
+    def test_expired_row_served_when_api_is_down(self):
+        server = OutageServer()
+
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                cache = CacheManager(make_client(server), CacheDatabase(Path(tmpdir) / "cache.db"))
+                await cache.get_move("thunder-shock")
+                await cache._db.flush()
+                await cache._db._db.execute(
+                    "UPDATE move SET cached_at = ?", (time.time() - CACHE_HARD_TTL_MOVE - 1,)
+                )
+                await cache._db._db.commit()
+                cache._memory.invalidate("move", "thunder-shock")
+
+                server.down = True
+                served = [await cache.get_move("thunder-shock") for _ in range(2)]
+                with pytest.raises(httpx.ConnectError):
+                    await cache.get_ability("static")  # Nothing cached to fall back to
+
+                server.down = False
+                fresh = await cache.get_move("thunder-shock")
+                metrics = cache.get_metrics()
+                await cache.close()
+                return served, fresh, metrics
+
+            served, fresh, metrics = asyncio.run(scenario())
+
+        assert [move.name for move in served] == ["thunder-shock", "thunder-shock"]
+        assert fresh.name == "thunder-shock"
+        # Expired models stay out of memory, so recovery is picked up at once
+        assert metrics["tiers"]["move"]["expired"]["outcomes"] == {"hit": 2}
+        assert metrics["tiers"]["move"]["http"]["outcomes"] == {"ok": 2, "error": 2}
@@ -0,0 +1,148 @@
+"""Tests for PokeAPIClient retries and the adaptive concurrency limiter."""
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from src.api.client import PokeAPIClient, parse_retry_after
+from src.api.limiter import AdaptiveLimiter
+
+URL = "https://pokeapi.co/api/v2/move/thunder-shock"
+
+
+class ScriptedServer:
+    """MockTransport handler returning queued responses, then 200s."""
+
+    def __init__(self, script: list) -> None:
+        self.script = list(script)
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        step = self.script.pop(0) if self.script else httpx.Response(200, json={"id": 84})
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+
+def make_client(server: ScriptedServer, **kwargs) -> PokeAPIClient:
+    kwargs.setdefault("retry_base_delay", 0)
+    return PokeAPIClient(transport=httpx.MockTransport(server), **kwargs)
+
+
+class TestRetries:
+    """Test which failures are retried and how long the client waits."""
+
+    def test_throttle_is_retried_and_shrinks_limit(self):
+        server = ScriptedServer([httpx.Response(429, headers={"Retry-After": "0"})])
+
+        async def scenario():
+            client = make_client(server)
+            body = await client.get_json(URL)
+            stats = client.get_stats()
+            await client.close()
+            return body, stats
+
+        body, stats = asyncio.run(scenario())
+
+        assert body == {"id": 84}
+        assert server.requests == 2
+        host = stats["hosts"]["pokeapi.co"]
+        assert stats["retries"] == 1 and host["throttled"] == 1
+        assert host["limit"] < 10
+
+    def test_connection_errors_are_retried(self):
+        server = ScriptedServer([httpx.ConnectError("refused"), httpx.Response(502)])
+
+        async def scenario():
+            client = make_client(server)
+            body = await client.get_json(URL)
+            await client.close()
+            return body
+
+        assert asyncio.run(scenario()) == {"id": 84}
+        assert server.requests == 3
+
+    def test_gives_up_after_max_retries(self):
+        server = ScriptedServer([httpx.Response(500)] * 5)
+
+        async def scenario():
+            client = make_client(server, max_retries=2)
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_json(URL)
+            stats = client.get_stats()
+            await client.close()
+            return stats
+
+        stats = asyncio.run(scenario())
+
+        assert server.requests == 3
+        assert stats["failed"] == 1
+
+    def test_client_errors_are_not_retried(self):
+        server = ScriptedServer([httpx.Response(404)])
+
+        async def scenario():
+            client = make_client(server)
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_json(URL)
+            await client.close()
+
+        asyncio.run(scenario())
+        assert server.requests == 1
+
+    def test_backoff_is_jittered_and_capped(self):
+        client = PokeAPIClient(retry_base_delay=1.0, retry_max_delay=5.0)
+        delays = [client._retry_delay(attempt, None) for attempt in range(10) for _ in range(20)]
+
+        assert all(0 <= delay <= 5.0 for delay in delays)
+        assert len(set(delays)) > 1
+        throttled = httpx.Response(429, headers={"Retry-After": "120"})
+        assert client._retry_delay(0, throttled) == 5.0
+
+    def test_parse_retry_after(self):
+        future = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+        assert parse_retry_after("3") == 3.0
+        assert 55 < parse_retry_after(format_datetime(future, usegmt=True)) <= 60
+        assert parse_retry_after("Wed, 01 Jan 2020 00:00:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestAdaptiveLimiter:
+    """Test AIMD limit changes and that the limit caps concurrency."""
+
+    def test_additive_increase_multiplicative_decrease(self):
+        limiter = AdaptiveLimiter(initial=8, minimum=1, maximum=10, cooldown=60)
+
+        limiter.on_throttle()
+        limiter.on_throttle()  # Same burst: ignored within the cooldown
+        after_throttle = limiter.limit
+        for _ in range(5):  # About one limit's worth of successes adds one
+            limiter.on_success()
+
+        assert after_throttle == 4
+        assert limiter.limit == 5
+        assert limiter.get_stats()["throttled"] == 2
+        assert limiter.get_stats()["decreases"] == 1
+
+    def test_limit_caps_requests_in_flight(self):
+        limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=2)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def scenario():
+            await asyncio.gather(*(request() for _ in range(6)))
+
+        asyncio.run(scenario())
+
+        assert peak == 2
+        assert limiter.in_flight == 0
@@ -0,0 +1,160 @@
+"""Tests for cached payload storage codecs."""
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.api.parsers import (
+    parse_pokemon_detail,
+    parse_pokemon_species,
+    parse_ability,
+    parse_move,
+    parse_type_effectiveness,
+)
+from src.cache.codec import PayloadCodec, build_dictionary, trim_payload
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager
+from tests.fakes import FakeAPIClient, load_fixture
+
+
+TRIM_CASES = [
+    ("pokemon_detail", "pokemon_detail.json", parse_pokemon_detail),
+    ("pokemon_species", "pokemon_species.json", parse_pokemon_species),
+    ("ability", "ability.json", parse_ability),
+    ("move", "move.json", parse_move),
+    ("type", "type.json", parse_type_effectiveness),
+]
+
+
+class TestPayloadCodec:
+    """Test encoding, decoding and trimming of payloads."""
+
+    @pytest.mark.parametrize("name", ["json", "zlib"])
+    def test_round_trip(self, name):
+        codec = PayloadCodec(name)
+        data = load_fixture("pokemon_detail.json")
+
+        value, tag = codec.encode("pokemon_detail", data)
+
+        assert tag == name
+        assert codec.decode(value, tag) == data
+
+    def test_zlib_is_smaller_than_json(self):
+        data = load_fixture("pokemon_detail.json")
+        text, _ = PayloadCodec("json").encode("pokemon_detail", data)
+        blob, _ = PayloadCodec("zlib").encode("pokemon_detail", data)
+
+        assert len(blob) < len(text)
+
+    @pytest.mark.parametrize("table,fixture,parser", TRIM_CASES)
+    def test_trimmed_payload_parses_identically(self, table, fixture, parser):
+        data = load_fixture(fixture)
+        assert parser(trim_payload(table, data)) == parser(data)
+
+    def test_dictionary_round_trip(self):
+        samples = {
+            table: [PayloadCodec("json").encode(table, load_fixture(fixture))[0].encode()]
+            for table, fixture, _ in TRIM_CASES
+        }
+        codec = PayloadCodec("zlib")
+        codec.add_dictionary(1, build_dictionary(samples, "zlib"))
+        data = load_fixture("move.json")
+
+        value, tag = codec.encode("move", data)
+
+        assert tag == "zlib:1"
+        assert codec.decode(value, tag) == data
+        plain, _ = PayloadCodec("zlib").encode("move", data)
+        assert len(value) < len(plain)
+
+    def test_zlib_dictionary_covers_every_table(self):
+        samples = {
+            "pokemon_detail": [b"d" * 40_000],
+            "move": [b"m" * 40_000],
+            "generation": [b"g" * 40_000],
+        }
+
+        dictionary = build_dictionary(samples, "zlib")
+
+        assert len(dictionary) <= 32 * 1024
+        assert {b"d", b"m", b"g"} <= {bytes([c]) for c in dictionary}
+        assert dictionary.endswith(b"g")
+
+    def test_unknown_codec_rejected(self):
+        with pytest.raises(ValueError, match="Unknown storage codec"):
+            PayloadCodec("lz4")
+
+
+class TestStorageMigration:
+    """Test that existing rows migrate transparently between codecs."""
+
+    def test_json_rows_migrate_to_zlib(self):
+        async def scenario(db_path):
+            legacy = CacheDatabase(db_path, codec="json", trim=False)
+            await legacy.initialize()
+            await legacy.save_cached_json(
+                "move", 84, load_fixture("move.json"), name="thunder-shock"
+            )
+            await legacy.close()
+
+            db = CacheDatabase(db_path, codec="zlib", trim=True)
+            await db.initialize()
+            before = await db.get_cached_json("move", 84, ttl=3600)
+            migrated = await db.migrate_storage()
+            after = await db.get_cached_json("move", 84, ttl=3600)
+            report = await db.storage_report()
+            await db.close()
+            return before, migrated, after, report
+
+        with TemporaryDirectory() as tmpdir:
+            before, migrated, after, report = asyncio.run(
+                scenario(Path(tmpdir) / "cache.db")
+            )
+
+        assert migrated == 1
+        assert parse_move(before) == parse_move(after)
+        assert report["tables"]["move"]["codecs"] == {"zlib": 1}
+        assert report["tables"]["move"]["decode_ms_per_row"] > 0
+
+    def test_trained_dictionary_survives_reopen(self):
+        async def scenario(db_path):
+            db = CacheDatabase(db_path, codec="zlib")
+            await db.initialize()
+            await db.save_cached_json("ability", 9, load_fixture("ability.json"), name="static")
+            dictionary_id = await db.train_storage_dictionary()
+            await db.migrate_storage()
+            await db.close()
+
+            reopened = CacheDatabase(db_path, codec="zlib")
+            await reopened.initialize()
+            data = await reopened.get_cached_json("ability", 9, ttl=3600)
+            report = await reopened.storage_report()
+            await reopened.close()
+            return dictionary_id, data, report
+
+        with TemporaryDirectory() as tmpdir:
+            dictionary_id, data, report = asyncio.run(
+                scenario(Path(tmpdir) / "cache.db")
+            )
+
+        assert parse_ability(data).name == "static"
+        assert report["codec"] == f"zlib:{dictionary_id}"
+
+    def test_manager_migrates_legacy_rows(self):
+        async def scenario(db_path):
+            legacy = CacheDatabase(db_path, codec="json", trim=False)
+            await legacy.initialize()
+            await legacy.save_cached_json("ability", 9, load_fixture("ability.json"), name="static")
+            await legacy.close()
+
+            manager = CacheManager(api_client=FakeAPIClient({}), db=CacheDatabase(db_path))
+            report = await manager.optimize_storage()
+            await manager.close()
+            return report
+
+        with TemporaryDirectory() as tmpdir:
+            report = asyncio.run(scenario(Path(tmpdir) / "cache.db"))
+
+        assert report["migrated"] == 1
+        assert report["tables"]["ability"]["codecs"] == {"zlib": 1}
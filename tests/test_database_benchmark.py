@@ -0,0 +1,131 @@
+"""Benchmark of cache reads gathered alongside batched writes.
+
+Correctness checks always run; timings run with
+`POKEDEX_BENCHMARKS=1 python -m pytest tests/test_database_benchmark.py -s`.
+"""
+import asyncio
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.cache.database import CacheDatabase
+from tests.benchmarking import benchmark
+from tests.fakes import load_fixture
+
+
+ROWS = 200
+
+
+async def seed(db_path: Path) -> None:
+    db = CacheDatabase(db_path)
+    await db.initialize()
+    data = load_fixture("move.json")
+    for move_id in range(1, ROWS + 1):
+        await db.save_cached_json("move", move_id, data, name=f"move-{move_id}")
+    await db.close()
+
+
+async def gather_reads(db_path: Path, read_connections: int) -> list:
+    db = CacheDatabase(db_path, read_connections=read_connections)
+    await db.initialize()
+    results = await asyncio.gather(*(
+        db.get_cached_entry_by_name("move", f"move-{i}", ttl=3600)
+        for i in range(1, ROWS + 1)
+    ))
+    await db.close()
+    return results
+
+
+async def mixed_workload(db_path: Path, read_connections: int, legacy: bool = False) -> tuple[float, float]:
+    """Gather point lookups while small batches are committed alongside.
+
+    Returns (seconds until all reads finished, total seconds). `legacy`
+    switches back to the old rollback journal with synchronous=FULL.
+    """
+    db = CacheDatabase(db_path, read_connections=read_connections)
+    await db.initialize()
+    if legacy:
+        await db._db.execute("PRAGMA journal_mode = DELETE")
+        await db._db.execute("PRAGMA synchronous = FULL")
+    data = load_fixture("move.json")
+
+    async def write_batches():
+        for batch in range(50):
+            for i in range(5):
+                move_id = ROWS + batch * 5 + i + 1
+                await db.save_cached_json("move", move_id, data, name=f"move-{move_id}")
+            await db.flush()
+
+    start = time.perf_counter()
+    writer = asyncio.create_task(write_batches())
+    for _ in range(5):
+        await asyncio.gather(*(
+            db.get_cached_entry("move", i, ttl=3600) for i in range(1, ROWS + 1)
+        ))
+    reads_done = time.perf_counter() - start
+    await writer
+    total = time.perf_counter() - start
+    await db.close()
+    return reads_done, total
+
+
+class TestReadPool:
+    """Test WAL mode and the optional read pool."""
+
+    def test_database_uses_wal(self):
+        async def scenario(db_path):
+            db = CacheDatabase(db_path)
+            await db.initialize()
+            async with db._db.execute("PRAGMA journal_mode") as cursor:
+                mode = (await cursor.fetchone())[0]
+            await db.close()
+            return mode
+
+        with TemporaryDirectory() as tmpdir:
+            assert asyncio.run(scenario(Path(tmpdir) / "cache.db")) == "wal"
+
+    def test_pooled_reads_return_every_row(self):
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+            asyncio.run(seed(db_path))
+            results = asyncio.run(gather_reads(db_path, read_connections=4))
+
+        assert all(entry is not None for entry in results)
+        assert results[0].data["name"] == "thunder-shock"
+
+    def test_readers_see_flushed_writes(self):
+        async def scenario(db_path):
+            db = CacheDatabase(db_path, read_connections=2)
+            await db.initialize()
+            await db.save_cached_json("move", 84, load_fixture("move.json"), name="thunder-shock")
+            await db.flush()
+            # Committed rows are read through the pool, not the pending copy
+            pending = dict(db._pending_rows)
+            entry = await db.get_cached_entry("move", 84, ttl=3600)
+            await db.close()
+            return pending, entry
+
+        with TemporaryDirectory() as tmpdir:
+            pending, entry = asyncio.run(scenario(Path(tmpdir) / "cache.db"))
+
+        assert pending == {}
+        assert entry is not None
+
+    @benchmark
+    def test_report_mixed_read_write_timings(self):
+        configs = [
+            ("rollback journal, 1 connection", 0, True),
+            ("WAL, 1 connection", 0, False),
+            ("WAL, 2 readers", 2, False),
+            ("WAL, 4 readers", 4, False),
+        ]
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+            asyncio.run(seed(db_path))
+            for label, readers, legacy in configs:
+                runs = [asyncio.run(mixed_workload(db_path, readers, legacy)) for _ in range(3)]
+                reads_done, total = min(runs, key=lambda run: run[1])
+                print(
+                    f"\n{label:32s} {5 * ROWS} reads done {reads_done * 1e3:7.1f} ms  "
+                    f"with 250 writes {total * 1e3:7.1f} ms"
+                )
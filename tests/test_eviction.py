@@ -0,0 +1,115 @@
+"""Tests for access tracking and size-bounded eviction of cached rows."""
+import asyncio
+import sqlite3
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.cache.database import CacheDatabase
+from tests.fakes import load_fixture
+
+
+def row_ids(db_path: Path, table: str) -> list[int]:
+    with sqlite3.connect(db_path) as conn:
+        return [row[0] for row in conn.execute(f"SELECT id FROM {table} ORDER BY id")]
+
+
+async def save_moves(db: CacheDatabase, ids: range) -> None:
+    move = load_fixture("move.json")
+    for move_id in ids:
+        await db.save_cached_json("move", move_id, {**move, "id": move_id}, name=f"move-{move_id}")
+    await db.flush()
+
+
+async def set_last_accessed(db: CacheDatabase, table: str, times: dict[int, float]) -> None:
+    await db._db.executemany(
+        f"UPDATE {table} SET last_accessed = ? WHERE id = ?",
+        [(at, item_id) for item_id, at in times.items()],
+    )
+    await db._db.commit()
+
+
+class TestAccessTracking:
+    """Test that cache hits update last_accessed through batched writes."""
+
+    def test_hits_update_last_accessed_on_flush(self):
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                db = CacheDatabase(Path(tmpdir) / "cache.db")
+                await db.initialize()
+                await save_moves(db, range(1, 4))
+                await set_last_accessed(db, "move", {1: 1.0, 2: 1.0, 3: 1.0})
+
+                await db.get_cached_entry_by_name("move", "move-2", ttl=3600)
+                before_flush = await db._db.execute_fetchall(
+                    "SELECT id FROM move WHERE last_accessed > 1 ORDER BY id"
+                )
+                await db.flush()
+                after_flush = await db._db.execute_fetchall(
+                    "SELECT id FROM move WHERE last_accessed > 1 ORDER BY id"
+                )
+                await db.close()
+                return [r[0] for r in before_flush], [r[0] for r in after_flush]
+
+            before_flush, after_flush = asyncio.run(scenario())
+
+        assert before_flush == []
+        assert after_flush == [2]
+
+
+class TestEnforceBudget:
+    """Test LRU eviction against per-table and overall byte budgets."""
+
+    def test_table_budget_evicts_least_recently_used(self):
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+
+            async def scenario():
+                db = CacheDatabase(db_path, table_max_bytes={})
+                await db.initialize()
+                await save_moves(db, range(1, 6))
+                sizes = dict(await db._db.execute_fetchall("SELECT id, LENGTH(data_json) FROM move"))
+                # Oldest first: 4, 2, 5, 1, 3; only the three newest fit
+                await set_last_accessed(db, "move", {4: 10.0, 2: 20.0, 5: 30.0, 1: 40.0, 3: 50.0})
+                db._table_max_bytes = {"move": sizes[1] + sizes[3] + sizes[5]}
+                evicted = await db.enforce_budget()
+                await db.close()
+                return evicted, sizes
+
+            evicted, sizes = asyncio.run(scenario())
+            remaining = row_ids(db_path, "move")
+
+        assert evicted == {"rows": 2, "bytes": sizes[4] + sizes[2]}
+        assert remaining == [1, 3, 5]
+
+    def test_overall_budget_spans_tables_and_vacuums(self):
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+
+            async def scenario():
+                db = CacheDatabase(db_path, table_max_bytes={}, max_bytes=0)
+                await db.initialize()
+                await save_moves(db, range(1, 4))
+                await db.save_cached_json("ability", 9, load_fixture("ability.json"), name="static")
+                await db.flush()
+                sizes = await db.table_sizes()
+                await set_last_accessed(db, "move", {1: 10.0, 2: 30.0, 3: 40.0})
+                await set_last_accessed(db, "ability", {9: 20.0})
+
+                move_sizes = dict(await db._db.execute_fetchall("SELECT id, LENGTH(data_json) FROM move"))
+                # Room for everything but the two least recently used rows
+                db._max_bytes = sum(sizes.values()) - sizes["ability"] - move_sizes[1]
+                evicted = await db.enforce_budget()
+                vacuum = await db._db.execute_fetchall("PRAGMA auto_vacuum")
+                free_pages = await db._db.execute_fetchall("PRAGMA freelist_count")
+                await db.close()
+                return evicted, vacuum[0][0], free_pages[0][0]
+
+            evicted, vacuum, free_pages = asyncio.run(scenario())
+            moves = row_ids(db_path, "move")
+            abilities = row_ids(db_path, "ability")
+
+        assert evicted["rows"] == 2
+        assert moves == [2, 3]
+        assert abilities == []
+        assert vacuum == 2  # INCREMENTAL
+        assert free_pages == 0
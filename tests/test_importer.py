@@ -0,0 +1,81 @@
+"""Tests for the offline PokeAPI data dump import."""
+import asyncio
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.cache.database import CacheDatabase
+from src.cache.importer import DatasetImporter, find_dump_root
+from src.cache.manager import CacheManager
+from tests.fakes import FakeAPIClient, load_fixture
+
+DUMP_FILES = {
+    "pokemon/25": "pokemon_detail.json",
+    "pokemon-species/25": "pokemon_species.json",
+    "ability/9": "ability.json",
+    "move/84": "move.json",
+    "type/10": "type.json",
+    "generation/1": "generation.json",
+}
+
+
+def write_dump(root: Path) -> Path:
+    """Write a tiny dump in the api-data layout and return its api/v2 directory."""
+    api = root / "data" / "api" / "v2"
+    for resource, fixture in DUMP_FILES.items():
+        (api / resource).mkdir(parents=True)
+        (api / resource / "index.json").write_text(json.dumps(load_fixture(fixture)))
+    # Resource list pages sit next to the per-id directories and are skipped
+    (api / "pokemon" / "index.json").write_text(json.dumps({"count": 1, "results": []}))
+    (api / "move" / "85").mkdir()
+    (api / "move" / "85" / "index.json").write_text('{"id": 85')
+    return api
+
+
+class TestDatasetImporter:
+    """Test bulk-loading a dump so the cache works without network."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_import_serves_cache_offline(self, workers):
+        with TemporaryDirectory() as tmpdir:
+            write_dump(Path(tmpdir))
+
+            async def scenario():
+                db = CacheDatabase(Path(tmpdir) / "cache.db")
+                await db.initialize()
+                results = await DatasetImporter(db, workers=workers).run(Path(tmpdir))
+                await db.close()
+
+                api = FakeAPIClient({})
+                manager = CacheManager(api_client=api, db=CacheDatabase(Path(tmpdir) / "cache.db"))
+                summaries = await manager.get_pokemon_list()
+                detail = await manager.get_pokemon_detail(25)
+                move = await manager.get_move("thunder-shock")
+                type_eff = await manager.get_type("fire")
+                index = await manager.get_pokemon_index()
+                await manager.close()
+                return results, summaries, detail, move, type_eff, index, api.calls
+
+            results, summaries, detail, move, type_eff, index, calls = asyncio.run(scenario())
+
+        assert calls == []
+        by_resource = {r.resource: r for r in results}
+        assert by_resource["pokemon"].imported == 1
+        assert by_resource["move"].imported == 1
+        assert by_resource["move"].failed == 1
+        assert [(p.id, p.name) for p in summaries] == [(25, "pikachu")]
+        assert detail.name == "pikachu"
+        assert move.id == 84
+        assert type_eff.name == "fire"
+        assert index[0].generation == "generation-i"
+        assert index[0].types == ["electric"]
+
+    def test_find_dump_root_accepts_checkout_or_api_dir(self):
+        with TemporaryDirectory() as tmpdir:
+            api = write_dump(Path(tmpdir))
+            assert find_dump_root(Path(tmpdir)) == api
+            assert find_dump_root(api) == api
+            with pytest.raises(FileNotFoundError):
+                find_dump_root(api / "pokemon")
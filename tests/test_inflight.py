@@ -0,0 +1,124 @@
+"""Tests for single-flight request coalescing."""
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.cache.database import CacheDatabase
+from src.cache.inflight import InFlightRegistry
+from src.cache.manager import CacheManager
+from tests.fakes import FakeAPIClient, load_fixture
+
+
+class TestInFlightRegistry:
+    """Test keyed coalescing of concurrent awaitables."""
+
+    def test_concurrent_calls_share_one_task(self):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def scenario():
+            registry = InFlightRegistry()
+            results = await asyncio.gather(
+                *(registry.run(("move", "tackle"), fetch) for _ in range(5))
+            )
+            return registry, results
+
+        registry, results = asyncio.run(scenario())
+
+        assert calls == 1
+        assert results == ["result"] * 5
+        assert registry.started == 1
+        assert registry.coalesced == 4
+        assert registry.in_flight() == 0
+
+    def test_different_keys_run_separately(self):
+        async def scenario():
+            registry = InFlightRegistry()
+            await asyncio.gather(
+                registry.run(("move", "tackle"), lambda: asyncio.sleep(0.01)),
+                registry.run(("ability", "tackle"), lambda: asyncio.sleep(0.01)),
+            )
+            return registry
+
+        registry = asyncio.run(scenario())
+
+        assert registry.started == 2
+        assert registry.coalesced == 0
+
+    def test_key_released_after_completion(self):
+        async def scenario():
+            registry = InFlightRegistry()
+            await registry.run("key", lambda: asyncio.sleep(0))
+            await registry.run("key", lambda: asyncio.sleep(0))
+            return registry
+
+        registry = asyncio.run(scenario())
+
+        assert registry.started == 2
+        assert registry.coalesced == 0
+
+    def test_errors_propagate_to_all_waiters(self):
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def scenario():
+            registry = InFlightRegistry()
+            return await asyncio.gather(
+                registry.run("key", failing),
+                registry.run("key", failing),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(scenario())
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_cancelled_waiter_does_not_cancel_others(self):
+        async def scenario():
+            registry = InFlightRegistry()
+
+            async def fetch():
+                await asyncio.sleep(0.05)
+                return 42
+
+            first = asyncio.ensure_future(registry.run("key", fetch))
+            second = asyncio.ensure_future(registry.run("key", fetch))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(scenario()) == 42
+
+
+class TestCacheManagerCoalescing:
+    """Test that CacheManager fetches each resource once under concurrency."""
+
+    def test_concurrent_detail_requests_fetch_once(self):
+        api = FakeAPIClient({"/pokemon/25": load_fixture("pokemon_detail.json")})
+
+        async def scenario(tmpdir):
+            manager = CacheManager(
+                api_client=api, db=CacheDatabase(Path(tmpdir) / "cache.db")
+            )
+            await manager.initialize()
+            results = await asyncio.gather(
+                *(manager.get_pokemon_detail(25) for _ in range(4))
+            )
+            stats = manager.get_inflight_stats()
+            await manager.close()
+            return results, stats
+
+        with TemporaryDirectory() as tmpdir:
+            results, stats = asyncio.run(scenario(tmpdir))
+
+        assert len(api.calls) == 1
+        assert all(r.name == "pikachu" for r in results)
+        assert stats["coalesced"] == 3
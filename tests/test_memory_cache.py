@@ -0,0 +1,71 @@
+"""Tests for the in-memory model LRU cache."""
+import pytest
+
+from src.api.parsers import parse_pokemon_detail, parse_move
+from src.cache.memory import ModelLRUCache, estimate_size
+from tests.fakes import load_fixture
+
+
+class TestModelLRUCache:
+    """Test per-kind limits, byte budget and statistics."""
+
+    def test_hit_and_miss_counted(self):
+        cache = ModelLRUCache({"move": 4}, max_bytes=10**7)
+        move = parse_move(load_fixture("move.json"))
+
+        assert cache.get("move", "thunder-shock") is None
+        cache.put("move", "thunder-shock", move)
+        assert cache.get("move", "thunder-shock") is move
+
+        stats = cache.get_stats()["kinds"]["move"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_per_kind_capacity_evicts_lru(self):
+        cache = ModelLRUCache({"move": 2, "ability": 2}, max_bytes=10**7)
+        cache.put("ability", "static", "ability")
+        cache.put("move", "a", "A")
+        cache.put("move", "b", "B")
+        cache.get("move", "a")  # "b" is now least recently used
+        cache.put("move", "c", "C")
+
+        assert cache.get("move", "b") is None
+        assert cache.get("move", "a") == "A"
+        assert cache.get("move", "c") == "C"
+        # Other kinds are unaffected by a full move partition
+        assert cache.get("ability", "static") == "ability"
+        assert cache.get_stats()["kinds"]["move"]["evictions"] == 1
+
+    def test_byte_budget_evicts_across_kinds(self):
+        detail = parse_pokemon_detail(load_fixture("pokemon_detail.json"))
+        size = estimate_size(detail)
+        cache = ModelLRUCache({"pokemon_detail": 10}, max_bytes=size * 2 + size // 2)
+
+        for pokemon_id in range(3):
+            cache.put("pokemon_detail", pokemon_id, parse_pokemon_detail(
+                load_fixture("pokemon_detail.json")
+            ))
+
+        stats = cache.get_stats()
+        assert stats["kinds"]["pokemon_detail"]["entries"] == 2
+        assert stats["bytes"] <= stats["max_bytes"]
+        assert cache.get("pokemon_detail", 0) is None
+
+    def test_zero_capacity_disables_kind(self):
+        cache = ModelLRUCache({"move": 0}, max_bytes=10**7)
+        cache.put("move", "a", "A")
+        assert cache.get("move", "a") is None
+
+    def test_invalidate_removes_entry(self):
+        cache = ModelLRUCache({}, max_bytes=10**7)
+        cache.put("type", "fire", "FIRE")
+        cache.invalidate("type", "fire")
+
+        assert cache.get("type", "fire") is None
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_estimate_size_grows_with_content(self):
+        small = parse_move(load_fixture("move.json"))
+        large = parse_pokemon_detail(load_fixture("pokemon_detail.json"))
+        assert estimate_size(large) > estimate_size(small) > 0
@@ -0,0 +1,50 @@
+"""Tests for bulk filter metadata loading."""
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager
+from src.cache.metadata import FilterMetadataLoader
+from tests.fakes import FakeAPIClient, load_fixture
+
+
+class TestFilterMetadataLoader:
+    """Test building type/generation maps from bulk resources."""
+
+    def test_maps_built_from_type_and_generation(self):
+        fire = load_fixture("type.json")
+        flying = {
+            "id": 3, "name": "flying", "damage_relations": {},
+            "pokemon": [
+                {"pokemon": {"name": "charizard", "url": "https://pokeapi.co/api/v2/pokemon/6/"}, "slot": 2},
+            ],
+        }
+        api = FakeAPIClient({
+            "/type/fire": fire,
+            "/type/flying": flying,
+            "/generation/generation-i": load_fixture("generation.json"),
+        }, delay=0)
+
+        async def scenario(tmpdir):
+            manager = CacheManager(
+                api_client=api, db=CacheDatabase(Path(tmpdir) / "cache.db")
+            )
+            try:
+                return await FilterMetadataLoader(manager).load()
+            finally:
+                await manager.close()
+
+        with TemporaryDirectory() as tmpdir:
+            metadata = asyncio.run(scenario(tmpdir))
+
+        assert metadata.types[6] == ["fire", "flying"]
+        assert metadata.types[228] == ["fire"]
+        assert metadata.generations[25] == "generation-i"
+        assert metadata.generations[6] == "generation-i"
+        # Only the resources without fixtures are reported as failed
+        assert "type/fire" not in metadata.failed
+        assert "type/water" in metadata.failed
+        assert len(api.calls) == 27
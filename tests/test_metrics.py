@@ -0,0 +1,70 @@
+"""Tests for per-tier cache metrics."""
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager
+from src.cache.metrics import CacheMetrics, LatencyHistogram
+from tests.fakes import FakeAPIClient, load_fixture
+
+
+class TestLatencyHistogram:
+    """Test bucket counting and percentile estimates."""
+
+    def test_percentiles_use_bucket_bounds(self):
+        histogram = LatencyHistogram((1, 10, 100))
+        for ms in [0.5] * 90 + [5] * 9 + [400]:
+            histogram.observe(ms / 1000)
+
+        summary = histogram.to_dict()
+
+        assert summary["count"] == 100
+        assert summary["p50_ms"] == 1
+        assert summary["p99_ms"] == 10
+        assert histogram.percentile(1.0) == 400  # Overflow bucket reports the max
+        assert summary["buckets"] == {"1": 90, "10": 9, "inf": 1}
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().to_dict()["p50_ms"] == 0.0
+
+    def test_snapshot_groups_by_kind_and_tier(self):
+        metrics = CacheMetrics()
+        metrics.observe("move", "l1", "miss", 0.0001)
+        metrics.observe("move", "l1", "hit", 0.0001)
+        metrics.observe("move", "http", "ok", 0.2)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["move"]["l1"]["outcomes"] == {"miss": 1, "hit": 1}
+        assert snapshot["move"]["http"]["latency"]["count"] == 1
+
+
+class TestCacheManagerMetrics:
+    """Test that each tier records where a lookup was served from."""
+
+    def test_lookups_are_attributed_to_tiers(self):
+        api = FakeAPIClient({"move/thunder-shock": load_fixture("move.json")}, delay=0.02)
+
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                cache = CacheManager(api_client=api, db=CacheDatabase(Path(tmpdir) / "cache.db"))
+                await cache.initialize()
+                # Two concurrent cold lookups: one fetch, one coalesced waiter
+                await asyncio.gather(cache.get_move("thunder-shock"), cache.get_move("thunder-shock"))
+                await cache.get_move("thunder-shock")
+                cache._memory.invalidate("move", "thunder-shock")
+                await cache.get_move("thunder-shock")
+                metrics = cache.get_metrics()
+                await cache.close()
+                return metrics
+
+            metrics = asyncio.run(scenario())
+
+        move = metrics["tiers"]["move"]
+        assert move["l1"]["outcomes"] == {"miss": 3, "hit": 1}
+        assert move["coalesced"]["outcomes"] == {"hit": 1}
+        assert move["sqlite"]["outcomes"] == {"miss": 1, "hit": 1}
+        assert move["http"]["outcomes"] == {"ok": 1}
+        assert move["http"]["latency"]["max_ms"] >= 20
+        assert {"memory", "inflight", "writes", "refresh"} <= metrics.keys()
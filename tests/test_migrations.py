@@ -0,0 +1,117 @@
+"""Tests for cache schema versioning and migrations."""
+import asyncio
+import json
+import sqlite3
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import aiosqlite
+import pytest
+
+from src.cache.database import CacheDatabase
+from src.cache.migrations import MIGRATIONS, Migration, run_migrations, update_in_batches
+from tests.fakes import load_fixture
+
+
+def columns(db_path: Path, table: str) -> set[str]:
+    with sqlite3.connect(db_path) as conn:
+        return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+class TestSchemaMigrations:
+    """Test that databases of any age are brought up to the current schema."""
+
+    def test_fresh_database_is_at_latest_version(self):
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                db = CacheDatabase(Path(tmpdir) / "cache.db")
+                await db.initialize()
+                version = await db.schema_version()
+                await db.close()
+                return version
+
+            version = asyncio.run(scenario())
+            move_columns = columns(Path(tmpdir) / "cache.db", "move")
+
+        assert version == MIGRATIONS[-1].version
+        assert {"validated", "codec", "etag", "last_modified"} <= move_columns
+
+    def test_unversioned_database_upgrades_in_place(self):
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+            # Schema as written by the first release, before versioning
+            with sqlite3.connect(db_path) as conn:
+                conn.execute(
+                    "CREATE TABLE move (id INTEGER PRIMARY KEY, name TEXT NOT NULL, "
+                    "data_json TEXT NOT NULL, cached_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    "INSERT INTO move VALUES (84, 'thunder-shock', ?, ?)",
+                    (json.dumps(load_fixture("move.json")), time.time()),
+                )
+
+            async def scenario():
+                db = CacheDatabase(db_path)
+                await db.initialize()
+                entry = await db.get_cached_entry_by_name("move", "thunder-shock", ttl=3600)
+                version = await db.schema_version()
+                await db.close()
+                return entry, version
+
+            entry, version = asyncio.run(scenario())
+            with sqlite3.connect(db_path) as conn:
+                (accessed, cached) = conn.execute("SELECT last_accessed, cached_at FROM move").fetchone()
+
+        assert version == MIGRATIONS[-1].version
+        assert accessed is not None and accessed >= cached  # Backfilled, then touched by the read
+        assert entry is not None and entry.data["id"] == 84
+        assert entry.validated is False
+
+    def test_newer_schema_is_refused(self):
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                async with aiosqlite.connect(Path(tmpdir) / "cache.db") as conn:
+                    await run_migrations(conn)
+                    with pytest.raises(RuntimeError, match="newer"):
+                        await run_migrations(conn, MIGRATIONS[:2])
+
+            asyncio.run(scenario())
+
+    def test_row_migration_runs_in_batches_and_only_once(self):
+        progress = []
+
+        async def backfill(conn, on_progress):
+            await update_in_batches(
+                conn, "items", "label = 'item-' || id", "label IS NULL",
+                on_progress=on_progress, batch_size=4,
+            )
+
+        migrations = [
+            Migration(1, "items", lambda conn, _: conn.execute(
+                "CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)"
+            )),
+            Migration(2, "label items", backfill),
+        ]
+
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                async with aiosqlite.connect(Path(tmpdir) / "cache.db") as conn:
+                    first = await run_migrations(conn, migrations[:1])
+                    await conn.executemany(
+                        "INSERT INTO items (id) VALUES (?)", [(i,) for i in range(10)]
+                    )
+                    await conn.commit()
+                    second = await run_migrations(
+                        conn, migrations, on_progress=lambda m, rows: progress.append((m.version, rows))
+                    )
+                    third = await run_migrations(conn, migrations)
+                    async with conn.execute("SELECT label FROM items WHERE id = 9") as cursor:
+                        (label,) = await cursor.fetchone()
+                return first, second, third, label
+
+            first, second, third, label = asyncio.run(scenario())
+
+        assert (first, second, third) == ([1], [2], [])
+        assert progress == [(2, 4), (2, 8), (2, 10)]
+        assert label == "item-9"
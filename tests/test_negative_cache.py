@@ -0,0 +1,123 @@
+"""Tests for negative caching of 404s and schema failures."""
+import asyncio
+import json
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import httpx
+import pytest
+
+from src.api.client import PokeAPIClient
+from src.api.parsers import SchemaError
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager, MissingResourceError
+from src.constants import CACHE_TTL_MISSING
+from tests.fakes import load_fixture
+
+
+class StatusServer:
+    """MockTransport handler answering each path with a fixed status and body."""
+
+    def __init__(self, routes: dict[str, tuple[int, bytes]]) -> None:
+        self.routes = routes
+        self.requests: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.rstrip("/")
+        self.requests.append(path)
+        status, body = self.routes.get(path, (404, b""))
+        return httpx.Response(status, content=body)
+
+
+def make_manager(server: StatusServer, db_path: Path) -> CacheManager:
+    return CacheManager(
+        api_client=PokeAPIClient(transport=httpx.MockTransport(server), max_retries=0),
+        db=CacheDatabase(db_path),
+    )
+
+
+class TestNegativeCache:
+    """Test that known-missing resources fail fast instead of refetching."""
+
+    def test_404_is_remembered_across_restarts(self):
+        server = StatusServer({})
+
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+
+            async def scenario():
+                cache = make_manager(server, db_path)
+                with pytest.raises(httpx.HTTPStatusError):
+                    await cache.get_move("no-such-move")
+                with pytest.raises(MissingResourceError, match="HTTP 404"):
+                    await cache.get_move("no-such-move")
+                await cache.close()
+
+                cache = make_manager(server, db_path)
+                with pytest.raises(MissingResourceError):
+                    await cache.get_move("no-such-move")
+                await cache.close()
+
+            asyncio.run(scenario())
+
+        assert server.requests == ["/api/v2/move/no-such-move"]
+
+    def test_expired_miss_is_retried(self):
+        move = load_fixture("move.json")
+        server = StatusServer({})
+
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                cache = make_manager(server, Path(tmpdir) / "cache.db")
+                with pytest.raises(httpx.HTTPStatusError):
+                    await cache.get_move("thunder-shock")
+                await cache._db.flush()
+                await cache._db._db.execute(
+                    "UPDATE missing_resource SET cached_at = ?",
+                    (time.time() - CACHE_TTL_MISSING - 1,),
+                )
+                await cache._db._db.commit()
+
+                server.routes["/api/v2/move/thunder-shock"] = (200, json.dumps(move).encode())
+                found = await cache.get_move("thunder-shock")
+                purged = await cache._db.purge_missing(CACHE_TTL_MISSING)
+                await cache.close()
+                return found, purged
+
+            found, purged = asyncio.run(scenario())
+
+        assert found.name == "thunder-shock"
+        assert purged == 1
+        assert len(server.requests) == 2
+
+    def test_schema_failure_is_remembered(self):
+        server = StatusServer({"/api/v2/ability/broken": (200, b'{"id": "not-a-number"}')})
+
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                cache = make_manager(server, Path(tmpdir) / "cache.db")
+                with pytest.raises(SchemaError):
+                    await cache.get_ability("broken")
+                with pytest.raises(MissingResourceError, match="Invalid ability response"):
+                    await cache.get_ability("broken")
+                await cache.close()
+
+            asyncio.run(scenario())
+
+        assert len(server.requests) == 1
+
+    def test_server_errors_are_not_remembered(self):
+        server = StatusServer({"/api/v2/type/fire": (503, b"")})
+
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                cache = make_manager(server, Path(tmpdir) / "cache.db")
+                for _ in range(2):
+                    with pytest.raises(httpx.HTTPStatusError):
+                        await cache.get_type("fire")
+                await cache.close()
+
+            asyncio.run(scenario())
+
+        assert len(server.requests) == 2
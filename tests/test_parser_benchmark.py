@@ -0,0 +1,95 @@
+"""Benchmark of validated vs trusted (cache-hit) parsing on fixture payloads.
+
+Equality checks always run; timings run with
+`POKEDEX_BENCHMARKS=1 python -m pytest tests/test_parser_benchmark.py -s`.
+"""
+import copy
+
+import pytest
+
+from src.api.parsers import (
+    parse_pokemon_detail,
+    parse_pokemon_species,
+    parse_ability,
+    parse_move,
+)
+from tests.benchmarking import benchmark, best_time
+from tests.fakes import load_fixture
+
+
+ITERATIONS = 300
+
+CASES = [
+    ("pokemon_detail.json", parse_pokemon_detail),
+    ("pokemon_species.json", parse_pokemon_species),
+    ("ability.json", parse_ability),
+    ("move.json", parse_move),
+]
+
+
+def time_per_call(parser, data: dict, validate: bool) -> float:
+    """Return the best-of-3 mean seconds per parse call."""
+    return best_time(lambda: parser(data, validate=validate), ITERATIONS)
+
+
+def make_large_detail(move_count: int = 400, details_per_move: int = 20) -> dict:
+    """Pikachu fixture inflated to a Mew-sized moves array."""
+    data = load_fixture("pokemon_detail.json")
+    template = data["moves"][0]
+    data["moves"] = []
+    for i in range(move_count):
+        move = copy.deepcopy(template)
+        move["move"] = {"name": f"move-{i}", "url": f"https://pokeapi.co/api/v2/move/{i + 1}/"}
+        move["version_group_details"] = template["version_group_details"] * details_per_move
+        data["moves"].append(move)
+    return data
+
+
+class TestTrustedParseBenchmark:
+    """Measure the per-hit saving of skipping schema validation."""
+
+    @pytest.mark.parametrize("fixture,parser", CASES)
+    def test_trusted_parse_matches_validated(self, fixture, parser):
+        data = load_fixture(fixture)
+        assert parser(data, validate=False) == parser(data, validate=True)
+
+    @benchmark
+    def test_trusted_parse_is_faster(self):
+        total_validated = 0.0
+        total_trusted = 0.0
+        for fixture, parser in CASES:
+            data = load_fixture(fixture)
+            validated = time_per_call(parser, data, validate=True)
+            trusted = time_per_call(parser, data, validate=False)
+            total_validated += validated
+            total_trusted += trusted
+            print(
+                f"\n{fixture:24s} validated {validated * 1e6:8.1f} us  "
+                f"trusted {trusted * 1e6:8.1f} us  "
+                f"saving {(validated - trusted) * 1e6:8.1f} us/hit"
+            )
+
+        assert total_trusted < total_validated
+
+
+class TestLargePayloadParseBenchmark:
+    """Measure validated vs trusted parsing on a Mew-sized moves array."""
+
+    def test_large_payload_parses_identically(self):
+        data = make_large_detail()
+        trusted = parse_pokemon_detail(data, validate=False)
+        assert parse_pokemon_detail(data) == trusted
+        assert len(trusted.moves) == 400
+
+    @benchmark
+    def test_report_large_payload_timings(self):
+        data = make_large_detail()
+
+        validated = best_time(lambda: parse_pokemon_detail(data), iterations=20)
+        trusted = best_time(lambda: parse_pokemon_detail(data, validate=False), iterations=20)
+        print(
+            f"\n400-move detail  validated {validated * 1e3:7.2f} ms  "
+            f"trusted {trusted * 1e3:7.2f} ms"
+        )
+
+        assert trusted < validated
@@ -10,6 +10,8 @@ from src.api.parsers import (
     parse_pokemon_species,
     parse_ability,
     parse_move,
+    parse_type_effectiveness,
+    parse_generation,
 )
 
 
@@ -207,3 +209,35 @@ class TestParseMove:
 
         assert result.ailment == "paralysis"
         assert result.category == "damage+ailment"
+
+
+class TestParseTypeEffectiveness:
+    """Test type parsing."""
+
+    def test_damage_relations_parsed(self):
+        data = load_fixture("type.json")
+        result = parse_type_effectiveness(data)
+
+        assert result.name == "fire"
+        assert "water" in result.double_damage_from
+        assert "grass" in result.double_damage_to
+
+    def test_members_parsed_with_slots(self):
+        data = load_fixture("type.json")
+        result = parse_type_effectiveness(data)
+
+        members = {m.pokemon_id: m.slot for m in result.pokemon}
+        assert members[4] == 1
+        assert members[228] == 2
+        assert 10035 in members  # Form variants are included
+
+
+class TestParseGeneration:
+    """Test generation parsing."""
+
+    def test_species_ids_extracted(self):
+        data = load_fixture("generation.json")
+        result = parse_generation(data)
+
+        assert result.name == "generation-i"
+        assert result.species_ids == [1, 4, 6, 25]
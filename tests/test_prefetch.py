@@ -0,0 +1,81 @@
+"""Tests for the headless prefetch of the whole Pokedex."""
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import httpx
+
+from src.api.client import PokeAPIClient
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager
+from src.cache.prefetch import Prefetcher, PREFETCHED_SPRITES_KEY
+from src.sprites.downloader import SpriteDownloader
+from tests.fakes import FakeAPIClient, load_fixture
+
+PNG = b"\x89PNG\r\n\x1a\nfake"
+
+
+def make_api() -> FakeAPIClient:
+    # "lightning-rod" has no payload, so that ability fails
+    return FakeAPIClient({
+        "/pokemon?limit=2000": {"results": [
+            {"name": "pikachu", "url": "https://pokeapi.co/api/v2/pokemon/25/"},
+        ]},
+        "/pokemon/25": load_fixture("pokemon_detail.json"),
+        "/pokemon-species/25": load_fixture("pokemon_species.json"),
+        "/evolution-chain/10": {"id": 10, "chain": {
+            "species": {"name": "pichu", "url": "https://pokeapi.co/api/v2/pokemon-species/172/"},
+            "evolves_to": [],
+        }},
+        "/move/thunder-shock": load_fixture("move.json"),
+        "/ability/static": load_fixture("ability.json"),
+        "/type/electric": load_fixture("type.json"),
+    }, delay=0)
+
+
+class TestPrefetcher:
+    """Test that prefetch fills every resource, counts errors and resumes."""
+
+    def test_prefetch_fills_cache_and_resumes(self):
+        sprite_requests = []
+
+        def serve_sprite(request: httpx.Request) -> httpx.Response:
+            sprite_requests.append(request)
+            return httpx.Response(200, content=PNG)
+
+        with TemporaryDirectory() as tmpdir:
+            async def run_once():
+                api = make_api()
+                cache = CacheManager(api_client=api, db=CacheDatabase(Path(tmpdir) / "cache.db"))
+                sprites = SpriteDownloader(
+                    PokeAPIClient(transport=httpx.MockTransport(serve_sprite)),
+                    sprites_dir=Path(tmpdir),
+                )
+                results = await Prefetcher(
+                    cache, sprites, concurrency=4, sprites_dir=Path(tmpdir)
+                ).run()
+                stored = await cache.get_meta(PREFETCHED_SPRITES_KEY)
+                await sprites.close()
+                await cache.close()
+                return {r.resource: r for r in results}, api.calls, stored
+
+            first, first_calls, stored = asyncio.run(run_once())
+            second, second_calls, _ = asyncio.run(run_once())
+            sprite_exists = (Path(tmpdir) / "25_front_default.png").exists()
+
+        assert {r: (p.completed, p.failed) for r, p in first.items()} == {
+            "pokemon": (1, 0),
+            "pokemon-species": (1, 0),
+            "evolution-chain": (1, 0),
+            "move": (1, 0),
+            "ability": (1, 1),
+            "type": (1, 0),
+            "sprite": (1, 0),
+        }
+        assert sprite_exists
+        assert stored == "1"
+        assert len(first_calls) == 8
+        # Everything fetched before is served from the cache; only the failure is retried
+        assert [url for url in second_calls if "/ability/lightning-rod" not in url] == []
+        assert second["pokemon"].completed == 1
+        assert len(sprite_requests) == 1
@@ -0,0 +1,83 @@
+"""Tests for background refresh scheduling."""
+import asyncio
+import time
+
+from src.cache.refresh import BackgroundRefresher
+
+
+class TestBackgroundRefresher:
+    """Test deduplication, rate limiting and failure cooldown."""
+
+    def test_duplicate_keys_refresh_once(self):
+        async def scenario():
+            refresher = BackgroundRefresher(concurrency=2, min_interval=0, failure_cooldown=60)
+            calls = []
+
+            async def refresh():
+                calls.append(1)
+                await asyncio.sleep(0.01)
+
+            accepted = [refresher.schedule("pokemon/25", refresh) for _ in range(5)]
+            await refresher.wait()
+            return accepted, calls, refresher.get_stats()
+
+        accepted, calls, stats = asyncio.run(scenario())
+
+        assert accepted == [True, False, False, False, False]
+        assert len(calls) == 1
+        assert stats["deduplicated"] == 4
+        assert stats["completed"] == 1
+
+    def test_starts_are_spaced_and_bounded(self):
+        async def scenario():
+            refresher = BackgroundRefresher(concurrency=1, min_interval=0.03, failure_cooldown=60)
+            starts = []
+            active = 0
+            max_active = 0
+
+            async def refresh():
+                nonlocal active, max_active
+                starts.append(time.monotonic())
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.001)
+                active -= 1
+
+            for key in range(4):
+                refresher.schedule(key, refresh)
+            await refresher.wait()
+            return starts, max_active
+
+        starts, max_active = asyncio.run(scenario())
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert max_active == 1
+        assert min(gaps) >= 0.025
+
+    def test_failed_key_is_not_retried_during_cooldown(self):
+        async def scenario():
+            refresher = BackgroundRefresher(concurrency=1, min_interval=0, failure_cooldown=60)
+
+            async def refresh():
+                raise ConnectionError("offline")
+
+            refresher.schedule("move/tackle", refresh)
+            await refresher.wait()
+            retried = refresher.schedule("move/tackle", refresh)
+            return retried, refresher.get_stats()
+
+        retried, stats = asyncio.run(scenario())
+
+        assert retried is False
+        assert stats["failed"] == 1
+        assert stats["suppressed"] == 1
+
+    def test_close_cancels_pending(self):
+        async def scenario():
+            refresher = BackgroundRefresher(concurrency=1, min_interval=0, failure_cooldown=60)
+            refresher.schedule("slow", lambda: asyncio.sleep(10))
+            await asyncio.sleep(0)
+            await refresher.close()
+            return refresher.pending()
+
+        assert asyncio.run(scenario()) == 0
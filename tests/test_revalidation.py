@@ -0,0 +1,157 @@
+"""Tests for ETag / Last-Modified revalidation against httpx.MockTransport."""
+import asyncio
+import json
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import httpx
+
+from src.api.client import PokeAPIClient
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager
+from src.constants import CACHE_TTL_MOVE
+from src.sprites.downloader import SpriteDownloader
+from tests.fakes import load_fixture
+
+PNG = b"\x89PNG\r\n\x1a\nfake"
+
+
+class VersionedServer:
+    """MockTransport handler serving one versioned resource per path."""
+
+    def __init__(self, bodies: dict[str, bytes], etag: str = '"v1"') -> None:
+        self.bodies = bodies
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = self.bodies.get(request.url.path.rstrip("/"))
+        if body is None:
+            return httpx.Response(404)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(200, content=body, headers={
+            "ETag": self.etag,
+            "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+        })
+
+
+def make_client(server: VersionedServer) -> PokeAPIClient:
+    return PokeAPIClient(transport=httpx.MockTransport(server))
+
+
+class TestConditionalClient:
+    """Test validator headers and 304 handling in PokeAPIClient."""
+
+    def test_validators_returned_and_sent(self):
+        server = VersionedServer({"/api/v2/move/thunder-shock": b'{"id": 84}'})
+
+        async def scenario():
+            client = make_client(server)
+            first = await client.get_json_conditional("https://pokeapi.co/api/v2/move/thunder-shock")
+            second = await client.get_json_conditional(
+                "https://pokeapi.co/api/v2/move/thunder-shock",
+                first.etag, first.last_modified,
+            )
+            await client.close()
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert first.body == {"id": 84}
+        assert first.etag == '"v1"'
+        assert not first.not_modified
+        assert second.not_modified
+        assert second.body is None
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+        assert server.requests[1].headers["If-Modified-Since"] == first.last_modified
+
+
+class TestCacheRevalidation:
+    """Test that stale rows are revalidated instead of re-downloaded."""
+
+    def run_stale_move(self, server: VersionedServer, before_refresh=lambda: None):
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                db = CacheDatabase(Path(tmpdir) / "cache.db")
+                manager = CacheManager(api_client=make_client(server), db=db)
+                await manager.initialize()
+                await manager.get_move("thunder-shock")
+
+                await db.flush()
+                stale_at = time.time() - CACHE_TTL_MOVE - 60
+                await db._db.execute("UPDATE move SET cached_at = ?", (stale_at,))
+                await db._db.commit()
+                manager._memory.clear()
+                before_refresh()
+
+                stale = await manager.get_move("thunder-shock")
+                await manager._refresher.wait()
+                entry = await db.get_cached_entry_by_name("move", "thunder-shock", ttl=CACHE_TTL_MOVE)
+                fresh = await manager.get_move("thunder-shock")
+                await manager.close()
+                return stale, entry, fresh
+
+            return asyncio.run(scenario())
+
+    def test_not_modified_bumps_cached_at(self):
+        server = VersionedServer({
+            "/api/v2/move/thunder-shock": json.dumps(load_fixture("move.json")).encode(),
+        })
+
+        stale, entry, fresh = self.run_stale_move(server)
+
+        assert len(server.requests) == 2
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+        assert entry is not None and entry.etag == '"v1"'
+        assert stale is fresh  # Unchanged: the parsed model stays in memory
+
+    def test_changed_resource_replaces_row(self):
+        path = "/api/v2/move/thunder-shock"
+        server = VersionedServer({path: json.dumps(load_fixture("move.json")).encode()})
+
+        def publish_new_version():
+            changed = {**load_fixture("move.json"), "power": 50}
+            server.bodies[path] = json.dumps(changed).encode()
+            server.etag = '"v2"'
+
+        stale, entry, fresh = self.run_stale_move(server, publish_new_version)
+
+        assert len(server.requests) == 2
+        assert entry.etag == '"v2"'
+        assert stale.power == 40
+        assert fresh.power == 50
+
+
+class TestSpriteRevalidation:
+    """Test sidecar validators and background sprite revalidation."""
+
+    def test_stale_sprite_revalidates_with_304(self):
+        url = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png"
+        server = VersionedServer({"/PokeAPI/sprites/master/sprites/pokemon/25.png": PNG})
+
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                downloader = SpriteDownloader(make_client(server), sprites_dir=Path(tmpdir))
+                path = Path(tmpdir) / "25_front_default.png"
+                await downloader.download_sprite(url, path)
+
+                sidecar = path.with_suffix(".json")
+                validators = json.loads(sidecar.read_text())
+                sidecar.write_text(json.dumps({**validators, "checked_at": 0}))
+
+                await downloader.download_sprite(url, path)
+                await downloader._refresher.wait()
+                await downloader.close()
+                return path.read_bytes(), json.loads(sidecar.read_text()), downloader.not_modified
+
+            content, validators, not_modified = asyncio.run(scenario())
+
+        assert content == PNG
+        assert validators["etag"] == '"v1"'
+        assert validators["checked_at"] > 0
+        assert not_modified == 1
+        assert len(server.requests) == 2
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
@@ -0,0 +1,239 @@
+"""End-to-end selection latency, driven headlessly through Textual's Pilot.
+
+The app runs against an in-process PokeAPI built from the fixtures, with
+a synthetic per-request latency, and every phase of the selection handler
+is timed. Correctness checks always run; timings run with
+`POKEDEX_BENCHMARKS=1 python -m pytest tests/test_selection_benchmark.py -s`.
+
+The timed run compares p50 per phase against selection_baseline.json in
+the fixtures directory; set POKEDEX_BENCHMARK_UPDATE=1 to rewrite it after
+an intended change.
+"""
+import asyncio
+import copy
+import io
+import json
+import os
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import httpx
+from PIL import Image
+from textual.widgets import OptionList
+
+from main import PokedexApp
+from src.utils.timing import percentile
+from tests.benchmarking import benchmark
+from tests.fakes import load_fixture
+
+BASELINE = Path(__file__).parent / "fixtures" / "selection_baseline.json"
+BASELINE_TOLERANCE = 2.0   # Fail when a phase's p50 exceeds the baseline by this factor...
+BASELINE_SLACK_MS = 2.0    # ...plus this much, so sub-millisecond phases don't flap
+POKEMON_COUNT = 12
+MOVES_PER_POKEMON = 20     # The handler loads details for at most 20 moves
+LATENCY = 0.02             # Seconds per simulated API request
+
+SELECTION_PHASES = {
+    "detail", "species", "sprite_download", "sprite_render", "load_pokemon",
+    "supplementary", "load_evolution", "load_abilities", "load_move_details",
+    "load_type_matchups", "total",
+}
+
+
+def sprite_png() -> bytes:
+    image = Image.new("RGBA", (96, 96), (0, 0, 0, 0))
+    for x in range(24, 72):
+        for y in range(24, 72):
+            image.putpixel((x, y), (250, 210, 40, 255))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class FixtureAPI:
+    """MockTransport handler serving POKEMON_COUNT fixture-based Pokemon.
+
+    Every Pokemon is a copy of the Pikachu fixture with its own id, species,
+    evolution chain and sprites, and the same MOVES_PER_POKEMON moves, so
+    the first selection is cold and later ones share move and type data
+    like real Pokemon do.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.requests = 0
+        self._png = sprite_png()
+        self._move_entry = load_fixture("pokemon_detail.json")["moves"][0]
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if request.url.host == "raw.githubusercontent.com":
+            return httpx.Response(200, content=self._png)
+        resource, _, key = request.url.path.removeprefix("/api/v2/").strip("/").partition("/")
+        body = self._resource(resource, key)
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    def _resource(self, resource: str, key: str) -> dict | None:
+        if resource == "pokemon" and not key:
+            return {"count": POKEMON_COUNT, "results": [
+                {"name": f"pokemon-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+                for i in range(1, POKEMON_COUNT + 1)
+            ]}
+        if resource == "pokemon":
+            return self._detail(int(key))
+        if resource == "pokemon-species":
+            species = load_fixture("pokemon_species.json")
+            species.update(id=int(key), name=f"pokemon-{key}")
+            species["evolution_chain"]["url"] = f"https://pokeapi.co/api/v2/evolution-chain/{key}/"
+            return species
+        if resource == "evolution-chain":
+            return {"id": int(key), "chain": {
+                "species": {"name": f"pokemon-{key}", "url": f"https://pokeapi.co/api/v2/pokemon-species/{key}/"},
+                "evolution_details": [],
+                "evolves_to": [],
+            }}
+        if resource in ("ability", "move"):
+            data = load_fixture(f"{resource}.json")
+            data["name"] = key
+            return data
+        if resource == "type":
+            # Every Pokemon is electric, so bulk metadata covers all of them
+            data = load_fixture("type.json")
+            data["name"] = key
+            data["pokemon"] = [
+                {"pokemon": {"name": f"pokemon-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}, "slot": 1}
+                for i in range(1, POKEMON_COUNT + 1)
+            ] if key == "electric" else []
+            return data
+        if resource == "generation":
+            data = load_fixture("generation.json")
+            data["name"] = key
+            data["pokemon_species"] = [
+                {"name": f"pokemon-{i}", "url": f"https://pokeapi.co/api/v2/pokemon-species/{i}/"}
+                for i in range(1, POKEMON_COUNT + 1)
+            ] if key == "generation-i" else []
+            return data
+        return None
+
+    def _detail(self, pokemon_id: int) -> dict:
+        detail = load_fixture("pokemon_detail.json")
+        detail.update(id=pokemon_id, name=f"pokemon-{pokemon_id}")
+        detail["species"] = {
+            "name": f"pokemon-{pokemon_id}",
+            "url": f"https://pokeapi.co/api/v2/pokemon-species/{pokemon_id}/",
+        }
+        detail["moves"] = []
+        for n in range(MOVES_PER_POKEMON):
+            entry = copy.deepcopy(self._move_entry)
+            entry["move"] = {"name": f"move-{n}", "url": f"https://pokeapi.co/api/v2/move/{1000 + n}/"}
+            detail["moves"].append(entry)
+        return json.loads(json.dumps(detail).replace("/25.png", f"/{pokemon_id}.png"))
+
+
+async def wait_for(pilot, condition, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the app"
+        await pilot.pause(0.005)
+
+
+async def select(pilot, app: PokedexApp, pokemon_id: int) -> dict[str, float]:
+    """Highlight a Pokemon in the list, press Enter and wait for the handler."""
+    option_list = app.query_one("#pokemon-option-list", OptionList)
+    option_list.focus()
+    option_list.highlighted = option_list.get_option_index(str(pokemon_id))
+    completed = app.selections_completed
+    await pilot.press("enter")
+    await wait_for(pilot, lambda: app.selections_completed > completed)
+    return app.last_selection
+
+
+async def run_selections(
+    data_dir: Path, server: FixtureAPI, passes: list[list[int]]
+) -> list[list[dict[str, float]]]:
+    """Start the app headless, wait out the metadata load, run each pass in order."""
+    app = PokedexApp(transport=httpx.MockTransport(server), data_dir=data_dir)
+    results = []
+    async with app.run_test(size=(160, 50)) as pilot:
+        await wait_for(pilot, lambda: app._metadata_task is not None and app._metadata_task.done())
+        for pokemon_ids in passes:
+            results.append([await select(pilot, app, pokemon_id) for pokemon_id in pokemon_ids])
+    return results
+
+
+def summarize(samples: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    """p50/p90/p99 in ms for each phase."""
+    summary = {}
+    for phase in sorted({name for sample in samples for name in sample}):
+        values = [sample[phase] * 1000 for sample in samples if phase in sample]
+        summary[phase] = {f"p{int(q * 100)}_ms": round(percentile(values, q), 3) for q in (0.5, 0.9, 0.99)}
+    return summary
+
+
+class TestSelectionPhases:
+    """Test that a Pilot-driven selection reports every phase."""
+
+    def test_selection_times_every_phase_then_hits_cache(self):
+        server = FixtureAPI()
+
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                app = PokedexApp(transport=httpx.MockTransport(server), data_dir=Path(tmpdir))
+                async with app.run_test(size=(160, 50)) as pilot:
+                    await wait_for(pilot, lambda: app._metadata_task is not None and app._metadata_task.done())
+                    cold = await select(pilot, app, 3)
+                    requests = server.requests
+                    warm = await select(pilot, app, 3)
+                    metrics = app.collect_metrics()["selection"]
+                return cold, warm, server.requests - requests, metrics
+
+            cold, warm, warm_requests, metrics = asyncio.run(scenario())
+            sprites = sorted(p.name for p in (Path(tmpdir) / "sprites").glob("3_*.png"))
+
+        assert set(cold) == SELECTION_PHASES
+        assert set(warm) == SELECTION_PHASES
+        assert warm_requests == 0
+        assert sprites == ["3_back_default.png", "3_back_shiny.png", "3_front_default.png", "3_front_shiny.png"]
+        assert metrics["selection"]["total"]["outcomes"] == {"ok": 2}
+
+
+class TestSelectionBenchmark:
+    """Time cold and warm selections and compare them with the baseline."""
+
+    @benchmark
+    def test_cold_and_warm_selection_latency(self):
+        pokemon_ids = list(range(1, POKEMON_COUNT + 1))
+
+        with TemporaryDirectory() as tmpdir:
+            cold, warm = asyncio.run(run_selections(
+                Path(tmpdir), FixtureAPI(latency=LATENCY), [pokemon_ids, pokemon_ids]
+            ))
+
+        report = {"cold": summarize(cold), "warm": summarize(warm)}
+        print(f"\nSelection phases, {POKEMON_COUNT} Pokemon, {LATENCY * 1000:.0f} ms per request")
+        for run, phases in report.items():
+            for phase, stats in phases.items():
+                print(
+                    f"  {run:<5} {phase:<20} p50 {stats['p50_ms']:8.2f}  "
+                    f"p90 {stats['p90_ms']:8.2f}  p99 {stats['p99_ms']:8.2f} ms"
+                )
+
+        if os.environ.get("POKEDEX_BENCHMARK_UPDATE") or not BASELINE.exists():
+            BASELINE.write_text(json.dumps(report, indent=2) + "\n")
+            print(f"  wrote baseline {BASELINE.name}")
+
+        baseline = json.loads(BASELINE.read_text())
+        regressions = [
+            f"{run}/{phase}: p50 {stats['p50_ms']:.2f} ms vs baseline {baseline[run][phase]['p50_ms']:.2f} ms"
+            for run, phases in report.items()
+            for phase, stats in phases.items()
+            if phase in baseline.get(run, {})
+            and stats["p50_ms"] > baseline[run][phase]["p50_ms"] * BASELINE_TOLERANCE + BASELINE_SLACK_MS
+        ]
+        assert not regressions, "Selection latency regressed:\n" + "\n".join(regressions)
+        assert report["warm"]["total"]["p50_ms"] < report["cold"]["total"]["p50_ms"]
@@ -0,0 +1,62 @@
+"""Tests for one PokeAPIClient shared by the cache and the sprite downloader."""
+import asyncio
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import httpx
+
+from src.api.client import PokeAPIClient
+from src.cache.database import CacheDatabase
+from src.cache.manager import CacheManager
+from src.constants import HTTP_HOST_CONNECTIONS
+from src.sprites.downloader import SpriteDownloader
+from tests.fakes import load_fixture
+
+PNG = b"\x89PNG\r\n\x1a\nfake"
+SPRITE_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png"
+
+
+def serve(request: httpx.Request) -> httpx.Response:
+    if request.url.host == "raw.githubusercontent.com":
+        return httpx.Response(200, content=PNG)
+    return httpx.Response(200, content=json.dumps(load_fixture("move.json")).encode())
+
+
+class TestSharedClient:
+    """Test per-host pools and that shared clients outlive their users."""
+
+    def test_each_host_gets_its_own_pool(self):
+        async def scenario():
+            async with PokeAPIClient() as api:
+                client = await api._get_client()
+                return {
+                    pattern.pattern: transport._pool._max_connections
+                    for pattern, transport in client._mounts.items()
+                }
+
+        pools = asyncio.run(scenario())
+
+        assert pools == {f"https://{host}": n for host, n in HTTP_HOST_CONNECTIONS.items()}
+
+    def test_users_share_one_client_and_leave_it_open(self):
+        with TemporaryDirectory() as tmpdir:
+            async def scenario():
+                async with PokeAPIClient(transport=httpx.MockTransport(serve)) as api:
+                    cache = CacheManager(api_client=api, db=CacheDatabase(Path(tmpdir) / "cache.db"))
+                    sprites = SpriteDownloader(api, sprites_dir=Path(tmpdir) / "sprites")
+                    await cache.get_move("thunder-shock")
+                    await sprites.fetch_sprite(SPRITE_URL, Path(tmpdir) / "sprites" / "25.png")
+                    await sprites.close()
+                    await cache.close()
+                    still_open = not api._client.is_closed
+                    stats = api.get_stats()
+                return still_open, stats, api._client
+
+            still_open, stats, client = asyncio.run(scenario())
+
+        assert still_open
+        assert client is None  # Closed by the context manager
+        assert stats["requests"] == 2
+        assert set(stats["hosts"]) == {"pokeapi.co", "raw.githubusercontent.com"}
+        assert stats["hosts"]["raw.githubusercontent.com"]["limit"] <= HTTP_HOST_CONNECTIONS["raw.githubusercontent.com"]
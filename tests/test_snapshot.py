@@ -0,0 +1,97 @@
+"""Tests for exporting and importing cache snapshots."""
+import asyncio
+import io
+import tarfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.cache.database import CacheDatabase
+from src.cache.prefetch import PREFETCHED_SPRITES_KEY
+from src.cache.snapshot import export_snapshot, import_snapshot
+from src.sprites.downloader import SpriteDownloader
+from tests.fakes import load_fixture
+
+PNG = b"\x89PNG\r\n\x1a\nfake"
+
+
+async def make_source(root: Path) -> Path:
+    """Build a warm cache with one move and one sprite, and export it."""
+    db = CacheDatabase(root / "cache.db")
+    await db.initialize()
+    await db.save_cached_json("move", 84, load_fixture("move.json"), name="thunder-shock")
+    sprites = SpriteDownloader(sprites_dir=root / "sprites")
+    (root / "sprites" / "25_front_default.png").write_bytes(PNG)
+    artifact = root / "cache.snapshot"
+    await export_snapshot(db, sprites, artifact)
+    await sprites.close()
+    await db.close()
+    return artifact
+
+
+def tamper(artifact: Path, member_name: str) -> None:
+    """Rewrite the snapshot with one member's content changed."""
+    with tarfile.open(artifact) as tar:
+        members = [(m, tar.extractfile(m).read()) for m in tar.getmembers()]
+    with tarfile.open(artifact, "w") as tar:
+        for member, data in members:
+            if member.name == member_name:
+                data = data[:-1] + b"!"
+            tar.addfile(member, io.BytesIO(data))
+
+
+class TestSnapshot:
+    """Test that snapshots round-trip and bad ones are rejected untouched."""
+
+    def test_round_trip_replaces_database_and_sprites(self):
+        with TemporaryDirectory() as source_dir, TemporaryDirectory() as target_dir:
+            source, target = Path(source_dir), Path(target_dir)
+
+            async def scenario():
+                artifact = await make_source(source)
+                (target / "sprites").mkdir()
+                (target / "sprites" / "1_front_default.png").write_bytes(PNG)
+                db = CacheDatabase(target / "cache.db")
+                sprites = SpriteDownloader(sprites_dir=target / "sprites")
+                manifest = await import_snapshot(artifact, db, sprites)
+                entry = await db.get_cached_entry_by_name("move", "thunder-shock", ttl=3600)
+                kept = await db.get_meta(PREFETCHED_SPRITES_KEY)
+                await sprites.close()
+                await db.close()
+                return manifest, entry, kept
+
+            manifest, entry, kept = asyncio.run(scenario())
+            files = sorted(p.name for p in (target / "sprites").iterdir())
+            leftovers = sorted(p.name for p in target.iterdir())
+
+        assert manifest["sprites"] == 1
+        assert set(manifest["files"]) == {"pokedex_cache.db", "sprites/25_front_default.png"}
+        assert entry is not None and entry.data["name"] == "thunder-shock"
+        assert kept == "1"
+        assert files == ["25_front_default.png"]
+        assert leftovers == ["cache.db", "sprites"]  # No staging or .old directories left
+
+    @pytest.mark.parametrize("member", ["pokedex_cache.db", "sprites/25_front_default.png"])
+    def test_checksum_mismatch_leaves_cache_untouched(self, member):
+        with TemporaryDirectory() as source_dir, TemporaryDirectory() as target_dir:
+            source, target = Path(source_dir), Path(target_dir)
+
+            async def scenario():
+                artifact = await make_source(source)
+                tamper(artifact, member)
+                (target / "sprites").mkdir()
+                (target / "sprites" / "1_front_default.png").write_bytes(PNG)
+                (target / "cache.db").write_bytes(b"existing")
+                db = CacheDatabase(target / "cache.db")
+                sprites = SpriteDownloader(sprites_dir=target / "sprites")
+                try:
+                    with pytest.raises(ValueError, match="checksum mismatch"):
+                        await import_snapshot(artifact, db, sprites)
+                finally:
+                    await sprites.close()
+
+            asyncio.run(scenario())
+            assert (target / "cache.db").read_bytes() == b"existing"
+            assert (target / "sprites" / "1_front_default.png").exists()
+            assert sorted(p.name for p in target.iterdir()) == ["cache.db", "sprites"]
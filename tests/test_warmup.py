@@ -0,0 +1,108 @@
+"""Tests for the metadata warm-up pipeline."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.cache.warmup import MetadataWarmup
+from src.models.pokemon import PokemonSummary, PokemonType
+
+
+class FakeCache:
+    """Minimal CacheManager stand-in that tracks concurrency."""
+
+    def __init__(self, fail_ids: set[int] | None = None) -> None:
+        self.fail_ids = fail_ids or set()
+        self.meta: dict[str, str] = {}
+        self.indexed: dict[int, list[str]] = {}
+        self.detail_calls: list[int] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def get_pokemon_detail(self, pokemon_id: int):
+        self.detail_calls.append(pokemon_id)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        if pokemon_id in self.fail_ids:
+            raise ValueError("not found")
+        return SimpleNamespace(
+            species_id=pokemon_id,
+            types=[PokemonType(slot=1, name="fire" if pokemon_id % 2 else "water")],
+        )
+
+    async def get_species(self, species_id: int):
+        return SimpleNamespace(generation="generation-i")
+
+    async def get_meta(self, key: str) -> str | None:
+        return self.meta.get(key)
+
+    async def set_meta(self, key: str, value: str) -> None:
+        self.meta[key] = value
+
+    async def save_index_metadata(self, types, generations) -> None:
+        self.indexed.update(types)
+
+
+def make_list(count: int) -> list[PokemonSummary]:
+    return [PokemonSummary(id=i, name=f"mon-{i}", url="") for i in range(1, count + 1)]
+
+
+class TestMetadataWarmup:
+    """Test bounded concurrency, batching and checkpoint resume."""
+
+    def test_concurrency_is_bounded(self):
+        cache = FakeCache()
+        warmup = MetadataWarmup(cache, concurrency=3, batch_size=10)
+
+        result = asyncio.run(warmup.run(make_list(30)))
+
+        assert result.completed == 30
+        assert cache.max_active <= 3
+
+    def test_results_delivered_in_batches(self):
+        cache = FakeCache()
+        batches = []
+        warmup = MetadataWarmup(
+            cache,
+            on_batch=lambda types, gens: batches.append((types, gens)),
+            concurrency=2,
+            batch_size=10,
+        )
+
+        asyncio.run(warmup.run(make_list(25)))
+
+        assert len(batches) == 3
+        merged_types = {k: v for types, _ in batches for k, v in types.items()}
+        merged_gens = {k: v for _, gens in batches for k, v in gens.items()}
+        assert merged_types[1] == ["fire"]
+        assert merged_types[2] == ["water"]
+        assert set(merged_gens.values()) == {"generation-i"}
+
+    def test_failures_are_counted_not_raised(self):
+        cache = FakeCache(fail_ids={3, 4})
+        warmup = MetadataWarmup(cache, concurrency=2, batch_size=5)
+
+        result = asyncio.run(warmup.run(make_list(10)))
+
+        assert result.completed == 8
+        assert result.failed == 2
+
+    def test_resume_from_checkpoint_skips_completed(self):
+        cache = FakeCache()
+        asyncio.run(MetadataWarmup(cache, batch_size=5).run(make_list(10)))
+        cache.detail_calls.clear()
+
+        batches = []
+        warmup = MetadataWarmup(
+            cache,
+            on_batch=lambda types, gens: batches.append(types),
+            batch_size=5,
+        )
+        result = asyncio.run(warmup.run(make_list(12)))
+
+        assert sorted(cache.detail_calls) == [11, 12]
+        assert result.resumed == 10
+        assert result.completed == 12
+        assert batches[0][1] == ["fire"]
@@ -0,0 +1,203 @@
+"""Tests for the write-behind cache queue."""
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import aiosqlite
+
+from src.cache.database import CacheDatabase
+from src.cache.write_queue import WriteBehindQueue
+from tests.fakes import load_fixture
+
+
+async def count_rows(db_path: Path, table: str) -> int:
+    """Count committed rows through a separate connection."""
+    async with aiosqlite.connect(db_path) as conn:
+        async with conn.execute(f"SELECT COUNT(*) FROM {table}") as cursor:
+            return (await cursor.fetchone())[0]
+
+
+class TestWriteBehindQueue:
+    """Test batching, flush triggers and counters of the queue itself."""
+
+    def test_batch_commits_in_one_transaction(self):
+        async def scenario(db_path):
+            async with aiosqlite.connect(db_path) as conn:
+                await conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+                await conn.commit()
+                flushed = []
+                queue = WriteBehindQueue(
+                    conn, batch_size=1000, interval=0, on_flushed=flushed.extend
+                )
+                for i in range(10):
+                    queue.execute("INSERT INTO t (id) VALUES (?)", (i,), key=i)
+
+                before = await count_rows(db_path, "t")
+                await queue.flush()
+                after = await count_rows(db_path, "t")
+                return before, after, queue.get_stats(), flushed
+
+        with TemporaryDirectory() as tmpdir:
+            before, after, stats, flushed = asyncio.run(
+                scenario(Path(tmpdir) / "q.db")
+            )
+
+        assert before == 0
+        assert after == 10
+        assert stats["flushes"] == 1
+        assert stats["statements_flushed"] == 10
+        assert stats["max_depth"] == 10
+        assert stats["depth"] == 0
+        assert flushed == list(range(10))
+
+    def test_batch_size_triggers_flush(self):
+        async def scenario(db_path):
+            async with aiosqlite.connect(db_path) as conn:
+                await conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+                await conn.commit()
+                queue = WriteBehindQueue(conn, batch_size=5, interval=0)
+                for i in range(5):
+                    queue.execute("INSERT INTO t (id) VALUES (?)", (i,))
+                await asyncio.sleep(0.05)
+                committed = await count_rows(db_path, "t")
+                await queue.close()
+                return committed
+
+        with TemporaryDirectory() as tmpdir:
+            assert asyncio.run(scenario(Path(tmpdir) / "q.db")) == 5
+
+    def test_failed_statement_does_not_drop_batch(self):
+        async def scenario(db_path):
+            async with aiosqlite.connect(db_path) as conn:
+                await conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+                await conn.commit()
+                flushed, failed = [], []
+                queue = WriteBehindQueue(
+                    conn, batch_size=100, interval=0,
+                    on_flushed=flushed.extend, on_failed=failed.extend,
+                )
+                queue.execute("INSERT INTO t (id) VALUES (?)", (1,), key="good")
+                queue.execute("INSERT INTO missing (id) VALUES (?)", (2,), key="bad")
+                queue.execute("INSERT INTO t (id) VALUES (?)", (3,), key="also-good")
+                await queue.flush()
+                return await count_rows(db_path, "t"), queue.get_stats(), flushed, failed
+
+        with TemporaryDirectory() as tmpdir:
+            rows, stats, flushed, failed = asyncio.run(scenario(Path(tmpdir) / "q.db"))
+
+        assert rows == 2
+        assert stats["errors"] == 1
+        assert stats["dropped"] == 1
+        assert flushed == ["good", "also-good"]
+        assert failed == ["bad"]
+
+    def test_schedules_one_background_flush(self):
+        async def scenario(db_path):
+            async with aiosqlite.connect(db_path) as conn:
+                await conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+                await conn.commit()
+                queue = WriteBehindQueue(conn, batch_size=100, interval=0)
+                tasks_before = len(asyncio.all_tasks())
+                for i in range(300):
+                    queue.execute("INSERT INTO t (id) VALUES (?)", (i,))
+                spawned = len(asyncio.all_tasks()) - tasks_before
+                await queue.close()
+                return spawned, await count_rows(db_path, "t")
+
+        with TemporaryDirectory() as tmpdir:
+            spawned, rows = asyncio.run(scenario(Path(tmpdir) / "q.db"))
+
+        assert spawned == 1
+        assert rows == 300
+
+
+class TestCacheDatabaseWriteBehind:
+    """Test read-your-writes and durability through CacheDatabase."""
+
+    def test_reads_see_queued_writes(self):
+        async def scenario(db_path):
+            db = CacheDatabase(db_path)
+            await db.initialize()
+            data = load_fixture("ability.json")
+            await db.save_cached_json("ability", 9, data, name="static", validated=True)
+            await db.set_meta("warmup_checkpoint", "[1, 2]")
+
+            by_id = await db.get_cached_entry("ability", 9, ttl=60)
+            by_name = await db.get_cached_entry_by_name("ability", "static", ttl=60)
+            meta = await db.get_meta("warmup_checkpoint")
+            depth = db.get_write_stats()["depth"]
+            committed = await count_rows(db_path, "ability")
+            await db.close()
+            return by_id, by_name, meta, depth, committed
+
+        with TemporaryDirectory() as tmpdir:
+            by_id, by_name, meta, depth, committed = asyncio.run(
+                scenario(Path(tmpdir) / "cache.db")
+            )
+
+        assert by_id is not None and by_id.validated
+        assert by_name is not None and by_name.data["name"] == "static"
+        assert meta == "[1, 2]"
+        assert depth == 2
+        assert committed == 0
+
+    def test_close_flushes_pending_writes(self):
+        with TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "cache.db"
+
+            async def write():
+                db = CacheDatabase(db_path)
+                await db.initialize()
+                await db.save_cached_json("ability", 9, load_fixture("ability.json"), name="static")
+                await db.upsert_index_metadata({25: ["electric"]}, {25: "generation-i"})
+                await db.close()
+
+            async def read():
+                db = CacheDatabase(db_path)
+                await db.initialize()
+                entry = await db.get_cached_entry("ability", 9, ttl=60)
+                index = await db.get_pokemon_index()
+                await db.close()
+                return entry, index
+
+            asyncio.run(write())
+            entry, index = asyncio.run(read())
+
+        assert entry is not None
+        assert index[0]["types"] == "electric"
+
+    def test_failed_rows_leave_read_mirror(self):
+        async def scenario(db_path):
+            db = CacheDatabase(db_path)
+            await db.initialize()
+            await db.save_cached_json("ability", 1, load_fixture("ability.json"), name="static")
+            await db._db.execute("DROP TABLE ability")
+            await db._db.commit()
+            await db.flush()
+            pending = dict(db._pending_rows)
+            stats = db.get_write_stats()
+            await db.close()
+            return pending, stats
+
+        with TemporaryDirectory() as tmpdir:
+            pending, stats = asyncio.run(scenario(Path(tmpdir) / "cache.db"))
+
+        assert pending == {}
+        assert stats["dropped"] == 1
+
+    def test_flushed_rows_leave_read_mirror(self):
+        async def scenario(db_path):
+            db = CacheDatabase(db_path)
+            await db.initialize()
+            await db.save_cached_json("ability", 9, load_fixture("ability.json"), name="static")
+            await db.flush()
+            pending = dict(db._pending_rows)
+            entry = await db.get_cached_entry("ability", 9, ttl=60)
+            await db.close()
+            return pending, entry
+
+        with TemporaryDirectory() as tmpdir:
+            pending, entry = asyncio.run(scenario(Path(tmpdir) / "cache.db"))
+
+        assert pending == {}
+        assert entry is not None